@@ -7,12 +7,331 @@ Analyzes ASUS BIOS/UEFI file structure and detects magic bytes.
 
 import os
 import re
+import math
+import mmap
 import binascii
 import struct
-from collections import defaultdict
+import functools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 
+# Known magic-byte patterns as (bytes, description).
+MAGIC_PATTERNS = (
+    (b'MZ', 'PE/DOS Executable'),
+    (b'PE\x00\x00', 'PE Header'),
+    (b'\x7fELF', 'ELF Binary'),
+    (b'PK\x03\x04', 'ZIP Archive'),
+    (b'\x1f\x8b', 'GZIP'),
+    (b'BM', 'Bitmap Image'),
+    (b'\xff\xd8\xff', 'JPEG Image'),
+    (b'\x89PNG', 'PNG Image'),
+    (b'GIF8', 'GIF Image'),
+    (b'RIFF', 'RIFF Container'),
+    (b'\x00\x00\x01\x00', 'ICO File'),
+    (b'_FVH', 'UEFI Firmware Volume'),
+    (b'\x16\x00\x00\x00', 'Possible UEFI Volume'),
+    (b'$FV$', 'UEFI Firmware Volume Signature'),
+    (b'\x78\x56\x34\x12', 'Little Endian Magic'),
+    (b'\x12\x34\x56\x78', 'Big Endian Magic'),
+)
+
+_MAGIC_KEYS = tuple(magic for magic, _ in MAGIC_PATTERNS)
+
+# Selected search patterns as (bytes, description).
+PATTERNS = (
+    (b'\x00' * 16, '16바이트 NULL 패턴'),
+    (b'\xff' * 16, '16바이트 0xFF 패턴'),
+    (b'UEFI', 'UEFI 문자열'),
+    (b'BIOS', 'BIOS 문자열'),
+    (b'Award', 'Award BIOS'),
+    (b'AMI', 'AMI BIOS'),
+    (b'Phoenix', 'Phoenix BIOS'),
+    (b'ASUS', 'ASUS 관련'),
+    (b'Intel', 'Intel 관련'),
+    (b'AMD', 'AMD 관련'),
+    (b'\x89PNG', 'PNG 이미지'),
+    (b'\xff\xd8\xff', 'JPEG 이미지'),
+    (b'BM', 'BMP 이미지'),
+    (b'GIF8', 'GIF 이미지'),
+    (b'RIFF', 'RIFF 파일'),
+    (b'IEND', 'PNG 종료 마커'),
+)
+
+
+# First non-NULL byte, used to find where a NULL run ends.
+_NON_NULL_RE = re.compile(b'[^\x00]')
+
+
+def _null_sequences(data, limit=10):
+    """Return up to limit (offset, length) NULL runs of at least four bytes."""
+    sequences = []
+    last_start = len(data) - 4
+    # find() skips non-matching data word-at-a-time in C, far faster than a regex scan.
+    start = data.find(b'\x00\x00\x00\x00')
+    while start != -1 and start < last_start and len(sequences) < limit:
+        match = _NON_NULL_RE.search(data, start + 4)
+        end = match.start() if match else len(data)
+        sequences.append((start, end - start))
+        start = data.find(b'\x00\x00\x00\x00', end)
+    return sequences
+
+
+# Printable ASCII (0x20-0x7E) used to spot text in 16-byte aligned blocks.
+_PRINTABLE_RE = re.compile(b'[\x20-\x7e]')
+_NON_PRINTABLE_BYTES = bytes(b for b in range(256) if not 32 <= b <= 126)
+
+
+# PNG, JPEG, and BMP signatures; their first bytes differ, so at most one matches per offset.
+# "BM" is common in code, so the BMP branch also requires a little-endian size field whose
+# top byte is at most 0x03 (any size up to the 50MB limit); this drops most false hits in C.
+_IMAGE_SIGNATURE_RE = re.compile(
+    b'(?P<png>\x89PNG\r\n\x1a\n)|(?P<jpeg>\xff\xd8\xff)|(?P<bmp>BM(?=[\x00-\xff]{3}[\x00-\x03]))'
+)
+
+
+def _iter_image_signatures(data):
+    """Yield (offset, 'png'|'jpeg'|'bmp') for every image signature, including overlapping hits."""
+    match = _IMAGE_SIGNATURE_RE.search(data)
+    while match:
+        yield match.start(), match.lastgroup
+        match = _IMAGE_SIGNATURE_RE.search(data, match.start() + 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _pattern_run_regex(pattern):
+    """Compile (once per process) a regex matching back-to-back repeats of a literal pattern."""
+    return re.compile(b'(?:' + re.escape(pattern) + b')+')
+
+
+def _most_common_bytes(data, sample_size=10000, limit=5):
+    """Return the sample length and the most frequent (byte, count) pairs of the leading sample."""
+    sample = data[:sample_size]
+    # Counter keeps first-seen order, so ties rank the same as a stable sort by count.
+    return len(sample), Counter(sample).most_common(limit)
+
+
+def _block_entropy(block):
+    """Return the Shannon entropy of a byte block in bits per byte."""
+    length = len(block)
+    entropy = 0
+    # Counter tallies the bytes in C instead of a per-byte Python loop.
+    for count in Counter(block).values():
+        p = count / length
+        entropy -= p * math.log2(p)
+    return entropy
+
+
+def _entropy_blocks(data, block_size):
+    """Yield (offset, entropy) for each block, skipping blocks shorter than half the block size."""
+    # Every full block shares the same length, so its -p*log2(p) terms can be precomputed.
+    terms = [0.0] + [(count / block_size) * math.log2(count / block_size) for count in range(1, block_size + 1)]
+    
+    for offset in range(0, len(data), block_size):
+        block = data[offset:offset + block_size]
+        length = len(block)
+        if length < block_size // 2:  # 너무 작은 블록은 건너뛰기
+            continue
+        
+        # Padding blocks (all 0x00/0xFF) are common in firmware and have zero entropy.
+        if block.count(block[0]) == length:
+            yield offset, 0.0
+            continue
+        
+        if length != block_size:
+            yield offset, _block_entropy(block)
+            continue
+        
+        entropy = 0
+        for count in Counter(block).values():
+            entropy -= terms[count]
+        yield offset, entropy
+
+
+# Markdown table rows whose cells vary per entry; backticks are part of the template.
+_MD_PATTERN_ROW = "| %s | %s | `%s` |\n"
+_MD_EMBEDDED_ROW = "| %d | %s | `%s - %s` | %s bytes (%s KB) | %s |\n"
+
+
+def _txt_pattern_row(pattern, info):
+    """Render one TXT pattern-analysis entry."""
+    row = "  %s: %s개 발견\n    위치: %s\n" % (pattern, info['count'], ', '.join(info['positions']))
+    if info['count'] > 5:
+        row += "    (총 %s개, 처음 5개만 표시)\n" % info['count']
+    return row
+
+
+def _md_pattern_row(pattern, info):
+    """Render one Markdown pattern-analysis table row."""
+    positions = ', '.join(info['positions'])
+    if info['count'] > 5:
+        positions += f" (총 {info['count']}개)"
+    return _MD_PATTERN_ROW % (pattern, info['count'], positions)
+
+
+def _txt_image_details(file_info):
+    """Render the TXT image-information line for PNG/BMP records."""
+    if 'width' not in file_info:
+        return ""
+    return f"     이미지 정보: {file_info['width']}x{file_info['height']}, {file_info['bit_depth']}bit\n"
+
+
+def _txt_jpeg_details(file_info):
+    """Render the TXT image-information lines for JPEG records."""
+    if 'width' not in file_info:
+        return ""
+    details = f"     이미지 정보: {file_info['width']}x{file_info['height']}, {file_info['bit_depth']}bit, {file_info.get('components', 'N/A')}컴포넌트\n"
+    if 'jfif_version' in file_info:
+        details += f"     JFIF v{file_info['jfif_version']}, 밀도: {file_info.get('density', 'N/A')} DPI\n"
+    return details
+
+
+def _md_image_details(file_info):
+    """Render the Markdown details cell for PNG/BMP records."""
+    if 'width' not in file_info:
+        return ""
+    return f"{file_info['width']}×{file_info['height']}, {file_info['bit_depth']}bit"
+
+
+def _md_jpeg_details(file_info):
+    """Render the Markdown details cell for JPEG records."""
+    if 'width' not in file_info:
+        return ""
+    details = f"{file_info['width']}×{file_info['height']}, {file_info['bit_depth']}bit, {file_info.get('components', 'N/A')}컴포넌트"
+    if 'jfif_version' in file_info and 'density' in file_info:
+        details += f", JFIF v{file_info['jfif_version']}"
+    return details
+
+
+# Embedded-file detail formatters by record type; other types use the image formatter.
+_TXT_EMBED_FORMATTERS = {
+    'PNG Image': _txt_image_details,
+    'BMP Image': _txt_image_details,
+    'JPEG Image': _txt_jpeg_details,
+}
+
+_MD_EMBED_FORMATTERS = {
+    'PNG Image': _md_image_details,
+    'BMP Image': _md_image_details,
+    'JPEG Image': _md_jpeg_details,
+}
+
+
+def _txt_embedded_row(index, file_info):
+    """Render one TXT embedded-file entry."""
+    return (f"  {index}. {file_info['type']}\n"
+            f"     위치: {file_info['start']} - {file_info['end']}\n"
+            f"     크기: {file_info['size_bytes']:,} bytes ({file_info['size_kb']} KB)\n"
+            + _TXT_EMBED_FORMATTERS.get(file_info['type'], _txt_image_details)(file_info))
+
+
+def _md_embedded_row(index, file_info):
+    """Render one Markdown embedded-file table row."""
+    details = _MD_EMBED_FORMATTERS.get(file_info['type'], _md_image_details)(file_info)
+    return _MD_EMBEDDED_ROW % (index, file_info['type'], file_info['start'], file_info['end'],
+                               format(file_info['size_bytes'], ','), file_info['size_kb'], details)
+
+
+def _pattern_frequency_rows(pattern_frequency):
+    """Return the pattern_frequency rows of patterns that were found, shared by both reports."""
+    return [(description, info['count'], info['density_per_kb'], info['percentage_of_file'])
+            for description, info in pattern_frequency.items() if info['count'] > 0]
+
+
+def _byte_statistics_rows(byte_statistics):
+    """Pre-format byte_statistics as (byte, count, percentage) string tuples shared by both reports."""
+    return [(byte_val, str(stats['count']), str(stats['percentage']))
+            for byte_val, stats in byte_statistics.items()]
+
+
+def _txt_footer(analysis_data):
+    """Render the closing banner of the TXT report."""
+    return "\n" + "="*80 + "\n" + "분석 완료\n" + "="*80 + "\n"
+
+
+def _md_footer(analysis_data):
+    """Render the summary section that closes the Markdown report."""
+    parts = ["## 📝 분석 요약\n\n"]
+    if analysis_data['is_uefi_section']:
+        parts.append("- **파일 유형**: UEFI 펌웨어 섹션 추출 파일\n")
+        parts.append("- **예상 내용**: UEFI 모듈, 드라이버, 또는 설정 데이터\n")
+    if analysis_data['embedded_files']:
+        parts.append(f"- **임베디드 이미지**: {len(analysis_data['embedded_files'])}개 발견\n")
+    if analysis_data['patterns']:
+        parts.append(f"- **발견된 패턴**: {len(analysis_data['patterns'])}가지\n")
+    parts.append(f"- **분석 완료 시점**: {analysis_data['timestamp']}\n\n")
+    parts.append("---\n\n")
+    parts.append("*이 보고서는 바이너리 파일 분석 도구에 의해 자동 생성되었습니다.*\n")
+    return ''.join(parts)
+
+
+def _write_report(output_file, text):
+    """Encode a finished report once and write it as raw bytes, keeping text-mode line endings."""
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    with open(output_file, 'wb') as f:
+        f.write(text.encode('utf-8'))
+
+
+_MD_NOTE = "> 📝 **Note**: 임베디드 파일을 구성하는 바이너리 내에도 매직 패턴 또는 패턴들이 포함될 수 있어, 정확하지 않을 수 있습니다.\n\n"
+
+# Report layouts consumed by AsusFileAnalyzer._render_report. Table sections are
+# (heading, row, trailer); rows are %-templates or callables for irregular entries.
+_TXT_FORMAT = {
+    'header': ("="*80 + "\n" + "바이너리 파일 분석 보고서\n" + "="*80 + "\n\n"
+               "분석 일시: %(timestamp)s\n"
+               "파일명: %(filename)s\n"
+               "파일 경로: %(filepath)s\n"
+               "파일 크기: %(size_bytes)s bytes (%(size_mb)s MB)\n\n"),
+    'magic_bytes': ("매직 바이트 분석\n" + "-" * 40 + "\n", "  %s: %s\n", "\n"),
+    'magic_pattern_frequency': ("매직 패턴 빈도 분석\n" + "-" * 40 + "\n", "  %s (%s): %s개 (%s/MB)\n", "\n"),
+    'patterns': ("패턴 분석\n" + "-" * 40 + "\n", _txt_pattern_row, "\n"),
+    'pattern_frequency': ("패턴 빈도 통계\n" + "-" * 40 + "\n"
+                          "패턴                  | 개수      | 밀도(/KB) | 비율(%)\n" + "-" * 60 + "\n",
+                          "%-20s | %8s | %8s | %6s\n", "\n"),
+    'embedded_files': ("임베디드 파일 분석\n" + "-" * 40 + "\n", _txt_embedded_row, "\n"),
+    'entropy': ("엔트로피 분석\n" + "-" * 40 + "\n",
+                "높은 엔트로피 영역 (압축/암호화 가능성):\n",
+                "낮은 엔트로피 영역 (반복 패턴/빈 공간):\n",
+                "  오프셋 %s: 엔트로피 %s\n", "", "\n"),
+    'null_sequences': ("구조 분석\n" + "-" * 40 + "\n" + "NULL 바이트 시퀀스 (패딩/정렬 가능성):\n",
+                       "  오프셋 %s: %s바이트\n", "\n"),
+    'byte_statistics': ("바이트 통계 (처음 10KB 기준)\n" + "-" * 40 + "\n", "  %s: %s회 (%s%%)\n", ""),
+    'footer': _txt_footer,
+}
+
+_MD_FORMAT = {
+    'header': ("# 바이너리 파일 분석 보고서\n\n"
+               "## 📋 기본 정보\n\n"
+               "- **분석 일시**: %(timestamp)s\n"
+               "- **파일명**: `%(filename)s`\n"
+               "- **파일 경로**: `%(filepath)s`\n"
+               "- **파일 크기**: %(size_bytes)s bytes (%(size_mb)s MB)\n\n"),
+    'magic_bytes': ("## 🔍 매직 바이트 분석\n\n| 바이트 | 설명 |\n|--------|------|\n", "| `%s` | %s |\n", "\n"),
+    'magic_pattern_frequency': ("## 📊 매직 패턴 빈도 분석\n\n" + _MD_NOTE +
+                                "| 패턴 | 설명 | 개수 | 빈도(/MB) |\n|------|------|------|----------|\n",
+                                "| `%s` | %s | %s | %s |\n", "\n"),
+    'patterns': ("## 🔎 패턴 분석\n\n" + _MD_NOTE + "| 패턴 | 개수 | 위치 |\n|------|------|------|\n",
+                 _md_pattern_row, "\n"),
+    'pattern_frequency': ("## 📈 패턴 빈도 통계\n\n" + _MD_NOTE +
+                          "| 패턴 | 개수 | 밀도(/KB) | 파일 비율(%) |\n|------|------|-----------|-------------|\n",
+                          "| %s | %s | %s | %s |\n", "\n"),
+    'embedded_files': ("## 🖼️ 임베디드 파일 분석\n\n총 **{count}개**의 임베디드 파일이 발견되었습니다.\n\n"
+                       "| # | 타입 | 위치 | 크기 | 세부정보 |\n|---|------|------|------|----------|\n",
+                       _md_embedded_row, "\n"),
+    'entropy': ("## 📊 엔트로피 분석\n\n",
+                "### 🔴 높은 엔트로피 영역 (압축/암호화 가능성)\n\n| 오프셋 | 엔트로피 |\n|--------|----------|\n",
+                "### 🟢 낮은 엔트로피 영역 (반복 패턴/빈 공간)\n\n| 오프셋 | 엔트로피 |\n|--------|----------|\n",
+                "| `%s` | %s |\n", "\n", ""),
+    'null_sequences': ("## 🏗️ 구조 분석\n\n### NULL 바이트 시퀀스 (패딩/정렬 가능성)\n\n| 오프셋 | 길이 |\n|--------|------|\n",
+                       "| `%s` | %s bytes |\n", "\n"),
+    'byte_statistics': ("## 📈 바이트 통계 (처음 10KB 기준)\n\n| 바이트 값 | 개수 | 비율 |\n|-----------|------|------|\n",
+                        "| `%s` | %s | %s%% |\n", "\n"),
+    'footer': _md_footer,
+}
+
+
 class AsusFileAnalyzer:
     """Analyze ASUS BIOS/UEFI binaries and collect structure, pattern, and embedded-file data."""
 
@@ -20,59 +339,104 @@ class AsusFileAnalyzer:
         """Initialize the analyzer with the target ASUS binary path."""
         self.file_path = file_path
         self.file_size = os.path.getsize(file_path)
+        # Path pieces used by the summary and report writers; fixed for the instance.
+        self._file_name = os.path.basename(file_path)
+        report_base = os.path.splitext(file_path)[0]
+        self._txt_report_path = f"{report_base}_analysis.txt"
+        self._md_report_path = os.path.join(os.path.dirname(file_path),
+                                            f"{os.path.splitext(self._file_name)[0]}_analysis.md")
         self.data = None
+        self._file_handle = None
+        self._pattern_cache = {}
+        self._entropy_cache = {}
+        self._analysis_results = {}
+        self._analysis_data = None
+        self._pattern_freq_rows = None
+        self._byte_stats_rows = None
         
     def load_file(self):
-        """Load the file into memory."""
-        with open(self.file_path, 'rb') as f:
-            self.data = f.read()
+        """Memory-map the file read-only instead of copying it into memory."""
+        self.close()
+        self._file_handle = open(self.file_path, 'rb')
+        if self.file_size > 0:
+            self.data = mmap.mmap(self._file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            # Every analysis is a front-to-back scan; let the OS read ahead and drop pages behind it.
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self.data.madvise(mmap.MADV_SEQUENTIAL)
+        else:
+            # An empty file cannot be memory-mapped.
+            self.data = b''
+        self._pattern_cache = {}
+        self._entropy_cache = {}
+        self._analysis_results = {}
+        self._analysis_data = None
+        self._pattern_freq_rows = None
+        self._byte_stats_rows = None
         print(f"파일 로드 완료: {self.file_path}")
         print(f"파일 크기: {self.file_size:,} bytes ({self.file_size / 1024 / 1024:.2f} MB)")
         
-    def analyze_magic_bytes(self):
-        """Analyze magic-byte patterns."""
-        print("\n=== 매직 바이트 분석 ===")
+    def close(self):
+        """Release the memory map and file handle opened by load_file."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = None
+        if self._file_handle is not None:
+            self._file_handle.close()
+            self._file_handle = None
         
-        # Known magic-byte patterns.
-        magic_patterns = {
-            b'MZ': 'PE/DOS Executable',
-            b'PE\x00\x00': 'PE Header',
-            b'\x7fELF': 'ELF Binary',
-            b'PK\x03\x04': 'ZIP Archive',
-            b'\x1f\x8b': 'GZIP',
-            b'BM': 'Bitmap Image',
-            b'\xff\xd8\xff': 'JPEG Image',
-            b'\x89PNG': 'PNG Image',
-            b'GIF8': 'GIF Image',
-            b'RIFF': 'RIFF Container',
-            b'\x00\x00\x01\x00': 'ICO File',
-            b'_FVH': 'UEFI Firmware Volume',
-            b'\x16\x00\x00\x00': 'Possible UEFI Volume',
-            b'$FV$': 'UEFI Firmware Volume Signature',
-            b'\x78\x56\x34\x12': 'Little Endian Magic',
-            b'\x12\x34\x56\x78': 'Big Endian Magic',
-        }
+    def _scan_pattern(self, pattern):
+        """Return the count and first five positions of a pattern, scanning the data once per pattern."""
+        cached = self._pattern_cache.get(pattern)
+        if cached is not None:
+            return cached
+        
+        # mmap has no count(); a "(?:pattern)+" regex walks the same non-overlapping
+        # matches in C and collapses back-to-back repeats (e.g. NULL padding) into one hit.
+        pattern_length = len(pattern)
+        count = 0
+        for match in _pattern_run_regex(pattern).finditer(self.data):
+            count += (match.end() - match.start()) // pattern_length
+        
+        positions = []
+        pos = self.data.find(pattern) if count else -1
+        while pos != -1 and len(positions) < 5:
+            positions.append(pos)
+            pos = self.data.find(pattern, pos + 1)
+        
+        cached = (count, positions)
+        self._pattern_cache[pattern] = cached
+        return cached
+    
+    def _block_entropies(self, block_size=1024):
+        """Return (offset, entropy) for every block, computed once per block size."""
+        cached = self._entropy_cache.get(block_size)
+        if cached is None:
+            cached = list(_entropy_blocks(self.data, block_size))
+            self._entropy_cache[block_size] = cached
+        return cached
+    
+    def analyze_magic_bytes(self, verbose=True):
+        """Analyze magic-byte patterns and return the header matches and pattern frequencies."""
+        results = self._analysis_results.get('magic_bytes')
+        if results is None:
+            results = self._collect_magic_bytes()
+            self._analysis_results['magic_bytes'] = results
+        if not verbose:
+            return results
+        
+        print("\n=== 매직 바이트 분석 ===")
         
         # Check magic bytes at the start of the file.
-        found_magic = []
-        for length in [2, 3, 4, 8, 16]:
-            if len(self.data) >= length:
-                header = self.data[:length]
-                for magic, description in magic_patterns.items():
-                    if header.startswith(magic):
-                        print(f"매직 바이트 발견: {binascii.hexlify(magic).decode()} - {description}")
-                        found_magic.append((magic, description))
+        for magic, description in results['found']:
+            print(f"매직 바이트 발견: {binascii.hexlify(magic).decode()} - {description}")
         
         # Analyze magic-byte pattern frequency.
         print(f"\n=== 매직 패턴 빈도 분석 ===")
         magic_frequency = []
         
-        for magic_bytes, description in magic_patterns.items():
-            count = self.data.count(magic_bytes)
-            if count > 0:
-                frequency_per_mb = round(count / (self.file_size / 1024 / 1024), 2) if self.file_size > 0 else 0
-                print(f"{binascii.hexlify(magic_bytes).decode()} ({description}): {count}개 ({frequency_per_mb}/MB)")
-                magic_frequency.append((description, count, frequency_per_mb))
+        for magic_bytes, description, count, frequency_per_mb in results['frequency']:
+            print(f"{binascii.hexlify(magic_bytes).decode()} ({description}): {count}개 ({frequency_per_mb}/MB)")
+            magic_frequency.append((description, count, frequency_per_mb))
         
         if magic_frequency:
             print(f"\n매직 패턴 빈도 요약:")
@@ -91,141 +455,88 @@ class AsusFileAnalyzer:
             formatted_hex = ' '.join(hex_line[j:j+2] for j in range(0, len(hex_line), 2))
             ascii_data = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in self.data[offset:offset+16])
             print(f"{offset:08x}: {formatted_hex:<47} |{ascii_data}|")
+        
+        return results
     
-    def find_patterns(self):
-        """Find repeated patterns in the file."""
-        print("\n=== 패턴 분석 ===")
+    def _collect_magic_bytes(self):
+        """Scan header magic bytes and per-pattern frequencies."""
+        # Check magic bytes at the start of the file. mmap has no startswith(),
+        # so test one 16-byte header slice against all magics in a single C call first.
+        found_magic = []
+        header = self.data[:16]
+        if header.startswith(_MAGIC_KEYS):
+            found_magic = [(magic, description) for magic, description in MAGIC_PATTERNS if header.startswith(magic)]
         
-        # Search for selected patterns.
-        patterns = {
-            b'\x00' * 16: '16바이트 NULL 패턴',
-            b'\xff' * 16: '16바이트 0xFF 패턴',
-            b'UEFI': 'UEFI 문자열',
-            b'BIOS': 'BIOS 문자열',
-            b'Award': 'Award BIOS',
-            b'AMI': 'AMI BIOS',
-            b'Phoenix': 'Phoenix BIOS',
-            b'ASUS': 'ASUS 관련',
-            b'Intel': 'Intel 관련',
-            b'AMD': 'AMD 관련',
-            b'\x89PNG': 'PNG 이미지',
-            b'\xff\xd8\xff': 'JPEG 이미지',
-            b'BM': 'BMP 이미지',
-            b'GIF8': 'GIF 이미지',
-            b'RIFF': 'RIFF 파일',
-            b'IEND': 'PNG 종료 마커',
-        }
+        # Magic-byte pattern frequency.
+        magic_frequency = []
+        size_mb = self.file_size / 1024 / 1024
         
-        # Pattern frequency statistics.
-        pattern_stats = []
+        for magic_bytes, description in MAGIC_PATTERNS:
+            count, _ = self._scan_pattern(magic_bytes)
+            if count > 0:  # 발견된 패턴이 있으면 파일 크기는 0보다 큼
+                frequency_per_mb = round(count / size_mb, 2)
+                magic_frequency.append((magic_bytes, description, count, frequency_per_mb))
+        
+        return {'found': found_magic, 'frequency': magic_frequency}
+    
+    def find_patterns(self, verbose=True):
+        """Find repeated patterns in the file and return per-pattern statistics."""
+        pattern_stats = self._analysis_results.get('patterns')
+        if pattern_stats is None:
+            pattern_stats = self._collect_patterns()
+            self._analysis_results['patterns'] = pattern_stats
+        if not verbose:
+            return pattern_stats
         
-        for pattern, description in patterns.items():
-            count = self.data.count(pattern)
+        print("\n=== 패턴 분석 ===")
+        
+        found_stats = []
+        for pattern, description, count, found_positions, density_per_kb, percentage_of_file in pattern_stats:
             if count > 0:
-                positions = []
-                start = 0
-                for _ in range(min(count, 5)):  # 최대 5개 위치만 표시
-                    pos = self.data.find(pattern, start)
-                    if pos != -1:
-                        positions.append(f"0x{pos:08x}")
-                        start = pos + 1
-                    else:
-                        break
-                
-                density_per_kb = round(count / (self.file_size / 1024), 3) if self.file_size > 0 else 0
-                percentage_of_file = round((count * len(pattern) / self.file_size) * 100, 4) if self.file_size > 0 else 0
+                positions = [f"0x{pos:08x}" for pos in found_positions]  # 최대 5개 위치만 표시
                 
                 print(f"{description}: {count}개 발견 (밀도: {density_per_kb}/KB, 비율: {percentage_of_file}%)")
                 print(f"  위치: {', '.join(positions)}")
                 if count > 5:
                     print(f"  (총 {count}개, 처음 5개만 표시)")
                 
-                pattern_stats.append((description, count, density_per_kb, percentage_of_file))
+                found_stats.append((description, count, density_per_kb, percentage_of_file))
         
         # Frequency summary.
-        if pattern_stats:
+        if found_stats:
             print(f"\n=== 패턴 빈도 요약 (상위 5개) ===")
-            pattern_stats.sort(key=lambda x: x[1], reverse=True)  # 개수로 정렬
+            found_stats.sort(key=lambda x: x[1], reverse=True)  # 개수로 정렬
             print(f"{'패턴':<20} {'개수':>8} {'밀도(/KB)':>10} {'비율(%)':>8}")
             print("-" * 50)
-            for desc, count, density, percentage in pattern_stats[:5]:
+            for desc, count, density, percentage in found_stats[:5]:
                 print(f"{desc:<20} {count:>8} {density:>10} {percentage:>8}")
+        
+        return pattern_stats
     
-    def analyze_embedded_files(self):
-        """Analyze embedded files."""
-        print("\n=== 임베디드 파일 분석 ===")
+    def _collect_patterns(self):
+        """Return (pattern, description, count, positions, density/KB, file %) for every search pattern."""
+        # Pattern frequency statistics.
+        pattern_stats = []
+        size_kb = self.file_size / 1024
         
-        embedded_files = []
+        for pattern, description in PATTERNS:
+            count, positions = self._scan_pattern(pattern)
+            density_per_kb = round(count / size_kb, 3) if size_kb else 0
+            percentage_of_file = round((count * len(pattern) / self.file_size) * 100, 4) if size_kb else 0
+            pattern_stats.append((pattern, description, count, positions, density_per_kb, percentage_of_file))
         
-        # Find PNG files.
-        png_start = 0
-        while True:
-            png_pos = self.data.find(b'\x89PNG\r\n\x1a\n', png_start)
-            if png_pos == -1:
-                break
-            
-            # Find PNG end marker using the IEND chunk.
-            iend_pos = self.data.find(b'IEND\xaeB`\x82', png_pos)
-            if iend_pos != -1:
-                png_size = iend_pos + 8 - png_pos
-                embedded_files.append({
-                    'type': 'PNG Image',
-                    'start': png_pos,
-                    'size': png_size,
-                    'end': png_pos + png_size
-                })
-            png_start = png_pos + 1
-        
-        # Find JPEG files.
-        jpeg_start = 0
-        while True:
-            jpeg_pos = self.data.find(b'\xff\xd8\xff', jpeg_start)
-            if jpeg_pos == -1:
-                break
-            
-            # Find JPEG end marker FFD9.
-            search_pos = jpeg_pos + 3
-            jpeg_end = -1
-            while search_pos < len(self.data) - 1:
-                if self.data[search_pos:search_pos+2] == b'\xff\xd9':
-                    jpeg_end = search_pos + 2
-                    break
-                search_pos += 1
-            
-            if jpeg_end != -1:
-                jpeg_size = jpeg_end - jpeg_pos
-                embedded_files.append({
-                    'type': 'JPEG Image',
-                    'start': jpeg_pos,
-                    'size': jpeg_size,
-                    'end': jpeg_end
-                })
-            jpeg_start = jpeg_pos + 1
-        
-        # Find BMP files.
-        bmp_start = 0
-        while True:
-            bmp_pos = self.data.find(b'BM', bmp_start)
-            if bmp_pos == -1:
-                break
-            
-            # Read file size from the BMP header.
-            if bmp_pos + 6 <= len(self.data):
-                try:
-                    bmp_size_bytes = self.data[bmp_pos + 2:bmp_pos + 6]
-                    bmp_size = struct.unpack('<I', bmp_size_bytes)[0]
-                    
-                    # Check a reasonable size range.
-                    if 100 <= bmp_size <= 50 * 1024 * 1024 and bmp_pos + bmp_size <= len(self.data):
-                        embedded_files.append({
-                            'type': 'BMP Image',
-                            'start': bmp_pos,
-                            'size': bmp_size,
-                            'end': bmp_pos + bmp_size
-                        })
-                except:
-                    pass
-            bmp_start = bmp_pos + 1
+        return pattern_stats
+    
+    def analyze_embedded_files(self, verbose=True):
+        """Analyze embedded files and return them in file order."""
+        embedded_files = self._analysis_results.get('embedded_files')
+        if embedded_files is None:
+            embedded_files = self._collect_embedded_files()
+            self._analysis_results['embedded_files'] = embedded_files
+        if not verbose:
+            return embedded_files
+        
+        print("\n=== 임베디드 파일 분석 ===")
         
         # Print discovered embedded files.
         if embedded_files:
@@ -243,6 +554,100 @@ class AsusFileAnalyzer:
                     self.analyze_bmp_details(file_info['start'])
         else:
             print("임베디드 파일이 발견되지 않았습니다.")
+        
+        return embedded_files
+    
+    def _collect_embedded_files(self):
+        """Find embedded PNG, JPEG, and BMP files together with their header fields."""
+        embedded_files = []
+        
+        # Scan PNG, JPEG, and BMP signatures in one pass, in file order.
+        for pos, image_type in _iter_image_signatures(self.data):
+            if image_type == 'png':
+                # Find PNG end marker using the IEND chunk.
+                iend_pos = self.data.find(b'IEND\xaeB`\x82', pos)
+                if iend_pos != -1:
+                    png_size = iend_pos + 8 - pos
+                    file_info = {'type': 'PNG Image', 'start': pos, 'size': png_size, 'end': pos + png_size}
+                    self._add_png_header_fields(file_info)
+                    embedded_files.append(file_info)
+            
+            elif image_type == 'jpeg':
+                # Find JPEG end marker FFD9.
+                eoi_pos = self.data.find(b'\xff\xd9', pos + 3)
+                if eoi_pos != -1:
+                    jpeg_end = eoi_pos + 2
+                    file_info = {'type': 'JPEG Image', 'start': pos, 'size': jpeg_end - pos, 'end': jpeg_end}
+                    self._add_jpeg_header_fields(file_info)
+                    embedded_files.append(file_info)
+            
+            # Read file size from the BMP header.
+            elif pos + 6 <= len(self.data):
+                bmp_size = struct.unpack_from('<I', self.data, pos + 2)[0]
+                
+                # Check a reasonable size range.
+                if 100 <= bmp_size <= 50 * 1024 * 1024 and pos + bmp_size <= len(self.data):
+                    file_info = {'type': 'BMP Image', 'start': pos, 'size': bmp_size, 'end': pos + bmp_size}
+                    self._add_bmp_header_fields(file_info)
+                    embedded_files.append(file_info)
+        
+        return embedded_files
+    
+    def _add_png_header_fields(self, file_info):
+        """Add PNG header fields to an embedded-file record."""
+        png_pos = file_info['start']
+        try:
+            ihdr_pos = self.data.find(b'IHDR', png_pos)
+            # IHDR data is the 13 bytes after the IHDR marker.
+            if ihdr_pos != -1 and ihdr_pos + 17 <= len(self.data):
+                width, height, bit_depth, color_type = struct.unpack_from('>IIBBB', self.data, ihdr_pos + 4)
+                file_info['width'] = width
+                file_info['height'] = height
+                file_info['bit_depth'] = bit_depth
+                file_info['color_type'] = color_type
+        except:
+            pass
+    
+    def _add_bmp_header_fields(self, file_info):
+        """Add BMP header fields to an embedded-file record."""
+        bmp_pos = file_info['start']
+        try:
+            if bmp_pos + 54 <= len(self.data):
+                dib_header_size = struct.unpack_from('<I', self.data, bmp_pos + 14)[0]
+                if dib_header_size >= 40:
+                    width, height, _, bit_count = struct.unpack_from('<iiHH', self.data, bmp_pos + 18)
+                    file_info['width'] = abs(width)
+                    file_info['height'] = abs(height)
+                    file_info['bit_depth'] = bit_count
+        except:
+            pass
+    
+    def _add_jpeg_header_fields(self, file_info):
+        """Add JPEG header fields to an embedded-file record."""
+        jpeg_pos = file_info['start']
+        try:
+            # Check the JFIF header.
+            if jpeg_pos + 20 <= len(self.data):
+                jfif_pos = self.data.find(b'JFIF', jpeg_pos, jpeg_pos + 20)
+                if jfif_pos != -1 and jfif_pos + 14 <= len(self.data):
+                    version_major, version_minor, units, x_density, y_density = struct.unpack_from('>BBBHH', self.data, jfif_pos + 5)
+                    file_info['jfif_version'] = f"{version_major}.{version_minor}"
+                    file_info['density'] = f"{x_density}x{y_density}"
+            
+            # Extract image dimensions from SOF markers.
+            sof_markers = [b'\xff\xc0', b'\xff\xc1', b'\xff\xc2']  # SOF0, SOF1, SOF2
+            for sof_marker in sof_markers:
+                sof_pos = self.data.find(sof_marker, jpeg_pos)
+                if sof_pos != -1 and sof_pos + 9 <= len(self.data):
+                    precision, height, width = struct.unpack_from('>BHH', self.data, sof_pos + 4)
+                    components = self.data[sof_pos + 9]
+                    file_info['width'] = width
+                    file_info['height'] = height
+                    file_info['bit_depth'] = precision
+                    file_info['components'] = components
+                    break
+        except:
+            pass
     
     def analyze_png_details(self, png_start):
         """Analyze PNG details."""
@@ -251,9 +656,8 @@ class AsusFileAnalyzer:
             ihdr_pos = self.data.find(b'IHDR', png_start)
             if ihdr_pos != -1:
                 # IHDR data is the 13 bytes after the IHDR marker.
-                ihdr_data = self.data[ihdr_pos + 4:ihdr_pos + 17]
-                if len(ihdr_data) >= 13:
-                    width, height, bit_depth, color_type = struct.unpack('>IIBBB', ihdr_data[:9])
+                if ihdr_pos + 17 <= len(self.data):
+                    width, height, bit_depth, color_type = struct.unpack_from('>IIBBB', self.data, ihdr_pos + 4)
                     print(f"       PNG 정보: {width}x{height}, {bit_depth}bit, 컬러타입={color_type}")
             
             # Find text chunks.
@@ -262,9 +666,8 @@ class AsusFileAnalyzer:
                 chunk_pos = self.data.find(chunk_type, png_start)
                 if chunk_pos != -1:
                     # Read chunk length from the 4 bytes before the chunk type.
-                    length_data = self.data[chunk_pos-4:chunk_pos]
-                    if len(length_data) == 4:
-                        chunk_length = struct.unpack('>I', length_data)[0]
+                    if chunk_pos >= 4:
+                        chunk_length = struct.unpack_from('>I', self.data, chunk_pos - 4)[0]
                         if chunk_length < 1000:  # 합리적인 크기 제한
                             text_data = self.data[chunk_pos+4:chunk_pos+4+chunk_length]
                             # Extract printable characters only.
@@ -280,18 +683,14 @@ class AsusFileAnalyzer:
             # Analyze BMP header; at least 54 bytes are required.
             if bmp_start + 54 <= len(self.data):
                 # BMP file header, 14 bytes.
-                file_size = struct.unpack('<I', self.data[bmp_start + 2:bmp_start + 6])[0]
-                data_offset = struct.unpack('<I', self.data[bmp_start + 10:bmp_start + 14])[0]
+                file_size = struct.unpack_from('<I', self.data, bmp_start + 2)[0]
+                data_offset = struct.unpack_from('<I', self.data, bmp_start + 10)[0]
                 
                 # DIB header, at least 40 bytes.
-                dib_header_size = struct.unpack('<I', self.data[bmp_start + 14:bmp_start + 18])[0]
+                dib_header_size = struct.unpack_from('<I', self.data, bmp_start + 14)[0]
                 
                 if dib_header_size >= 40:  # BITMAPINFOHEADER 또는 더 큰 헤더
-                    width = struct.unpack('<i', self.data[bmp_start + 18:bmp_start + 22])[0]
-                    height = struct.unpack('<i', self.data[bmp_start + 22:bmp_start + 26])[0]
-                    planes = struct.unpack('<H', self.data[bmp_start + 26:bmp_start + 28])[0]
-                    bit_count = struct.unpack('<H', self.data[bmp_start + 28:bmp_start + 30])[0]
-                    compression = struct.unpack('<I', self.data[bmp_start + 30:bmp_start + 34])[0]
+                    width, height, planes, bit_count, compression = struct.unpack_from('<iiHHI', self.data, bmp_start + 18)
                     
                     # Decode compression type.
                     compression_types = {
@@ -308,38 +707,24 @@ class AsusFileAnalyzer:
         except:
             pass
     
-    def analyze_entropy(self, block_size=1024):
+    def analyze_entropy(self, block_size=1024, verbose=True):
         """Use entropy analysis to detect compressed or encrypted regions."""
-        print(f"\n=== 엔트로피 분석 (블록 크기: {block_size}바이트) ===")
-        
-        import math
-        
         high_entropy_blocks = []
         low_entropy_blocks = []
         
-        for i in range(0, len(self.data), block_size):
-            block = self.data[i:i+block_size]
-            if len(block) < block_size // 2:  # 너무 작은 블록은 건너뛰기
-                continue
-                
-            # Count byte frequencies.
-            byte_counts = defaultdict(int)
-            for byte in block:
-                byte_counts[byte] += 1
-            
-            # Calculate entropy.
-            entropy = 0
-            for count in byte_counts.values():
-                p = count / len(block)
-                if p > 0:
-                    entropy -= p * math.log2(p)
-            
+        for i, entropy in self._block_entropies(block_size):
             # Record high-entropy and low-entropy blocks.
             if entropy > 7.5:
                 high_entropy_blocks.append((i, entropy))
             elif entropy < 2.0:
                 low_entropy_blocks.append((i, entropy))
         
+        results = {'high_entropy': high_entropy_blocks, 'low_entropy': low_entropy_blocks}
+        if not verbose:
+            return results
+        
+        print(f"\n=== 엔트로피 분석 (블록 크기: {block_size}바이트) ===")
+        
         if high_entropy_blocks:
             print("높은 엔트로피 영역 (압축/암호화 가능성):")
             for offset, entropy in high_entropy_blocks[:10]:  # 최대 10개만 표시
@@ -349,54 +734,78 @@ class AsusFileAnalyzer:
             print("낮은 엔트로피 영역 (반복 패턴/빈 공간):")
             for offset, entropy in low_entropy_blocks[:10]:  # 최대 10개만 표시
                 print(f"  오프셋 0x{offset:08x}: 엔트로피 {entropy:.2f}")
+        
+        return results
     
-    def analyze_structure(self):
-        """Analyze file structure."""
-        print("\n=== 구조 분석 ===")
+    def analyze_structure(self, verbose=True):
+        """Analyze file structure and return NULL runs and aligned text blocks."""
+        results = self._analysis_results.get('structure')
+        if results is None:
+            results = self._collect_structure()
+            self._analysis_results['structure'] = results
+        if not verbose:
+            return results
         
-        # Check 32-bit and 64-bit alignment.
-        null_sequences = []
-        i = 0
-        while i < len(self.data) - 4:
-            if self.data[i:i+4] == b'\x00\x00\x00\x00':
-                start = i
-                while i < len(self.data) and self.data[i] == 0:
-                    i += 1
-                null_sequences.append((start, i - start))
-            else:
-                i += 1
+        print("\n=== 구조 분석 ===")
         
+        null_sequences = results['null_sequences']
         if null_sequences:
             print("NULL 바이트 시퀀스 (패딩/정렬 가능성):")
-            for start, length in null_sequences[:10]:  # 최대 10개만 표시
+            for start, length in null_sequences:
                 print(f"  오프셋 0x{start:08x}: {length}바이트")
         
-        # Check 16-byte alignment, which is common in UEFI.
-        aligned_positions = []
-        for i in range(0, len(self.data), 16):
-            if i + 16 <= len(self.data):
-                block = self.data[i:i+16]
-                # Look for blocks that resemble structured headers.
-                if not all(b == 0 for b in block) and not all(b == 0xff for b in block):
-                    # Check whether printable characters are present.
-                    printable_count = sum(1 for b in block if 32 <= b <= 126)
-                    if printable_count >= 4:  # 최소 4개의 인쇄 가능한 문자
-                        aligned_positions.append(i)
-        
+        aligned_positions = results['aligned_blocks']
         if aligned_positions:
             print("16바이트 정렬된 텍스트/구조 블록:")
-            for pos in aligned_positions[:10]:  # 최대 10개만 표시
+            for pos in aligned_positions:  # 최대 10개만 표시
                 block = self.data[pos:pos+16]
                 text = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in block)
                 print(f"  오프셋 0x{pos:08x}: {text}")
+        
+        return results
     
-    def generate_summary(self):
-        """Summarize analysis results."""
+    def _collect_structure(self):
+        """Find NULL byte runs and 16-byte aligned blocks that contain text."""
+        # Check 32-bit and 64-bit alignment.
+        null_sequences = _null_sequences(self.data)  # 최대 10개만 표시
+        
+        # Check 16-byte alignment, which is common in UEFI; only the first 10 blocks are reported.
+        aligned_positions = []
+        i = 0
+        while len(aligned_positions) < 10:
+            # Blocks without any printable byte cannot qualify, so jump to the next one that has one.
+            match = _PRINTABLE_RE.search(self.data, i)
+            if not match:
+                break
+            i = match.start() & ~0xF
+            if i + 16 > len(self.data):
+                break
+            
+            # Printable characters imply the block is neither all 0x00 nor all 0xFF padding.
+            block = self.data[i:i+16]
+            printable_count = len(block.translate(None, _NON_PRINTABLE_BYTES))
+            if printable_count >= 4:  # 최소 4개의 인쇄 가능한 문자
+                aligned_positions.append(i)
+            i += 16
+        
+        return {'null_sequences': null_sequences, 'aligned_blocks': aligned_positions}
+    
+    def generate_summary(self, verbose=True):
+        """Summarize analysis results and return the leading byte distribution."""
+        results = self._analysis_results.get('summary')
+        if results is None:
+            # Byte distribution statistics.
+            sample_length, most_common = _most_common_bytes(self.data)  # 처음 10KB만 분석
+            results = {'sample_length': sample_length, 'most_common': most_common}
+            self._analysis_results['summary'] = results
+        if not verbose:
+            return results
+        
         print("\n" + "="*60)
         print("=== 파일 분석 요약 ===")
         print("="*60)
         
-        print(f"파일명: {os.path.basename(self.file_path)}")
+        print(f"파일명: {self._file_name}")
         print(f"크기: {self.file_size:,} bytes ({self.file_size / 1024 / 1024:.2f} MB)")
         
         # Guess file type from extension.
@@ -404,30 +813,28 @@ class AsusFileAnalyzer:
             print("파일 유형: UEFI 펌웨어 섹션 추출 파일")
             print("예상 내용: UEFI 모듈, 드라이버, 또는 설정 데이터")
         
-        # Byte distribution statistics.
-        byte_counts = defaultdict(int)
-        for byte in self.data[:min(10000, len(self.data))]:  # 처음 10KB만 분석
-            byte_counts[byte] += 1
-        
-        most_common = sorted(byte_counts.items(), key=lambda x: x[1], reverse=True)
         print(f"\n가장 많이 나타나는 바이트값 (처음 10KB 기준):")
-        for byte_val, count in most_common[:5]:
-            percentage = (count / min(10000, len(self.data))) * 100
+        for byte_val, count in results['most_common']:
+            percentage = (count / results['sample_length']) * 100
             print(f"  0x{byte_val:02x} ({byte_val}): {count}회 ({percentage:.1f}%)")
+        
+        return results
     
     def collect_analysis_data(self):
-        """Collect analysis data into a dictionary."""
-        from datetime import datetime
-        import math
+        """Collect analysis data into a dictionary once per load, reusing results already computed by the analyze_* methods."""
+        if self._analysis_data is not None:
+            return self._analysis_data
         
         analysis_data = {
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'file_info': {
-                'filename': os.path.basename(self.file_path),
+                'filename': self._file_name,
                 'filepath': self.file_path,
                 'size_bytes': self.file_size,
                 'size_mb': round(self.file_size / 1024 / 1024, 2)
             },
+            # Extracted UEFI section files are named *Section_Raw*.bin.
+            'is_uefi_section': 'Section_Raw' in self.file_path and '.bin' in self.file_path,
             'magic_bytes': [],
             'magic_pattern_frequency': {},
             'patterns': {},
@@ -445,411 +852,184 @@ class AsusFileAnalyzer:
         }
         
         # Magic-byte analysis.
-        magic_patterns = {
-            b'MZ': 'PE/DOS Executable',
-            b'PE\x00\x00': 'PE Header',
-            b'\x7fELF': 'ELF Binary',
-            b'PK\x03\x04': 'ZIP Archive',
-            b'\x1f\x8b': 'GZIP',
-            b'BM': 'Bitmap Image',
-            b'\xff\xd8\xff': 'JPEG Image',
-            b'\x89PNG': 'PNG Image',
-            b'GIF8': 'GIF Image',
-            b'RIFF': 'RIFF Container',
-            b'_FVH': 'UEFI Firmware Volume',
-            b'$FV$': 'UEFI Firmware Volume Signature'
-        }
-        
-        # Collect magic-byte pattern frequencies.
-        for magic_bytes, description in magic_patterns.items():
-            count = self.data.count(magic_bytes)
-            if count > 0:
-                analysis_data['magic_pattern_frequency'][binascii.hexlify(magic_bytes).decode()] = {
-                    'description': description,
-                    'count': count,
-                    'frequency_per_mb': round(count / (self.file_size / 1024 / 1024), 2) if self.file_size > 0 else 0
-                }
+        magic_results = self.analyze_magic_bytes(verbose=False)
+        for magic_bytes, description, count, frequency_per_mb in magic_results['frequency']:
+            analysis_data['magic_pattern_frequency'][binascii.hexlify(magic_bytes).decode()] = {
+                'description': description,
+                'count': count,
+                'frequency_per_mb': frequency_per_mb
+            }
         
-        for length in [2, 3, 4, 8, 16]:
-            if len(self.data) >= length:
-                header = self.data[:length]
-                for magic, description in magic_patterns.items():
-                    if header.startswith(magic):
-                        analysis_data['magic_bytes'].append({
-                            'bytes': binascii.hexlify(magic).decode(),
-                            'description': description
-                        })
+        for magic, description in magic_results['found']:
+            analysis_data['magic_bytes'].append({
+                'bytes': binascii.hexlify(magic).decode(),
+                'description': description
+            })
         
         # Pattern analysis.
-        patterns = {
-            b'UEFI': 'UEFI 문자열',
-            b'BIOS': 'BIOS 문자열',
-            b'Award': 'Award BIOS',
-            b'AMI': 'AMI BIOS',
-            b'Phoenix': 'Phoenix BIOS',
-            b'ASUS': 'ASUS 관련',
-            b'Intel': 'Intel 관련',
-            b'AMD': 'AMD 관련',
-            b'\x89PNG': 'PNG 이미지',
-            b'\xff\xd8\xff': 'JPEG 이미지',
-            b'BM': 'BMP 이미지',
-            b'\x00' * 16: '16바이트 NULL 패턴',
-            b'\xff' * 16: '16바이트 0xFF 패턴',
-            b'GIF8': 'GIF 이미지',
-            b'RIFF': 'RIFF 파일',
-            b'IEND': 'PNG 종료 마커'
-        }
-        
-        # Collect pattern frequency statistics.
-        for pattern, description in patterns.items():
-            count = self.data.count(pattern)
+        for pattern, description, count, positions, density_per_kb, percentage_of_file in self.find_patterns(verbose=False):
             analysis_data['pattern_frequency'][description] = {
                 'pattern_hex': binascii.hexlify(pattern).decode() if len(pattern) <= 16 else binascii.hexlify(pattern[:16]).decode() + '...',
                 'count': count,
-                'density_per_kb': round(count / (self.file_size / 1024), 3) if self.file_size > 0 else 0,
-                'percentage_of_file': round((count * len(pattern) / self.file_size) * 100, 4) if self.file_size > 0 else 0
+                'density_per_kb': density_per_kb,
+                'percentage_of_file': percentage_of_file
             }
-        
-        for pattern, description in patterns.items():
-            count = self.data.count(pattern)
             if count > 0:
-                positions = []
-                start = 0
-                for _ in range(min(count, 5)):
-                    pos = self.data.find(pattern, start)
-                    if pos != -1:
-                        positions.append(f"0x{pos:08x}")
-                        start = pos + 1
-                    else:
-                        break
                 analysis_data['patterns'][description] = {
                     'count': count,
-                    'positions': positions
+                    'positions': [f"0x{pos:08x}" for pos in positions]
                 }
         
-        # Collect embedded files across all file types and sort them by position.
-        embedded_files = []
+        # Embedded files, already in file order.
+        for file_info in self.analyze_embedded_files(verbose=False):
+            record = {
+                'type': file_info['type'],
+                'start': f"0x{file_info['start']:08x}",
+                'end': f"0x{file_info['end']:08x}",
+                'size_bytes': file_info['size'],
+                'size_kb': round(file_info['size'] / 1024, 1)
+            }
+            record.update((key, value) for key, value in file_info.items() if key not in ('type', 'start', 'end', 'size'))
+            analysis_data['embedded_files'].append(record)
         
-        # Find PNG files.
-        png_start = 0
-        while True:
-            png_pos = self.data.find(b'\x89PNG\r\n\x1a\n', png_start)
-            if png_pos == -1:
-                break
-            
-            iend_pos = self.data.find(b'IEND\xaeB`\x82', png_pos)
-            if iend_pos != -1:
-                png_size = iend_pos + 8 - png_pos
-                
-                # Extract PNG detail fields.
-                png_info = {
-                    'type': 'PNG Image',
-                    'start_pos': png_pos,  # 정렬용 숫자 위치
-                    'start': f"0x{png_pos:08x}",
-                    'end': f"0x{png_pos + png_size:08x}",
-                    'size_bytes': png_size,
-                    'size_kb': round(png_size / 1024, 1)
-                }
-                
-                # Extract PNG header fields.
-                try:
-                    ihdr_pos = self.data.find(b'IHDR', png_pos)
-                    if ihdr_pos != -1:
-                        ihdr_data = self.data[ihdr_pos + 4:ihdr_pos + 17]
-                        if len(ihdr_data) >= 13:
-                            width, height, bit_depth, color_type = struct.unpack('>IIBBB', ihdr_data[:9])
-                            png_info['width'] = width
-                            png_info['height'] = height
-                            png_info['bit_depth'] = bit_depth
-                            png_info['color_type'] = color_type
-                except:
-                    pass
-                
-                embedded_files.append(png_info)
-            png_start = png_pos + 1
-        
-        # BMP Analyze the file.
-        bmp_start = 0
-        while True:
-            bmp_pos = self.data.find(b'BM', bmp_start)
-            if bmp_pos == -1:
-                break
-            
-            if bmp_pos + 6 <= len(self.data):
-                try:
-                    bmp_size_bytes = self.data[bmp_pos + 2:bmp_pos + 6]
-                    bmp_size = struct.unpack('<I', bmp_size_bytes)[0]
-                    
-                    if 100 <= bmp_size <= 50 * 1024 * 1024 and bmp_pos + bmp_size <= len(self.data):
-                        # Extract BMP detail fields.
-                        bmp_info = {
-                            'type': 'BMP Image',
-                            'start_pos': bmp_pos,  # 정렬용 숫자 위치
-                            'start': f"0x{bmp_pos:08x}",
-                            'end': f"0x{bmp_pos + bmp_size:08x}",
-                            'size_bytes': bmp_size,
-                            'size_kb': round(bmp_size / 1024, 1)
-                        }
-                        
-                        # Extract BMP header fields.
-                        try:
-                            if bmp_pos + 54 <= len(self.data):
-                                dib_header_size = struct.unpack('<I', self.data[bmp_pos + 14:bmp_pos + 18])[0]
-                                if dib_header_size >= 40:
-                                    width = struct.unpack('<i', self.data[bmp_pos + 18:bmp_pos + 22])[0]
-                                    height = struct.unpack('<i', self.data[bmp_pos + 22:bmp_pos + 26])[0]
-                                    bit_count = struct.unpack('<H', self.data[bmp_pos + 28:bmp_pos + 30])[0]
-                                    bmp_info['width'] = abs(width)
-                                    bmp_info['height'] = abs(height)
-                                    bmp_info['bit_depth'] = bit_count
-                        except:
-                            pass
-                        
-                        embedded_files.append(bmp_info)
-                except:
-                    pass
-            bmp_start = bmp_pos + 1
-        
-        # JPEG Analyze the file.
-        jpeg_start = 0
-        while True:
-            jpeg_pos = self.data.find(b'\xff\xd8\xff', jpeg_start)
-            if jpeg_pos == -1:
-                break
-            
-            # Find JPEG end marker FFD9.
-            search_pos = jpeg_pos + 3
-            jpeg_end = -1
-            while search_pos < len(self.data) - 1:
-                if self.data[search_pos:search_pos+2] == b'\xff\xd9':
-                    jpeg_end = search_pos + 2
-                    break
-                search_pos += 1
-            
-            if jpeg_end != -1:
-                jpeg_size = jpeg_end - jpeg_pos
-                
-                # Extract JPEG detail fields.
-                jpeg_info = {
-                    'type': 'JPEG Image',
-                    'start_pos': jpeg_pos,  # 정렬용 숫자 위치
-                    'start': f"0x{jpeg_pos:08x}",
-                    'end': f"0x{jpeg_end:08x}",
-                    'size_bytes': jpeg_size,
-                    'size_kb': round(jpeg_size / 1024, 1)
-                }
-                
-                # Extract JPEG header fields.
-                try:
-                    # Check the JFIF header.
-                    if jpeg_pos + 20 <= len(self.data):
-                        if b'JFIF' in self.data[jpeg_pos:jpeg_pos+20]:
-                            jfif_pos = self.data.find(b'JFIF', jpeg_pos)
-                            if jfif_pos != -1 and jfif_pos + 14 <= len(self.data):
-                                version_major = self.data[jfif_pos + 5]
-                                version_minor = self.data[jfif_pos + 6]
-                                units = self.data[jfif_pos + 7]
-                                x_density = struct.unpack('>H', self.data[jfif_pos + 8:jfif_pos + 10])[0]
-                                y_density = struct.unpack('>H', self.data[jfif_pos + 10:jfif_pos + 12])[0]
-                                jpeg_info['jfif_version'] = f"{version_major}.{version_minor}"
-                                jpeg_info['density'] = f"{x_density}x{y_density}"
-                    
-                    # Extract image dimensions from SOF markers.
-                    sof_markers = [b'\xff\xc0', b'\xff\xc1', b'\xff\xc2']  # SOF0, SOF1, SOF2
-                    for sof_marker in sof_markers:
-                        sof_pos = self.data.find(sof_marker, jpeg_pos)
-                        if sof_pos != -1 and sof_pos + 9 <= len(self.data):
-                            precision = self.data[sof_pos + 4]
-                            height = struct.unpack('>H', self.data[sof_pos + 5:sof_pos + 7])[0]
-                            width = struct.unpack('>H', self.data[sof_pos + 7:sof_pos + 9])[0]
-                            components = self.data[sof_pos + 9]
-                            jpeg_info['width'] = width
-                            jpeg_info['height'] = height
-                            jpeg_info['bit_depth'] = precision
-                            jpeg_info['components'] = components
-                            break
-                except:
-                    pass
-                
-                embedded_files.append(jpeg_info)
-            jpeg_start = jpeg_pos + 1
+        # Entropy analysis; reports list only the first 10 regions of each kind.
+        entropy_results = self.analyze_entropy(verbose=False)
+        for key in ('high_entropy', 'low_entropy'):
+            analysis_data['entropy_analysis'][key] = [
+                {'offset': f"0x{offset:08x}", 'entropy': round(entropy, 2)}
+                for offset, entropy in entropy_results[key][:10]
+            ]
         
-        # Sort embedded files by position.
-        embedded_files.sort(key=lambda x: x['start_pos'])
+        # Structure analysis.
+        structure_results = self.analyze_structure(verbose=False)
+        analysis_data['structure_analysis']['null_sequences'] = [
+            {'offset': f"0x{start:08x}", 'length': length}
+            for start, length in structure_results['null_sequences']
+        ]
+        analysis_data['structure_analysis']['aligned_blocks'] = [
+            {'offset': f"0x{pos:08x}", 'text': ''.join(chr(b) if 32 <= b <= 126 else '.' for b in self.data[pos:pos+16])}
+            for pos in structure_results['aligned_blocks']
+        ]
         
-        # Remove start_pos after sorting.
-        for file_info in embedded_files:
-            del file_info['start_pos']
+        # Byte statistics.
+        summary_results = self.generate_summary(verbose=False)
+        sample_length = summary_results['sample_length']
+        byte_stats_rows = []
+        for byte_val, count in summary_results['most_common']:
+            # Percentages in tenths, rounded half-up with integer arithmetic instead of round().
+            percentage_x10 = (count * 2000 + sample_length) // (2 * sample_length)
+            byte_label = f"0x{byte_val:02x}"
+            analysis_data['byte_statistics'][byte_label] = {
+                'count': count,
+                'percentage': percentage_x10 / 10
+            }
+            byte_stats_rows.append((byte_label, str(count), "%d.%d" % divmod(percentage_x10, 10)))
         
-        analysis_data['embedded_files'] = embedded_files
+        self._analysis_data = analysis_data
+        self._pattern_freq_rows = _pattern_frequency_rows(analysis_data['pattern_frequency'])
+        self._byte_stats_rows = byte_stats_rows
+        return analysis_data
+    
+    def _render_report(self, analysis_data, fmt):
+        """Yield the report text section by section using one of the _TXT_FORMAT/_MD_FORMAT layouts."""
+        file_info = analysis_data['file_info']
+        yield fmt['header'] % {
+            'timestamp': analysis_data['timestamp'],
+            'filename': file_info['filename'],
+            'filepath': file_info['filepath'],
+            'size_bytes': f"{file_info['size_bytes']:,}",
+            'size_mb': file_info['size_mb'],
+        }
         
-        # Entropy analysis.
-        block_size = 1024
-        for i in range(0, len(self.data), block_size):
-            block = self.data[i:i+block_size]
-            if len(block) < block_size // 2:
-                continue
-                
-            byte_counts = defaultdict(int)
-            for byte in block:
-                byte_counts[byte] += 1
-            
-            entropy = 0
-            for count in byte_counts.values():
-                p = count / len(block)
-                if p > 0:
-                    entropy -= p * math.log2(p)
-            
-            if entropy > 7.5:
-                analysis_data['entropy_analysis']['high_entropy'].append({
-                    'offset': f"0x{i:08x}",
-                    'entropy': round(entropy, 2)
-                })
-            elif entropy < 2.0:
-                analysis_data['entropy_analysis']['low_entropy'].append({
-                    'offset': f"0x{i:08x}",
-                    'entropy': round(entropy, 2)
-                })
+        # Magic bytes.
+        if analysis_data['magic_bytes']:
+            heading, row, trailer = fmt['magic_bytes']
+            yield heading
+            for magic in analysis_data['magic_bytes']:
+                yield row % (magic['bytes'], magic['description'])
+            yield trailer
         
-        # Structure analysis: NULL sequences.
-        null_sequences = []
-        i = 0
-        while i < len(self.data) - 4:
-            if self.data[i:i+4] == b'\x00\x00\x00\x00':
-                start = i
-                while i < len(self.data) and self.data[i] == 0:
-                    i += 1
-                null_sequences.append({
-                    'offset': f"0x{start:08x}",
-                    'length': i - start
-                })
+        # Magic pattern frequency.
+        if analysis_data['magic_pattern_frequency']:
+            heading, row, trailer = fmt['magic_pattern_frequency']
+            yield heading
+            for pattern_hex, info in analysis_data['magic_pattern_frequency'].items():
+                yield row % (pattern_hex, info['description'], info['count'], info['frequency_per_mb'])
+            yield trailer
+        
+        # Pattern analysis.
+        if analysis_data['patterns']:
+            heading, render_row, trailer = fmt['patterns']
+            yield heading
+            for pattern, info in analysis_data['patterns'].items():
+                yield render_row(pattern, info)
+            yield trailer
+        
+        # Pattern frequency statistics; only patterns that were found are listed, filtered once per collection.
+        if analysis_data['pattern_frequency']:
+            if analysis_data is self._analysis_data:
+                rows = self._pattern_freq_rows
             else:
-                i += 1
-        analysis_data['structure_analysis']['null_sequences'] = null_sequences[:10]
+                rows = _pattern_frequency_rows(analysis_data['pattern_frequency'])
+            heading, row, trailer = fmt['pattern_frequency']
+            yield heading
+            for pattern_row in rows:
+                yield row % pattern_row
+            yield trailer
+        
+        # Embedded files.
+        if analysis_data['embedded_files']:
+            heading, render_row, trailer = fmt['embedded_files']
+            yield heading.format(count=len(analysis_data['embedded_files']))
+            for i, embedded in enumerate(analysis_data['embedded_files'], 1):
+                yield render_row(i, embedded)
+            yield trailer
+        
+        # Entropy analysis.
+        heading, high_heading, low_heading, row, sub_trailer, trailer = fmt['entropy']
+        yield heading
+        for key, sub_heading in (('high_entropy', high_heading), ('low_entropy', low_heading)):
+            entries = analysis_data['entropy_analysis'][key]
+            if entries:
+                yield sub_heading
+                for entry in entries:
+                    yield row % (entry['offset'], entry['entropy'])
+                yield sub_trailer
+        yield trailer
+        
+        # Structure analysis.
+        if analysis_data['structure_analysis']['null_sequences']:
+            heading, row, trailer = fmt['null_sequences']
+            yield heading
+            for seq in analysis_data['structure_analysis']['null_sequences']:
+                yield row % (seq['offset'], seq['length'])
+            yield trailer
         
         # Byte statistics.
-        byte_counts = defaultdict(int)
-        for byte in self.data[:min(10000, len(self.data))]:
-            byte_counts[byte] += 1
-        
-        most_common = sorted(byte_counts.items(), key=lambda x: x[1], reverse=True)
-        for byte_val, count in most_common[:5]:
-            percentage = (count / min(10000, len(self.data))) * 100
-            analysis_data['byte_statistics'][f"0x{byte_val:02x}"] = {
-                'count': count,
-                'percentage': round(percentage, 1)
-            }
+        if analysis_data['byte_statistics']:
+            # Both reports share the rows pre-formatted for our own collected data.
+            if analysis_data is self._analysis_data:
+                rows = self._byte_stats_rows
+            else:
+                rows = _byte_statistics_rows(analysis_data['byte_statistics'])
+            heading, row, trailer = fmt['byte_statistics']
+            yield heading
+            for byte_row in rows:
+                yield row % byte_row
+            yield trailer
         
-        return analysis_data
+        yield fmt['footer'](analysis_data)
     
-    def save_analysis_results_txt(self, output_file=None):
-        """Save analysis results as a TXT file."""
+    def save_analysis_results_txt(self, output_file=None, analysis_data=None):
+        """Save analysis results as a TXT file, reusing analysis_data when it is provided."""
         if output_file is None:
-            base_name = os.path.splitext(self.file_path)[0]
-            output_file = f"{base_name}_analysis.txt"
+            output_file = self._txt_report_path
         
         try:
-            analysis_data = self.collect_analysis_data()
+            if analysis_data is None:
+                analysis_data = self.collect_analysis_data()
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("="*80 + "\n")
-                f.write("바이너리 파일 분석 보고서\n")
-                f.write("="*80 + "\n\n")
-                
-                # Basic information.
-                f.write(f"분석 일시: {analysis_data['timestamp']}\n")
-                f.write(f"파일명: {analysis_data['file_info']['filename']}\n")
-                f.write(f"파일 경로: {analysis_data['file_info']['filepath']}\n")
-                f.write(f"파일 크기: {analysis_data['file_info']['size_bytes']:,} bytes ({analysis_data['file_info']['size_mb']} MB)\n\n")
-                
-                # Magic bytes.
-                if analysis_data['magic_bytes']:
-                    f.write("매직 바이트 분석\n")
-                    f.write("-" * 40 + "\n")
-                    for magic in analysis_data['magic_bytes']:
-                        f.write(f"  {magic['bytes']}: {magic['description']}\n")
-                    f.write("\n")
-                
-                # Magic pattern frequency.
-                if analysis_data['magic_pattern_frequency']:
-                    f.write("매직 패턴 빈도 분석\n")
-                    f.write("-" * 40 + "\n")
-                    for pattern_hex, info in analysis_data['magic_pattern_frequency'].items():
-                        f.write(f"  {pattern_hex} ({info['description']}): {info['count']}개 ({info['frequency_per_mb']}/MB)\n")
-                    f.write("\n")
-                
-                # Pattern analysis.
-                if analysis_data['patterns']:
-                    f.write("패턴 분석\n")
-                    f.write("-" * 40 + "\n")
-                    for pattern, info in analysis_data['patterns'].items():
-                        f.write(f"  {pattern}: {info['count']}개 발견\n")
-                        f.write(f"    위치: {', '.join(info['positions'])}\n")
-                        if info['count'] > 5:
-                            f.write(f"    (총 {info['count']}개, 처음 5개만 표시)\n")
-                    f.write("\n")
-                
-                # Pattern frequency statistics.
-                if analysis_data['pattern_frequency']:
-                    f.write("패턴 빈도 통계\n")
-                    f.write("-" * 40 + "\n")
-                    f.write("패턴                  | 개수      | 밀도(/KB) | 비율(%)\n")
-                    f.write("-" * 60 + "\n")
-                    for description, info in analysis_data['pattern_frequency'].items():
-                        if info['count'] > 0:  # 발견된 패턴만 표시
-                            f.write(f"{description:<20} | {info['count']:>8} | {info['density_per_kb']:>8} | {info['percentage_of_file']:>6}\n")
-                    f.write("\n")
-                
-                # Embedded files.
-                if analysis_data['embedded_files']:
-                    f.write("임베디드 파일 분석\n")
-                    f.write("-" * 40 + "\n")
-                    for i, file_info in enumerate(analysis_data['embedded_files'], 1):
-                        f.write(f"  {i}. {file_info['type']}\n")
-                        f.write(f"     위치: {file_info['start']} - {file_info['end']}\n")
-                        f.write(f"     크기: {file_info['size_bytes']:,} bytes ({file_info['size_kb']} KB)\n")
-                        if 'width' in file_info:
-                            if file_info['type'] == 'JPEG Image':
-                                f.write(f"     이미지 정보: {file_info['width']}x{file_info['height']}, {file_info['bit_depth']}bit, {file_info.get('components', 'N/A')}컴포넌트\n")
-                                if 'jfif_version' in file_info:
-                                    f.write(f"     JFIF v{file_info['jfif_version']}, 밀도: {file_info.get('density', 'N/A')} DPI\n")
-                            else:
-                                f.write(f"     이미지 정보: {file_info['width']}x{file_info['height']}, {file_info['bit_depth']}bit\n")
-                    f.write("\n")
-                
-                # Entropy analysis.
-                f.write("엔트로피 분석\n")
-                f.write("-" * 40 + "\n")
-                if analysis_data['entropy_analysis']['high_entropy']:
-                    f.write("높은 엔트로피 영역 (압축/암호화 가능성):\n")
-                    for entry in analysis_data['entropy_analysis']['high_entropy'][:10]:
-                        f.write(f"  오프셋 {entry['offset']}: 엔트로피 {entry['entropy']}\n")
-                
-                if analysis_data['entropy_analysis']['low_entropy']:
-                    f.write("낮은 엔트로피 영역 (반복 패턴/빈 공간):\n")
-                    for entry in analysis_data['entropy_analysis']['low_entropy'][:10]:
-                        f.write(f"  오프셋 {entry['offset']}: 엔트로피 {entry['entropy']}\n")
-                f.write("\n")
-                
-                # Structure analysis.
-                if analysis_data['structure_analysis']['null_sequences']:
-                    f.write("구조 분석\n")
-                    f.write("-" * 40 + "\n")
-                    f.write("NULL 바이트 시퀀스 (패딩/정렬 가능성):\n")
-                    for seq in analysis_data['structure_analysis']['null_sequences']:
-                        f.write(f"  오프셋 {seq['offset']}: {seq['length']}바이트\n")
-                    f.write("\n")
-                
-                # Byte statistics.
-                if analysis_data['byte_statistics']:
-                    f.write("바이트 통계 (처음 10KB 기준)\n")
-                    f.write("-" * 40 + "\n")
-                    for byte_val, stats in analysis_data['byte_statistics'].items():
-                        f.write(f"  {byte_val}: {stats['count']}회 ({stats['percentage']}%)\n")
-                
-                f.write("\n" + "="*80 + "\n")
-                f.write("분석 완료\n")
-                f.write("="*80 + "\n")
+            _write_report(output_file, ''.join(self._render_report(analysis_data, _TXT_FORMAT)))
             
             print(f"✓ TXT 분석 보고서 저장 완료: {output_file}")
             return True
@@ -858,148 +1038,17 @@ class AsusFileAnalyzer:
             print(f"✗ TXT 보고서 저장 실패: {e}")
             return False
     
-    def save_analysis_results_md(self, output_file=None):
-        """Save analysis results as Markdown beside the original file."""
+    def save_analysis_results_md(self, output_file=None, analysis_data=None):
+        """Save analysis results as Markdown beside the original file, reusing analysis_data when it is provided."""
         if output_file is None:
-            # Split the original directory and base file name.
-            original_dir = os.path.dirname(self.file_path)
-            original_name = os.path.splitext(os.path.basename(self.file_path))[0]
-            
             # Create the Markdown report beside the original file.
-            output_file = os.path.join(original_dir, f"{original_name}_analysis.md")
+            output_file = self._md_report_path
         
         try:
-            analysis_data = self.collect_analysis_data()
+            if analysis_data is None:
+                analysis_data = self.collect_analysis_data()
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("# 바이너리 파일 분석 보고서\n\n")
-                
-                # Basic information.
-                f.write("## 📋 기본 정보\n\n")
-                f.write(f"- **분석 일시**: {analysis_data['timestamp']}\n")
-                f.write(f"- **파일명**: `{analysis_data['file_info']['filename']}`\n")
-                f.write(f"- **파일 경로**: `{analysis_data['file_info']['filepath']}`\n")
-                f.write(f"- **파일 크기**: {analysis_data['file_info']['size_bytes']:,} bytes ({analysis_data['file_info']['size_mb']} MB)\n\n")
-                
-                # Magic bytes.
-                if analysis_data['magic_bytes']:
-                    f.write("## 🔍 매직 바이트 분석\n\n")
-                    f.write("| 바이트 | 설명 |\n")
-                    f.write("|--------|------|\n")
-                    for magic in analysis_data['magic_bytes']:
-                        f.write(f"| `{magic['bytes']}` | {magic['description']} |\n")
-                    f.write("\n")
-                
-                # Magic pattern frequency.
-                if analysis_data['magic_pattern_frequency']:
-                    f.write("## 📊 매직 패턴 빈도 분석\n\n")
-                    f.write("> 📝 **Note**: 임베디드 파일을 구성하는 바이너리 내에도 매직 패턴 또는 패턴들이 포함될 수 있어, 정확하지 않을 수 있습니다.\n\n")
-                    f.write("| 패턴 | 설명 | 개수 | 빈도(/MB) |\n")
-                    f.write("|------|------|------|----------|\n")
-                    for pattern_hex, info in analysis_data['magic_pattern_frequency'].items():
-                        f.write(f"| `{pattern_hex}` | {info['description']} | {info['count']} | {info['frequency_per_mb']} |\n")
-                    f.write("\n")
-                
-                # Pattern analysis.
-                if analysis_data['patterns']:
-                    f.write("## 🔎 패턴 분석\n\n")
-                    f.write("> 📝 **Note**: 임베디드 파일을 구성하는 바이너리 내에도 매직 패턴 또는 패턴들이 포함될 수 있어, 정확하지 않을 수 있습니다.\n\n")
-                    f.write("| 패턴 | 개수 | 위치 |\n")
-                    f.write("|------|------|------|\n")
-                    for pattern, info in analysis_data['patterns'].items():
-                        positions = ', '.join(info['positions'])
-                        if info['count'] > 5:
-                            positions += f" (총 {info['count']}개)"
-                        f.write(f"| {pattern} | {info['count']} | `{positions}` |\n")
-                    f.write("\n")
-                
-                # Pattern frequency statistics.
-                if analysis_data['pattern_frequency']:
-                    f.write("## 📈 패턴 빈도 통계\n\n")
-                    f.write("> 📝 **Note**: 임베디드 파일을 구성하는 바이너리 내에도 매직 패턴 또는 패턴들이 포함될 수 있어, 정확하지 않을 수 있습니다.\n\n")
-                    f.write("| 패턴 | 개수 | 밀도(/KB) | 파일 비율(%) |\n")
-                    f.write("|------|------|-----------|-------------|\n")
-                    for description, info in analysis_data['pattern_frequency'].items():
-                        if info['count'] > 0:  # 발견된 패턴만 표시
-                            f.write(f"| {description} | {info['count']} | {info['density_per_kb']} | {info['percentage_of_file']} |\n")
-                    f.write("\n")
-                
-                # Embedded files.
-                if analysis_data['embedded_files']:
-                    f.write("## 🖼️ 임베디드 파일 분석\n\n")
-                    f.write(f"총 **{len(analysis_data['embedded_files'])}개**의 임베디드 파일이 발견되었습니다.\n\n")
-                    
-                    f.write("| # | 타입 | 위치 | 크기 | 세부정보 |\n")
-                    f.write("|---|------|------|------|----------|\n")
-                    for i, file_info in enumerate(analysis_data['embedded_files'], 1):
-                        details = ""
-                        if 'width' in file_info:
-                            if file_info['type'] == 'JPEG Image':
-                                if 'jfif_version' in file_info and 'density' in file_info:
-                                    details = f"{file_info['width']}×{file_info['height']}, {file_info['bit_depth']}bit, {file_info['components']}컴포넌트, JFIF v{file_info['jfif_version']}"
-                                else:
-                                    details = f"{file_info['width']}×{file_info['height']}, {file_info['bit_depth']}bit, {file_info.get('components', 'N/A')}컴포넌트"
-                            else:
-                                details = f"{file_info['width']}×{file_info['height']}, {file_info['bit_depth']}bit"
-                        f.write(f"| {i} | {file_info['type']} | `{file_info['start']} - {file_info['end']}` | {file_info['size_bytes']:,} bytes ({file_info['size_kb']} KB) | {details} |\n")
-                    f.write("\n")
-                
-                # Entropy analysis.
-                f.write("## 📊 엔트로피 분석\n\n")
-                
-                if analysis_data['entropy_analysis']['high_entropy']:
-                    f.write("### 🔴 높은 엔트로피 영역 (압축/암호화 가능성)\n\n")
-                    f.write("| 오프셋 | 엔트로피 |\n")
-                    f.write("|--------|----------|\n")
-                    for entry in analysis_data['entropy_analysis']['high_entropy'][:10]:
-                        f.write(f"| `{entry['offset']}` | {entry['entropy']} |\n")
-                    f.write("\n")
-                
-                if analysis_data['entropy_analysis']['low_entropy']:
-                    f.write("### 🟢 낮은 엔트로피 영역 (반복 패턴/빈 공간)\n\n")
-                    f.write("| 오프셋 | 엔트로피 |\n")
-                    f.write("|--------|----------|\n")
-                    for entry in analysis_data['entropy_analysis']['low_entropy'][:10]:
-                        f.write(f"| `{entry['offset']}` | {entry['entropy']} |\n")
-                    f.write("\n")
-                
-                # Structure analysis.
-                if analysis_data['structure_analysis']['null_sequences']:
-                    f.write("## 🏗️ 구조 분석\n\n")
-                    f.write("### NULL 바이트 시퀀스 (패딩/정렬 가능성)\n\n")
-                    f.write("| 오프셋 | 길이 |\n")
-                    f.write("|--------|------|\n")
-                    for seq in analysis_data['structure_analysis']['null_sequences']:
-                        f.write(f"| `{seq['offset']}` | {seq['length']} bytes |\n")
-                    f.write("\n")
-                
-                # Byte statistics.
-                if analysis_data['byte_statistics']:
-                    f.write("## 📈 바이트 통계 (처음 10KB 기준)\n\n")
-                    f.write("| 바이트 값 | 개수 | 비율 |\n")
-                    f.write("|-----------|------|------|\n")
-                    for byte_val, stats in analysis_data['byte_statistics'].items():
-                        f.write(f"| `{byte_val}` | {stats['count']} | {stats['percentage']}% |\n")
-                    f.write("\n")
-                
-                # Summary
-                f.write("## 📝 분석 요약\n\n")
-                
-                if 'Section_Raw' in analysis_data['file_info']['filepath'] and '.bin' in analysis_data['file_info']['filepath']:
-                    f.write("- **파일 유형**: UEFI 펌웨어 섹션 추출 파일\n")
-                    f.write("- **예상 내용**: UEFI 모듈, 드라이버, 또는 설정 데이터\n")
-                
-                if analysis_data['embedded_files']:
-                    total_images = len(analysis_data['embedded_files'])
-                    f.write(f"- **임베디드 이미지**: {total_images}개 발견\n")
-                
-                if analysis_data['patterns']:
-                    f.write(f"- **발견된 패턴**: {len(analysis_data['patterns'])}가지\n")
-                
-                f.write(f"- **분석 완료 시점**: {analysis_data['timestamp']}\n\n")
-                
-                f.write("---\n\n")
-                f.write("*이 보고서는 바이너리 파일 분석 도구에 의해 자동 생성되었습니다.*\n")
+            _write_report(output_file, ''.join(self._render_report(analysis_data, _MD_FORMAT)))
             
             print(f"✓ 마크다운 분석 보고서 저장 완료: {output_file}")
             return True
@@ -1026,11 +1075,15 @@ class AsusFileAnalyzer:
         print("=== 분석 보고서 저장 ===")
         print("="*60)
         
-        # Save TXT report.
-        txt_success = self.save_analysis_results_txt()
+        # Collect report data once and share it between both reports.
+        analysis_data = self.collect_analysis_data()
         
-        # Save Markdown report.
-        md_success = self.save_analysis_results_md()
+        # Save the TXT and Markdown reports concurrently; they share no state besides analysis_data.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            txt_future = executor.submit(self.save_analysis_results_txt, analysis_data=analysis_data)
+            md_future = executor.submit(self.save_analysis_results_md, analysis_data=analysis_data)
+            txt_success = txt_future.result()
+            md_success = md_future.result()
         
         if txt_success and md_success:
             print("📄 모든 분석 보고서가 성공적으로 저장되었습니다!")
@@ -1040,7 +1093,6 @@ class AsusFileAnalyzer:
             print("❌ 분석 보고서 저장에 실패했습니다.")
         
         # Print saved report locations.
-        base_name = os.path.splitext(self.file_path)[0]
         print(f"\n📁 보고서 저장 위치:")
-        print(f"   TXT: {base_name}_analysis.txt")
-        print(f"   MD:  {base_name}_analysis.md")
+        print(f"   TXT: {self._txt_report_path}")
+        print(f"   MD:  {self._md_report_path}")
@@ -7,14 +7,34 @@ Repackages extracted images back into ASUS Packer format.
 
 import os
 import re
-import binascii
+import mmap
+import shutil
 import struct
+import sys
+import tempfile
+import functools
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
 from common.binary_validation import require_valid_vendor_binary
 from uefi_binary_tool.i18n import detect_language
 
 
+# ASUS Packer package signature: fixed 32-byte header that precedes the image metadata blocks.
+_ASUS_SIG = bytes.fromhex("0000000020000000" "FFFF0000FFFF0000" + "00" * 16)
+
+# Leading fields of each 32-byte image metadata block: image size and offset to the image data.
+_META_HDR = struct.Struct('<II')
+
+# 16 bytes that sit right before every image's data inside a package.
+_EXPECTED_HDR = bytes.fromhex("00000000300009040000000000000000")
+
+# Fallback 24-byte special patterns for the first and following images of a package.
+_DEFAULT_PATTERN_FIRST = bytes.fromhex("FFFF0A00FFFF004000000000300009040000000000000000")
+_DEFAULT_PATTERN_REST = bytes.fromhex("00FFFF0A00FFFF0200000000300009040000000000000000")
+
+
 REPACKER_TEXT = {
     "ko": {
         "original_loaded": "원본 파일 로드 완료: {path}",
@@ -32,7 +52,6 @@ REPACKER_TEXT = {
         "original_package_missing": "오류: 원본 파일에서 ASUS 패키지를 찾을 수 없습니다.",
         "step_detect_modified": "2단계: 수정된 이미지 파일 감지...",
         "package_dir_missing": "  경고: 패키지 {pkg_idx} 디렉터리가 없습니다: {path}",
-        "bad_filename_pattern": "  [WARNING] 생성된 파일명 패턴이 올바르지 않음 (image_nr{{숫자}}_off0x{{16진수}}.{{확장자}} 형식이어야 함): {filename}",
         "skip_type_mismatch_file": "  ❌ 형식 불일치로 건너뛰기: {filename}",
         "unchanged_image": "  변경없음: 이미지 #{number} ({size} bytes)",
         "modified_image": "  🔄 수정됨: 이미지 #{number} ({old_size} → {new_size} bytes, {diff:+} bytes)",
@@ -101,7 +120,6 @@ REPACKER_TEXT = {
         "original_package_missing": "Error: no ASUS package found in the original file.",
         "step_detect_modified": "Step 2: Detecting modified image files...",
         "package_dir_missing": "  Warning: package {pkg_idx} directory is missing: {path}",
-        "bad_filename_pattern": "  [WARNING] Generated filename pattern is invalid (expected image_nr{{number}}_off0x{{hex}}.{{ext}}): {filename}",
         "skip_type_mismatch_file": "  ❌ Skipped due to type mismatch: {filename}",
         "unchanged_image": "  Unchanged: image #{number} ({size} bytes)",
         "modified_image": "  🔄 Modified: image #{number} ({old_size} → {new_size} bytes, {diff:+} bytes)",
@@ -204,8 +222,11 @@ class AsusImageRepacker:
     ):
         """Initialize the repacker with the original ASUS binary path."""
         self.file_path = file_path
-        self.file_size = os.path.getsize(file_path)
+        # Filled in by load_file from the mapped size, so the file is only stat'ed once.
+        self.file_size = None
         self.data = None
+        self._file_handle = None
+        self._log_buffer = None
         self.log = log
         self.lang = (lang or detect_language()).lower()
 
@@ -216,42 +237,106 @@ class AsusImageRepacker:
         return template.format(**kwargs) if kwargs else template
 
     def _log(self, message=""):
-        """Send repacker output to the configured UI logger or stdout."""
-        text = str(message)
+        """Send repacker output to the configured UI logger or stdout, deferring it while batching."""
+        text = str(message) + "\n"
+        if self._log_buffer is not None:
+            self._log_buffer.append(text)
+        else:
+            self._emit_log(text)
+    
+    def _emit_log(self, text):
+        """Write already newline-terminated log text to the UI logger or stdout."""
         if self.log:
-            self.log(text + "\n")
+            self.log(text)
         else:
-            print(text)
+            sys.stdout.write(text)
+    
+    @contextmanager
+    def _batched_log(self):
+        """Collect the log lines of a per-image loop and emit them with a single write at the end."""
+        if self._log_buffer is not None:
+            # Already batching in an enclosing loop.
+            yield
+            return
+        self._log_buffer = []
+        try:
+            yield
+        finally:
+            text = "".join(self._log_buffer)
+            self._log_buffer = None
+            if text:
+                self._emit_log(text)
         
     def load_file(self):
-        """Load the file into memory."""
+        """Memory-map the original file read-only instead of copying it into memory."""
         try:
             validation = require_valid_vendor_binary(self.file_path, "asus")
         except ValueError as exc:
             raise ValueError(localize_asus_validation_error(str(exc), self.lang)) from exc
         for detail in validation.details:
             self._log(f"[VALID] {localize_asus_validation_detail(detail, self.lang)}")
-        with open(self.file_path, 'rb') as f:
-            self.data = f.read()
+        self.close()
+        self._file_handle = open(self.file_path, 'rb')
+        self.data = mmap.mmap(self._file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.file_size = len(self.data)
         self._log(self._text("original_loaded", path=self.file_path))
         self._log(self._text("file_size", size=self.file_size, mb=self.file_size / 1024 / 1024))
     
+    def close(self):
+        """Release the memory map and file handle opened by load_file."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = None
+        if self._file_handle is not None:
+            self._file_handle.close()
+            self._file_handle = None
+    
+    @contextmanager
+    def _atomic_output(self, output_file):
+        """Yield a temp path beside output_file and move it into place once the caller finishes.
+
+        The input stays memory-mapped while the output is written, so the output
+        must never be truncated in place: it may be the input file itself.
+        """
+        fd, temp_file = tempfile.mkstemp(
+            prefix=os.path.basename(output_file) + ".",
+            suffix=".tmp",
+            dir=os.path.dirname(os.path.abspath(output_file)),
+        )
+        os.close(fd)
+        try:
+            yield temp_file
+            if os.path.exists(output_file):
+                # mkstemp creates 0600; keep the mode an in-place write would have kept.
+                shutil.copymode(output_file, temp_file)
+                if os.path.samefile(self.file_path, output_file):
+                    # Windows cannot replace a file that is still mapped.
+                    self.close()
+            else:
+                # Match the mode open(output_file, 'wb') would have created.
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(temp_file, 0o666 & ~umask)
+            os.replace(temp_file, output_file)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+    
     def detect_asus_packer_format(self):
         """Detect ASUS Packer format."""
         self._log(self._text("detect_title"))
         
-        # ASUS Packer signature pattern.
-        asus_pattern = re.compile(br'\x00\x00\x00\x00\x20\x00\x00\x00\xFF\xFF\x00\x00\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
-        
         asus_packages = []
         position = 0
         
         while True:
-            match = asus_pattern.search(self.data, position)
-            if match is None:
+            # The signature is a plain literal, so a substring search is enough.
+            start_match = self.data.find(_ASUS_SIG, position)
+            if start_match < 0:
                 break
             
-            start_match, end_match = match.span()
+            end_match = start_match + len(_ASUS_SIG)
             self._log(self._text("package_found", offset=start_match))
             
             # Parse image metadata after the header.
@@ -259,67 +344,57 @@ class AsusImageRepacker:
             images = []
             image_nr = 0
             
-            while True:
-                if head + 8 > len(self.data):
-                    break
-                    
-                # Read image size and offset in little-endian format.
-                isize_bytes = self.data[head:head + 4]
-                ioffs_bytes = self.data[head + 4:head + 8]
-                
-                if len(isize_bytes) < 4 or len(ioffs_bytes) < 4:
-                    break
+            with self._batched_log():
+                while True:
+                    if head + 8 > len(self.data):
+                        break
                     
-                isize = struct.unpack('<I', isize_bytes)[0]
-                ioffs = struct.unpack('<I', ioffs_bytes)[0]
+                    # Read image size and offset in little-endian format.
+                    isize, ioffs = _META_HDR.unpack_from(self.data, head)
                 
-                # Validate parsed values.
-                if isize == 0 or ioffs == 0:
-                    break
-                    
-                # Check the special header pattern.
-                check_offset = head + ioffs - 0x10
-                if check_offset >= 0 and check_offset + 16 <= len(self.data):
-                    check_pattern = self.data[check_offset:check_offset + 16]
-                    expected_pattern = bytes.fromhex("00000000300009040000000000000000")
-                    if check_pattern != expected_pattern:
+                    # Validate parsed values.
+                    if isize == 0 or ioffs == 0:
                         break
+                    
+                    # Check the special header pattern.
+                    check_offset = head + ioffs - 0x10
+                    if check_offset >= 0 and check_offset + 16 <= len(self.data):
+                        if self.data[check_offset:check_offset + 16] != _EXPECTED_HDR:
+                            break
                 
-                # Image data location.
-                img_start = head + ioffs
-                img_end = img_start + isize
+                    # Image data location.
+                    img_start = head + ioffs
+                    img_end = img_start + isize
                 
-                if img_end > len(self.data):
-                    break
+                    if img_end > len(self.data):
+                        break
                     
-                # Detect the image type.
-                img_data = self.data[img_start:img_end]
-                img_type = self.detect_asus_image_type(img_data)
+                    # Detect the image type from its leading bytes; image data is sliced on demand later.
+                    img_type = self.detect_asus_image_type(self.data[img_start:min(img_start + 4, img_end)])
                 
-                image_nr += 1
-                # Preserve the original 24-byte special pattern.
-                special_pattern_start = head + 8
-                special_pattern = self.data[special_pattern_start:special_pattern_start + 24]
+                    image_nr += 1
+                    # Preserve the original 24-byte special pattern.
+                    special_pattern_start = head + 8
+                    special_pattern = self.data[special_pattern_start:special_pattern_start + 24]
                 
-                image_info = {
-                    'number': image_nr,
-                    'type': img_type,
-                    'size': isize,
-                    'offset_in_package': ioffs,
-                    'absolute_offset': img_start,
-                    'data': img_data,
-                    'metadata_offset': head,
-                    'special_pattern_offset': special_pattern_start,
-                    'special_pattern': special_pattern
-                }
-                images.append(image_info)
+                    image_info = {
+                        'number': image_nr,
+                        'type': img_type,
+                        'size': isize,
+                        'offset_in_package': ioffs,
+                        'absolute_offset': img_start,
+                        'metadata_offset': head,
+                        'special_pattern_offset': special_pattern_start,
+                        'special_pattern': special_pattern
+                    }
+                    images.append(image_info)
                 
-                self._log(self._text("image_found", number=image_nr, image_type=img_type, size=isize, offset=img_start))
+                    self._log(self._text("image_found", number=image_nr, image_type=img_type, size=isize, offset=img_start))
                 
-                # Move to the next metadata block: 32-byte metadata, image data, and 4-byte alignment.
-                next_metadata_pos = head + 32 + isize  # 32바이트 메타데이터 + 이미지 크기
-                padding = (4 - (isize % 4)) % 4
-                head = next_metadata_pos + padding
+                    # Move to the next metadata block: 32-byte metadata, image data, and 4-byte alignment.
+                    next_metadata_pos = head + 32 + isize  # 32바이트 메타데이터 + 이미지 크기
+                    padding = (4 - (isize % 4)) % 4
+                    head = next_metadata_pos + padding
             
             package_info = {
                 'header_offset': start_match,
@@ -344,18 +419,18 @@ class AsusImageRepacker:
         if len(img_data) < 4:
             return "img"
         
-        # Convert header bytes to hex.
-        header_hex = binascii.hexlify(img_data[:4]).decode('utf-8').upper()
+        # Compare the leading bytes directly against each format signature.
+        header = bytes(img_data[:4])
         
-        if header_hex[:4] == "424D":  # BM
+        if header[:2] == b'BM':
             return "bmp"
-        elif header_hex[:6] == "FFD8FF":  # JPEG
+        elif header[:3] == b'\xff\xd8\xff':  # JPEG
             return "jpg"
-        elif header_hex == "89504E47":  # PNG
+        elif header == b'\x89PNG':
             return "png"
-        elif header_hex == "47494638":  # GIF
+        elif header == b'GIF8':
             return "gif"
-        elif header_hex == "00000100" or header_hex == "00000200":  # ICO
+        elif header in (b'\x00\x00\x01\x00', b'\x00\x00\x02\x00'):  # ICO/CUR
             return "ico"
         else:
             return "img"
@@ -371,6 +446,48 @@ class AsusImageRepacker:
         
         return True
     
+    def _read_modified_image(self, filepath, abs_offset, original_size, chunk_size=1024 * 1024):
+        """Return an extracted image's bytes, or None when it is identical to the original image."""
+        with open(filepath, 'rb') as f, memoryview(self.data) as view:
+            # A different size is always a modification; no need to look at the original bytes.
+            if os.fstat(f.fileno()).st_size != original_size:
+                return f.read()
+            
+            # Compare against zero-copy views of the original instead of sliced copies.
+            position = abs_offset
+            end = abs_offset + original_size
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                if chunk != view[position:position + len(chunk)]:
+                    f.seek(0)
+                    return f.read()
+                position += len(chunk)
+            
+            # The file may have changed under us; anything but an exact full match counts as modified.
+            if position != end:
+                f.seek(0)
+                return f.read()
+        return None
+    
+    def _load_extracted_image(self, image, extracted_files):
+        """Return (filename, path, data) for an image's extracted file; data is None when unchanged."""
+        # 추출 시 생성한 파일명 규칙으로 원본 이미지와 수정 파일을 1:1로 매핑한다.
+        # 번호, 오프셋, detect_asus_image_type의 확장자로만 만들어지므로 형식 검사는 필요 없다.
+        # Map each original image to its edited file using the extraction filename convention.
+        # The name is built from the number, offset, and a detect_asus_image_type extension, so it always fits.
+        filename = f"image_nr{image['number']}_off0x{image['absolute_offset']:08x}.{image['type']}"
+        filepath = extracted_files.get(filename)
+        if filepath is None:
+            return filename, None, None
+        
+        # 바이트 단위로 비교해서 실제 변경분만 modified_images에 보관한다.
+        # 원본과 같은 파일은 전체를 메모리에 올리지 않고 청크 단위로 비교만 한다.
+        # Use a byte-for-byte comparison so only real edits are stored in modified_images.
+        # Files identical to the original are compared chunk by chunk and never held in memory.
+        return filename, filepath, self._read_modified_image(filepath, image['absolute_offset'], image['size'])
+    
     def rebuild_asus_packer_preserve_structure(self, extracted_dir, output_file=None):
         """Repackage ASUS Packer data while preserving structure and replacing modified images only."""
         self._log(self._text("repack_title"))
@@ -401,46 +518,43 @@ class AsusImageRepacker:
         
         for pkg_idx, package in enumerate(original_packages, 1):
             pkg_dir = os.path.join(extracted_dir, f"asus_pack_{pkg_idx}")
-            if not os.path.exists(pkg_dir):
+            # 패키지 폴더를 한 번만 읽어 이미지마다 exists()를 호출하지 않는다.
+            # List the package folder once instead of calling exists() for every image.
+            try:
+                with os.scandir(pkg_dir) as entries:
+                    extracted_files = {entry.name: entry.path for entry in entries if entry.is_file()}
+            except OSError:
                 self._log(self._text("package_dir_missing", pkg_idx=pkg_idx, path=pkg_dir))
                 continue
                 
-            for image in package['images']:
-                abs_offset = image['absolute_offset']
-                original_size = image['size']
-                original_data = image['data']
-                
-                # 추출 시 생성한 파일명 규칙으로 원본 이미지와 수정 파일을 1:1로 매핑한다.
-                # Map each original image to its edited file using the extraction filename convention.
-                filename = f"image_nr{image['number']}_off0x{abs_offset:08x}.{image['type']}"
-                filepath = os.path.join(pkg_dir, filename)
-                
-                # 파일명 규칙이 깨지면 오프셋 매핑을 신뢰할 수 없으므로 해당 이미지는 건너뛴다.
-                # If the filename convention breaks, the offset mapping is not trustworthy, so skip the image.
-                import re
-                pattern = r'^image_nr(\d+)_off0x([0-9A-Fa-f]+)\.[a-zA-Z0-9]+$'
-                if not re.match(pattern, filename):
-                    self._log(self._text("bad_filename_pattern", filename=filename))
-                    unchanged_count += 1
-                    continue
+            # 이미지별 파일 읽기/비교는 서로 독립적이므로 스레드로 겹쳐 수행하고, 결과는 원래 순서대로 처리한다.
+            # Reading and comparing each image file is independent work, so overlap it on threads
+            # and handle the results in the original image order.
+            images = package['images']
+            with ThreadPoolExecutor(max_workers=max(1, min(16, len(images)))) as executor:
+                loaded_images = list(executor.map(
+                    functools.partial(self._load_extracted_image, extracted_files=extracted_files),
+                    images,
+                ))
+            
+            with self._batched_log():
+                for image, (filename, filepath, extracted_data) in zip(images, loaded_images):
+                    abs_offset = image['absolute_offset']
+                    original_size = image['size']
                 
-                if os.path.exists(filepath):
-                    with open(filepath, 'rb') as f:
-                        extracted_data = f.read()
+                    if filepath is not None:
+                        if extracted_data is None:
+                            unchanged_count += 1
+                            self._log(self._text("unchanged_image", number=image['number'], size=original_size))
+                            continue
                     
-                    # BMP/JPG/PNG 같은 컨테이너 형식이 바뀌면 펌웨어 로더가 실패할 수 있다.
-                    # Changing the container type can make the firmware loader reject the image.
-                    if not self._validate_image_replacement(image, extracted_data):
-                        self._log(self._text("skip_type_mismatch_file", filename=filename))
-                        unchanged_count += 1
-                        continue
+                        # BMP/JPG/PNG 같은 컨테이너 형식이 바뀌면 펌웨어 로더가 실패할 수 있다.
+                        # Changing the container type can make the firmware loader reject the image.
+                        if not self._validate_image_replacement(image, extracted_data):
+                            self._log(self._text("skip_type_mismatch_file", filename=filename))
+                            unchanged_count += 1
+                            continue
                     
-                    # 바이트 단위로 비교해서 실제 변경분만 modified_images에 보관한다.
-                    # Use a byte-for-byte comparison so only real edits are stored in modified_images.
-                    if extracted_data == original_data:
-                        unchanged_count += 1
-                        self._log(self._text("unchanged_image", number=image['number'], size=len(extracted_data)))
-                    else:
                         modified_count += 1
                         modified_images[abs_offset] = {
                             'original_image': image,
@@ -456,8 +570,8 @@ class AsusImageRepacker:
                             new_size=len(extracted_data),
                             diff=len(extracted_data) - original_size,
                         ))
-                else:
-                    self._log(self._text("extracted_file_missing", filename=filename))
+                    else:
+                        self._log(self._text("extracted_file_missing", filename=filename))
         
         self._log(self._text("change_summary"))
         self._log(self._text("summary_total", count=unchanged_count + modified_count))
@@ -469,7 +583,6 @@ class AsusImageRepacker:
             output_file = output_file or f"{os.path.splitext(self.file_path)[0]}_asus_preserved.bin"
             
             try:
-                import shutil
                 shutil.copy2(self.file_path, output_file)
                 self._log(self._text("copy_done", path=output_file))
                 return True
@@ -500,8 +613,7 @@ class AsusImageRepacker:
         
         # 크기 변화가 없는 경우 가장 안전한 경로다. 원본 전체를 복사한 뒤 이미지 바이트만 교체한다.
         # This is the safest path when sizes do not change: copy the original and replace only image bytes.
-        new_data = bytearray(self.data)
-        replaced_count = 0
+        replacements = []
         
         # 같은 크기 교체라 실제 오프셋은 변하지 않지만, 뒤에서 앞으로 처리하면 향후 확장에도 안전하다.
         # Offsets do not move for same-size replacement, but reverse order keeps this path safe for future changes.
@@ -526,8 +638,7 @@ class AsusImageRepacker:
             
             # 원본 바이너리의 absolute_offset 위치에 수정 이미지 바이트를 그대로 덮어쓴다.
             # Overwrite the edited image bytes at the original absolute_offset in the binary.
-            new_data[offset:offset + original_size] = new_image_data
-            replaced_count += 1
+            replacements.append((offset, new_image_data))
             
             self._log(self._text(
                 "replace_done",
@@ -541,14 +652,20 @@ class AsusImageRepacker:
             base_name = os.path.splitext(self.file_path)[0]
             output_file = f"{base_name}_asus_preserved.bin"
         
-        # Write the output file.
+        # Write the output file: copy the original in-kernel, then patch only the replaced ranges.
         try:
-            with open(output_file, 'wb') as f:
-                f.write(new_data)
+            with self._atomic_output(output_file) as temp_file:
+                shutil.copyfile(self.file_path, temp_file)
+                if replacements:
+                    # Patch through one writable mapping; dirty pages are written back together on close.
+                    with open(temp_file, 'r+b') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE) as out_map:
+                        for offset, new_image_data in replacements:
+                            out_map[offset:offset + len(new_image_data)] = new_image_data
+                        out_map.flush()
             
             self._log(self._text("direct_done"))
-            self._log(self._text("replaced_images", count=replaced_count))
-            self._log(self._text("file_size_no_change", size=len(new_data)))
+            self._log(self._text("replaced_images", count=len(replacements)))
+            self._log(self._text("file_size_no_change", size=self.file_size))
             self._log(self._text("output_file", path=output_file))
             self._log(self._text("structure_100"))
             self._log(self._text("image_validation_done"))
@@ -563,135 +680,26 @@ class AsusImageRepacker:
         """Rebuild while preserving as much structure as possible when sizes change."""
         self._log(self._text("step_rebuild"))
         
-        # 크기가 바뀌면 기존 오프셋 기반 덮어쓰기가 불가능하므로 새 바이너리를 앞에서부터 조립한다.
-        # Size changes make offset-based overwrite invalid, so build a new binary from the front.
-        new_data = bytearray()
-        current_pos = 0
-        total_replaced = 0
-        
-        for pkg_idx, package in enumerate(original_packages, 1):
-            self._log(self._text("processing_package", pkg_idx=pkg_idx))
-            
-            # ASUS 패키지 바깥의 데이터는 해석하지 않고 원본 그대로 유지한다.
-            # Data outside ASUS packages is not interpreted; preserve it exactly as-is.
-            pkg_start = package['header_offset']
-            if current_pos < pkg_start:
-                preserved_data = self.data[current_pos:pkg_start]
-                new_data.extend(preserved_data)
-                self._log(self._text("preserve_before_package", size=len(preserved_data)))
-            
-            # 패키지 헤더는 ASUS Packer 식별에 필요한 영역이므로 원본 값을 그대로 둔다.
-            # Preserve the package header because it identifies the ASUS Packer structure.
-            header_end = package['header_end']
-            original_header = self.data[pkg_start:header_end]
-            new_data.extend(original_header)
-            self._log(self._text("preserve_header", size=len(original_header)))
-            
-            # 각 이미지는 [크기 4B][상대 오프셋 4B][특수 패턴 24B][이미지 데이터][패딩] 순서로 재조립한다.
-            # Rebuild each image block as [size 4B][relative offset 4B][special pattern 24B][image data][padding].
-            pkg_replaced_count = 0
-            
-            # 이미지 순서는 펌웨어 내부 참조와 연결될 수 있어 원본 번호 순서를 유지한다.
-            # Keep the original image order because firmware references may depend on it.
-            sorted_images = sorted(package['images'], key=lambda x: x['number'])
-            
-            for img_info in sorted_images:
-                abs_offset = img_info['absolute_offset']
-                
-                # 변경된 이미지만 새 데이터를 사용하고, 나머지는 원본 이미지 데이터를 그대로 넣는다.
-                # Use edited data only for modified images; all others keep their original bytes.
-                if abs_offset in modified_images:
-                    # Use modified image data.
-                    img_data = modified_images[abs_offset]['new_data']
-                    pkg_replaced_count += 1
-                    total_replaced += 1
-                    self._log(self._text(
-                        "replace_image",
-                        number=img_info['number'],
-                        old_size=img_info['size'],
-                        new_size=len(img_data),
-                    ))
-                else:
-                    # Preserve original image data.
-                    img_data = img_info['data']
-                    self._log(self._text("preserve_image", number=img_info['number'], size=len(img_data)))
-                
-                # 메타데이터의 첫 4바이트는 현재 이미지 크기다. 크기가 바뀐 이미지는 여기서 갱신된다.
-                # The first 4 metadata bytes store the current image size, updated for resized images.
-                size_bytes = struct.pack('<I', len(img_data))
-                new_data.extend(size_bytes)
-                
-                # 다음 4바이트는 메타데이터 시작점 기준 이미지 데이터까지의 상대 오프셋이다.
-                # 현재 구조는 32바이트 메타데이터 뒤에 이미지가 오므로 0x20으로 고정한다.
-                # The next 4 bytes are the relative offset from metadata start to image data.
-                # This layout places image data after a 32-byte metadata block, so the offset stays 0x20.
-                offset_bytes = struct.pack('<I', 0x20)
-                new_data.extend(offset_bytes)
-                
-                # 나머지 24바이트는 모델별 의미가 명확하지 않은 특수 패턴이라 원본 보존이 우선이다.
-                # The remaining 24 bytes are model-specific/unclear, so preserving the original pattern is safest.
-                original_special_pattern = img_info.get('special_pattern')
-                if original_special_pattern and len(original_special_pattern) == 24:
-                    new_data.extend(original_special_pattern)
-                    self._log(self._text("preserve_special"))
-                else:
-                    # Fallback: extract directly from the original file.
-                    metadata_start = img_info['metadata_offset']
-                    if metadata_start + 32 <= len(self.data):
-                        original_special_pattern = self.data[metadata_start + 8:metadata_start + 32]
-                        new_data.extend(original_special_pattern)
-                        self._log(self._text("extract_special"))
-                    else:
-                        # Last resort: use the default pattern.
-                        if img_info['number'] == 1:
-                            special_pattern = bytes.fromhex("FFFF0A00FFFF004000000000300009040000000000000000")
-                        else:
-                            special_pattern = bytes.fromhex("00FFFF0A00FFFF0200000000300009040000000000000000")
-                        new_data.extend(special_pattern)
-                        self._log(self._text("default_special"))
-                
-                # 갱신된 메타데이터 바로 뒤에 실제 이미지 데이터를 붙인다.
-                # Append actual image data directly after the updated metadata.
-                new_data.extend(img_data)
-                
-                # ASUS 패키지는 이미지 뒤를 4바이트 경계로 맞추므로 동일한 정렬을 적용한다.
-                # ASUS packages align image payloads to 4-byte boundaries; apply the same alignment.
-                padding = (4 - (len(img_data) % 4)) % 4
-                if padding > 0:
-                    new_data.extend(b'\x00' * padding)
-                    self._log(self._text("add_padding", padding=padding))
-            
-            # 원본 기준으로 현재 패키지가 차지하던 범위를 건너뛰고 다음 보존 구간을 계산한다.
-            # Advance over the original package span to find the next untouched region to preserve.
-            current_pos = pkg_start + package['total_size']
-            
-            self._log(self._text("package_complete", pkg_idx=pkg_idx))
-            self._log(self._text("package_replaced", count=pkg_replaced_count))
-            self._log(self._text("package_total", count=len(sorted_images)))
-            self._log(self._text("package_special_preserved"))
-            self._log(self._text("package_structure"))
-        
-        # Preserve all data after the last package.
-        if current_pos < len(self.data):
-            remaining_data = self.data[current_pos:]
-            new_data.extend(remaining_data)
-            self._log(self._text("preserve_after_package", size=len(remaining_data)))
-        
         # Resolve output file name.
         if output_file is None:
             base_name = os.path.splitext(self.file_path)[0]
             output_file = f"{base_name}_asus_preserved.bin"
         
-        # Write the output file.
+        # 크기가 바뀌면 기존 오프셋 기반 덮어쓰기가 불가능하므로 새 바이너리를 앞에서부터 조립한다.
+        # Size changes make offset-based overwrite invalid, so build a new binary from the front,
+        # streaming it into a large-buffered output file instead of a growing bytearray.
         try:
-            with open(output_file, 'wb') as f:
-                f.write(new_data)
+            # The writer runs in its own frame so no slice of the input mapping outlives it.
+            with self._atomic_output(output_file) as temp_file:
+                with open(temp_file, 'wb', buffering=1024 * 1024) as out:
+                    total_replaced = self._write_rebuilt_packages(out, original_packages, modified_images)
+                    final_size = out.tell()
             
             self._log(self._text("rebuild_done"))
             self._log(self._text("replaced_images", count=total_replaced))
-            self._log(self._text("original_size", size=len(self.data)))
-            self._log(self._text("final_size", size=len(new_data)))
-            self._log(self._text("size_diff", diff=len(new_data) - len(self.data)))
+            self._log(self._text("original_size", size=self.file_size))
+            self._log(self._text("final_size", size=final_size))
+            self._log(self._text("size_diff", diff=final_size - self.file_size))
             self._log(self._text("output_file", path=output_file))
             self._log(self._text("structure_max"))
             self._log(self._text("image_validation_done"))
@@ -702,15 +710,131 @@ class AsusImageRepacker:
             self._log(self._text("save_failed", error=e))
             return False
     
+    def _write_rebuilt_packages(self, out, original_packages, modified_images):
+        """Stream the rebuilt binary into out and return the number of replaced images."""
+        # Slices of the memoryview are zero-copy; the file object writes them directly.
+        with memoryview(self.data) as view:
+            write = out.write
+            current_pos = 0
+            total_replaced = 0
+        
+            for pkg_idx, package in enumerate(original_packages, 1):
+                self._log(self._text("processing_package", pkg_idx=pkg_idx))
+            
+                # ASUS 패키지 바깥의 데이터는 해석하지 않고 원본 그대로 유지한다.
+                # Data outside ASUS packages is not interpreted; preserve it exactly as-is.
+                pkg_start = package['header_offset']
+                if current_pos < pkg_start:
+                    preserved_data = view[current_pos:pkg_start]
+                    write(preserved_data)
+                    self._log(self._text("preserve_before_package", size=len(preserved_data)))
+            
+                # 패키지 헤더는 ASUS Packer 식별에 필요한 영역이므로 원본 값을 그대로 둔다.
+                # Preserve the package header because it identifies the ASUS Packer structure.
+                header_end = package['header_end']
+                original_header = view[pkg_start:header_end]
+                write(original_header)
+                self._log(self._text("preserve_header", size=len(original_header)))
+            
+                # 각 이미지는 [크기 4B][상대 오프셋 4B][특수 패턴 24B][이미지 데이터][패딩] 순서로 재조립한다.
+                # Rebuild each image block as [size 4B][relative offset 4B][special pattern 24B][image data][padding].
+                pkg_replaced_count = 0
+            
+                # 이미지 순서는 펌웨어 내부 참조와 연결될 수 있어 원본 번호 순서를 유지한다.
+                # Keep the original image order because firmware references may depend on it.
+                sorted_images = sorted(package['images'], key=lambda x: x['number'])
+            
+                with self._batched_log():
+                    for img_info in sorted_images:
+                        abs_offset = img_info['absolute_offset']
+                
+                        # 변경된 이미지만 새 데이터를 사용하고, 나머지는 원본 이미지 데이터를 그대로 넣는다.
+                        # Use edited data only for modified images; all others keep their original bytes.
+                        if abs_offset in modified_images:
+                            # Use modified image data.
+                            img_data = modified_images[abs_offset]['new_data']
+                            pkg_replaced_count += 1
+                            total_replaced += 1
+                            self._log(self._text(
+                                "replace_image",
+                                number=img_info['number'],
+                                old_size=img_info['size'],
+                                new_size=len(img_data),
+                            ))
+                        else:
+                            # Preserve original image data.
+                            img_data = view[abs_offset:abs_offset + img_info['size']]
+                            self._log(self._text("preserve_image", number=img_info['number'], size=len(img_data)))
+                
+                        # 메타데이터의 첫 4바이트는 현재 이미지 크기다. 크기가 바뀐 이미지는 여기서 갱신된다.
+                        # 다음 4바이트는 메타데이터 시작점 기준 이미지 데이터까지의 상대 오프셋이다.
+                        # 현재 구조는 32바이트 메타데이터 뒤에 이미지가 오므로 0x20으로 고정한다.
+                        # The first 4 metadata bytes store the current image size, updated for resized images.
+                        # The next 4 bytes are the relative offset from metadata start to image data.
+                        # This layout places image data after a 32-byte metadata block, so the offset stays 0x20.
+                        write(_META_HDR.pack(len(img_data), 0x20))
+                
+                        # 나머지 24바이트는 모델별 의미가 명확하지 않은 특수 패턴이라 원본 보존이 우선이다.
+                        # The remaining 24 bytes are model-specific/unclear, so preserving the original pattern is safest.
+                        original_special_pattern = img_info.get('special_pattern')
+                        if original_special_pattern and len(original_special_pattern) == 24:
+                            write(original_special_pattern)
+                            self._log(self._text("preserve_special"))
+                        else:
+                            # Fallback: extract directly from the original file.
+                            metadata_start = img_info['metadata_offset']
+                            if metadata_start + 32 <= len(self.data):
+                                original_special_pattern = view[metadata_start + 8:metadata_start + 32]
+                                write(original_special_pattern)
+                                self._log(self._text("extract_special"))
+                            else:
+                                # Last resort: use the default pattern.
+                                if img_info['number'] == 1:
+                                    special_pattern = _DEFAULT_PATTERN_FIRST
+                                else:
+                                    special_pattern = _DEFAULT_PATTERN_REST
+                                write(special_pattern)
+                                self._log(self._text("default_special"))
+                
+                        # 갱신된 메타데이터 바로 뒤에 실제 이미지 데이터를 붙인다.
+                        # Append actual image data directly after the updated metadata.
+                        write(img_data)
+                
+                        # ASUS 패키지는 이미지 뒤를 4바이트 경계로 맞추므로 동일한 정렬을 적용한다.
+                        # ASUS packages align image payloads to 4-byte boundaries; apply the same alignment.
+                        padding = (4 - (len(img_data) % 4)) % 4
+                        if padding > 0:
+                            write(b'\x00' * padding)
+                            self._log(self._text("add_padding", padding=padding))
+            
+                # 원본 기준으로 현재 패키지가 차지하던 범위를 건너뛰고 다음 보존 구간을 계산한다.
+                # Advance over the original package span to find the next untouched region to preserve.
+                current_pos = pkg_start + package['total_size']
+            
+                self._log(self._text("package_complete", pkg_idx=pkg_idx))
+                self._log(self._text("package_replaced", count=pkg_replaced_count))
+                self._log(self._text("package_total", count=len(sorted_images)))
+                self._log(self._text("package_special_preserved"))
+                self._log(self._text("package_structure"))
+        
+            # Preserve all data after the last package.
+            if current_pos < len(self.data):
+                remaining_data = view[current_pos:]
+                write(remaining_data)
+                self._log(self._text("preserve_after_package", size=len(remaining_data)))
+        
+        return total_replaced
+    
     def run_repack(self, extracted_dir, output_file=None):
         """Run the full repack workflow."""
         self._log(self._text("start"))
         self._log("=" * 60)
         
         self.load_file()
-        
-        success = self.rebuild_asus_packer_preserve_structure(extracted_dir, output_file)
-        
+        try:
+            success = self.rebuild_asus_packer_preserve_structure(extracted_dir, output_file)
+        finally:
+            self.close()
         
         if success:
             self._log("\n" + "=" * 60)
@@ -83,7 +83,10 @@ def analyze_mode(file_path=None):
             print(f"[VALID] {detail}")
 
         analyzer = AsusFileAnalyzer(target_file)
-        analyzer.run_full_analysis()
+        try:
+            analyzer.run_full_analysis()
+        finally:
+            analyzer.close()
         return True
         
     except Exception as e:
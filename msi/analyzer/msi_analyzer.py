@@ -8,10 +8,13 @@ This analyzer does not implement extraction.
 
 import os
 import sys
+import copy
+import mmap
 import struct
+import hashlib
 import binascii
-from typing import List, Dict, Any, NamedTuple, Optional
-from collections import OrderedDict
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+from collections import Counter, OrderedDict
 from datetime import datetime
 
 from common.binary_validation import validate_msi_binary
@@ -27,6 +30,43 @@ if os.name == 'nt':  # Windows
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.detach())
 
 
+# b'$MsI$' signature, sector, layer, image number, reserved, little-endian image size.
+_MSI_HEADER = struct.Struct('<5sBBBBI')
+
+# Window size for the multi-pattern scan; small enough to stay cache-resident.
+_SCAN_WINDOW = 1 << 20
+
+# Byte translation table mapping non-printable bytes to '.'.
+_ASCII_TABLE = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256))
+
+
+def _find_offsets(data, pattern, start=0, end=None):
+    """Return every (overlapping) offset of pattern in data[start:end] using the C-level find()."""
+    if end is None:
+        end = len(data)
+    offsets = []
+    pos = data.find(pattern, start, end)
+    while pos != -1:
+        offsets.append(pos)
+        pos = data.find(pattern, pos + 1, end)
+    return offsets
+
+
+def _scan_patterns(data, patterns, start=0, stop=None):
+    """Collect offsets in [start, stop) of each pattern, all patterns per cache-sized window."""
+    data_len = len(data)
+    if stop is None:
+        stop = data_len
+    pattern_offsets = {pattern: [] for pattern in patterns}
+    for window_start in range(start, stop, _SCAN_WINDOW):
+        window_end = min(window_start + _SCAN_WINDOW, stop)
+        for pattern, offsets in pattern_offsets.items():
+            # Let matches that start inside the window run past its end.
+            offsets.extend(_find_offsets(
+                data, pattern, window_start, min(window_end + len(pattern) - 1, data_len)))
+    return pattern_offsets
+
+
 class MSIHeader(NamedTuple):
     """MSI header structure (13 bytes, b'$MsI$' signature + 8-byte metadata)"""
     signature: bytes      # 0x00-0x04: b'$MsI$' (5 bytes)
@@ -57,11 +97,21 @@ class MSIFileAnalyzer:
             b'_FVH': 'UEFI Firmware Volume'
         }
         
+        # Group patterns by first byte so type detection checks only plausible candidates.
+        self._type_by_first = {}
+        for pattern, desc in self.magic_patterns.items():
+            self._type_by_first.setdefault(pattern[0], []).append((pattern, desc))
+        
         # Store the latest analysis results.
         self.analysis_results = {}
+        # Results of earlier runs, keyed by a cheap file identity (see _cache_key).
+        self._results_cache = {}
+        # Whether scan stages write their per-hit log lines to stdout.
+        self.verbose = True
         
-    def analyze_file(self, file_path: str) -> Dict[str, Any]:
-        """Analyze an MSI binary file."""
+    def analyze_file(self, file_path: str, verbose: bool = True) -> Dict[str, Any]:
+        """Analyze an MSI binary file; verbose=False drops the per-hit scan log."""
+        self.verbose = verbose
         try:
             print(f"\n=== MSI BIOS 파일 분석 시작 ===")
             print(f"분석할 파일: {os.path.basename(file_path)}")
@@ -76,71 +126,95 @@ class MSIFileAnalyzer:
             for detail in validation.details:
                 print(f"[VALID] {detail}")
             
-            # Read the file.
-            with open(file_path, 'rb') as f:
-                data = f.read()
+            # Map the file read-only instead of copying it onto the heap.
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            
+                # Every stage scans front to back; start read-ahead now instead of faulting page by page.
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    data.madvise(mmap.MADV_SEQUENTIAL)
+                if hasattr(mmap, 'MADV_WILLNEED'):
+                    data.madvise(mmap.MADV_WILLNEED)
             
-            file_size = len(data)
-            print(f"파일 크기: {file_size:,} bytes ({file_size/1024:.2f} KB)")
+                file_size = len(data)
+                print(f"파일 크기: {file_size:,} bytes ({file_size/1024:.2f} KB)")
+            
+                # Reuse the previous results when the same unchanged file is analyzed again.
+                cache_key = self._cache_key(file_path, data)
+                cached = self._results_cache.get(cache_key)
+                if cached is not None:
+                    print("[INFO] 변경되지 않은 파일입니다. 이전 분석 결과를 사용합니다.")
+                    # Hand out a private copy stamped with this run's time so callers cannot alter the cache.
+                    results = copy.deepcopy(cached)
+                    results['timestamp'] = datetime.now().isoformat()
+                    self._print_analysis_results(results)
+                    self.analysis_results = results
+                    return results
+            
+                # Collect basic file metadata.
+                results = {
+                    'file_path': file_path,
+                    'file_size': file_size,
+                    'timestamp': datetime.now().isoformat(),
+                    'magic_bytes': [],
+                    'msi_entries': [],
+                    'summary': {}
+                }
             
-            # Collect basic file metadata.
-            results = {
-                'file_path': file_path,
-                'file_size': file_size,
-                'timestamp': datetime.now().isoformat(),
-                'magic_bytes': [],
-                'msi_entries': [],
-                'summary': {}
-            }
+                # Parse MSI entries first so the magic scan can skip their image payloads.
+                entry_log = []
+                msi_entries = self._find_msi_entries(data, log=entry_log)
+                results['msi_entries'] = msi_entries
             
-            # Search for magic-byte patterns.
-            print(f"\n=== 매직 바이트 분석 ===")
-            magic_bytes = self._find_magic_bytes(data)
-            results['magic_bytes'] = magic_bytes
+                # Search for magic-byte patterns outside the parsed image payloads.
+                print(f"\n=== 매직 바이트 분석 ===")
+                pattern_offsets = self._find_pattern_offsets(
+                    data, self._unparsed_ranges(msi_entries, file_size))
+                magic_bytes = self._find_magic_bytes(data, pattern_offsets)
+                results['magic_bytes'] = magic_bytes
             
-            # Count MSI signatures.
-            msi_signature_count = data.count(self.MSI_SIGNATURE)
-            print(f"MSI 시그니처 '$MsI$' 발견 개수: {msi_signature_count}개")
+                # Count MSI signatures from the shared scan instead of rescanning.
+                msi_signature_count = self._count_pattern(
+                    pattern_offsets[self.MSI_SIGNATURE], len(self.MSI_SIGNATURE))
+                print(f"MSI 시그니처 '$MsI$' 발견 개수: {msi_signature_count}개")
             
-            # Find and parse MSI entries.
-            print(f"\n=== MSI Packer 엔트리 분석 ===")
-            if msi_signature_count == 0:
-                print("[WARNING] MSI Packer 시그니처를 찾을 수 없습니다.")
-                print("이 파일은 MSI Packer 형식이 아닐 수 있습니다.")
-                print("파일의 처음 64바이트를 확인합니다...")
-                hex_dump = ' '.join(f'{b:02X}' for b in data[:64])
-                print(f"첫 64바이트: {hex_dump}")
+                # Report the MSI entries parsed above.
+                print(f"\n=== MSI Packer 엔트리 분석 ===")
+                if msi_signature_count == 0:
+                    print("[WARNING] MSI Packer 시그니처를 찾을 수 없습니다.")
+                    print("이 파일은 MSI Packer 형식이 아닐 수 있습니다.")
+                    print("파일의 처음 64바이트를 확인합니다...")
+                    hex_dump = data[:64].hex(' ').upper()
+                    print(f"첫 64바이트: {hex_dump}")
                 
-                # Check other known signatures.
-                print("\n다른 알려진 패턴 검색 중...")
-                for pattern, desc in self.magic_patterns.items():
-                    if pattern in data:
-                        first_pos = data.find(pattern)
-                        print(f"  - {desc}: 0x{first_pos:08X}에서 발견")
+                    # Check other known signatures.
+                    print("\n다른 알려진 패턴 검색 중...")
+                    for pattern, desc in self.magic_patterns.items():
+                        if pattern_offsets[pattern]:
+                            print(f"  - {desc}: 0x{pattern_offsets[pattern][0]:08X}에서 발견")
                         
-                print("\n이 파일을 분석하려면 올바른 MSI BIOS Section 파일이 필요합니다.")
+                    print("\n이 파일을 분석하려면 올바른 MSI BIOS Section 파일이 필요합니다.")
             
-            msi_entries = self._find_msi_entries(data)
-            results['msi_entries'] = msi_entries
+                self._write_log(entry_log)
             
-            if not msi_entries:
-                print("\n[INFO] 표준 MSI Packer 엔트리를 찾을 수 없습니다.")
-                print("대안 분석을 시도합니다...")
+                if not msi_entries:
+                    print("\n[INFO] 표준 MSI Packer 엔트리를 찾을 수 없습니다.")
+                    print("대안 분석을 시도합니다...")
                 
-                # Fallback 1: scan for known image signatures.  
-                image_entries = self._find_embedded_images(data)
-                if image_entries:
-                    print(f"[INFO] 임베디드 이미지 {len(image_entries)}개를 발견했습니다.")
-                    results['embedded_images'] = image_entries
-                else:
-                    print("[WARNING] 이미지 데이터를 찾을 수 없습니다.")
+                    # Fallback 1: scan for known image signatures.  
+                    image_entries = self._find_embedded_images(data, pattern_offsets)
+                    if image_entries:
+                        print(f"[INFO] 임베디드 이미지 {len(image_entries)}개를 발견했습니다.")
+                        results['embedded_images'] = image_entries
+                    else:
+                        print("[WARNING] 이미지 데이터를 찾을 수 없습니다.")
                     
-                # Fallback 2: guess the file format.
-                file_type = self._guess_file_format(data)
-                print(f"[INFO] 추정 파일 형식: {file_type}")
-                results['guessed_format'] = file_type
-            else:
-                print(f"\n[SUCCESS] {len(msi_entries)}개의 MSI 엔트리를 발견했습니다.")
+                    # Fallback 2: guess the file format.
+                    file_type = self._guess_file_format(data)
+                    print(f"[INFO] 추정 파일 형식: {file_type}")
+                    results['guessed_format'] = file_type
+                else:
+                    print(f"\n[SUCCESS] {len(msi_entries)}개의 MSI 엔트리를 발견했습니다.")
             
             # Generate summary statistics.
             summary = self._generate_summary(results)
@@ -150,105 +224,162 @@ class MSIFileAnalyzer:
             self._print_analysis_results(results)
             
             self.analysis_results = results
+            self._results_cache[cache_key] = copy.deepcopy(results)
             return results
             
         except Exception as e:
             print(f"[ERROR] 파일 분석 중 오류 발생: {e}")
             return {}
     
-    def _find_magic_bytes(self, data: bytes) -> List[Dict[str, Any]]:
+    def _cache_key(self, file_path: str, data: bytes) -> tuple:
+        """Identify a file by path, size, mtime and a BLAKE2b digest of its first and last 4 KiB."""
+        stat = os.stat(file_path)
+        digest = hashlib.blake2b(data[:4096], digest_size=16)
+        digest.update(data[-4096:])
+        return (os.path.realpath(file_path), stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+    
+    def _find_pattern_offsets(self, data: bytes,
+                              ranges: Optional[List[Tuple[int, int]]] = None) -> Dict[bytes, List[int]]:
+        """Collect every (overlapping) offset of each magic pattern that starts in ranges.
+
+        All patterns are searched within one cache-sized window before moving on,
+        so the buffer is streamed from memory once rather than once per pattern.
+        """
+        patterns = tuple(self.magic_patterns)
+        if ranges is None:
+            ranges = [(0, len(data))]
+        parts = [_scan_patterns(data, patterns, start, stop) for start, stop in ranges]
+        return {pattern: [pos for part in parts for pos in part[pattern]] for pattern in patterns}
+    
+    def _unparsed_ranges(self, entries: List[Dict[str, Any]], data_length: int) -> List[Tuple[int, int]]:
+        """Return the [start, stop) ranges around the image payloads of parsed MSI entries."""
+        ranges = []
+        start = 0
+        for entry in entries:
+            if entry['image_data_offset'] > start:
+                ranges.append((start, entry['image_data_offset']))
+            start = entry['image_data_offset'] + entry['image_data_size']
+        if start < data_length:
+            ranges.append((start, data_length))
+        return ranges
+    
+    def _find_magic_bytes(self, data: bytes,
+                          pattern_offsets: Optional[Dict[bytes, List[int]]] = None) -> List[Dict[str, Any]]:
         """Search for magic-byte patterns."""
+        if pattern_offsets is None:
+            pattern_offsets = self._find_pattern_offsets(data)
         magic_bytes = []
+        log = []
         
         for pattern, description in self.magic_patterns.items():
-            offset = 0
-            while True:
-                pos = data.find(pattern, offset)
-                if pos == -1:
-                    break
-                    
+            pattern_hex = pattern.hex().upper()
+            pattern_ascii = self._bytes_to_ascii(pattern)
+            for pos in pattern_offsets[pattern]:
                 magic_info = {
                     'offset': pos,
-                    'pattern': pattern.hex().upper(),
+                    'pattern': pattern_hex,
                     'description': description,
-                    'ascii': self._bytes_to_ascii(pattern)
+                    'ascii': pattern_ascii
                 }
                 magic_bytes.append(magic_info)
-                print(f"오프셋 0x{pos:08X}: {pattern.hex().upper()} ({description})")
-                
-                offset = pos + 1
+                log.append(f"오프셋 0x{pos:08X}: {pattern_hex} ({description})")
         
+        self._write_log(log)
         return magic_bytes
     
-    def _find_msi_entries(self, data: bytes) -> List[Dict[str, Any]]:
-        """Find and parse MSI entries."""
+    def _find_msi_entries(self, data: bytes,
+                          signature_offsets: Optional[List[int]] = None,
+                          log: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Find and parse MSI entries; log lines go to log instead of stdout when it is given."""
+        # Without precomputed hits, the C-level find() jumps straight to each candidate.
+        hits = iter(signature_offsets) if signature_offsets is not None else None
         entries = []
+        write_log = log is None
+        if write_log:
+            log = []
         offset = 0
+        header_limit = len(data) - self.HEADER_SIZE
         
-        while offset < len(data) - self.HEADER_SIZE:
-            if data[offset:offset+len(self.MSI_SIGNATURE)] == self.MSI_SIGNATURE:
-                try:
-                    # Parse the MSI header.
-                    header = self._parse_msi_header(data, offset)
+        # Only signature hits are probed; hits inside a parsed image payload are skipped.
+        while True:
+            if hits is None:
+                pos = data.find(self.MSI_SIGNATURE, offset)
+            else:
+                pos = next(hits, -1)
+                if 0 <= pos < offset:
+                    continue
+            if pos < 0 or pos >= header_limit:
+                break
+            offset = pos + 1
+            try:
+                # Parse the MSI header.
+                header = self._parse_msi_header(data, pos)
+                
+                # Read the image payload range.
+                image_start = pos + self.HEADER_SIZE
+                image_end = image_start + header.image_size
+                
+                if image_end <= len(data):
+                    # Only the leading bytes are needed for type detection and the preview.
+                    image_head = data[image_start:min(image_end, image_start + 32)]
                     
-                    # Read the image payload range.
-                    image_start = offset + self.HEADER_SIZE
-                    image_end = image_start + header.image_size
+                    entry = {
+                        'index': len(entries),
+                        'offset': pos,
+                        'header': header._asdict(),
+                        'image_data_offset': image_start,
+                        'image_data_size': header.image_size,
+                        'image_type': self._detect_image_type(image_head),
+                        'image_preview': image_head.hex().upper()
+                    }
+                    entries.append(entry)
                     
-                    if image_end <= len(data):
-                        image_data = data[image_start:image_end]
-                        
-                        entry = {
-                            'index': len(entries),
-                            'offset': offset,
-                            'header': header._asdict(),
-                            'image_data_offset': image_start,
-                            'image_data_size': header.image_size,
-                            'image_type': self._detect_image_type(image_data),
-                            'image_preview': image_data[:32].hex().upper() if len(image_data) >= 32 else image_data.hex().upper()
-                        }
-                        entries.append(entry)
-                        
-                        print(f"MSI Entry #{len(entries)-1}: 오프셋 0x{offset:08X}, 크기 {header.image_size:,} bytes, 타입: {entry['image_type']}")
-                        
-                        # Jump to the next entry.
-                        offset = image_end
-                    else:
-                        offset += 1
-                        
-                except Exception as e:
-                    print(f"[WARNING] 오프셋 0x{offset:08X}에서 MSI 헤더 파싱 실패: {e}")
-                    offset += 1
-            else:
-                offset += 1
+                    log.append(f"MSI Entry #{len(entries)-1}: 오프셋 0x{pos:08X}, 크기 {header.image_size:,} bytes, 타입: {entry['image_type']}")
+                    
+                    # Jump to the next entry.
+                    offset = image_end
+                    
+            except Exception as e:
+                log.append(f"[WARNING] 오프셋 0x{pos:08X}에서 MSI 헤더 파싱 실패: {e}")
         
+        if write_log:
+            self._write_log(log)
         return entries
     
+    def _write_log(self, lines: List[str]):
+        """Write a scan stage's collected log lines in one call, unless running quietly."""
+        if lines and self.verbose:
+            sys.stdout.write('\n'.join(lines) + '\n')
+    
+    def _count_pattern(self, offsets: List[int], pattern_len: int) -> int:
+        """Count non-overlapping occurrences from a sorted list of overlapping offsets."""
+        count = 0
+        next_free = 0
+        for pos in offsets:
+            if pos >= next_free:
+                count += 1
+                next_free = pos + pattern_len
+        return count
+    
     def _parse_msi_header(self, data: bytes, offset: int) -> MSIHeader:
         """Parse the MSI header."""
         if offset + self.HEADER_SIZE > len(data):
             raise ValueError(f"오프셋 {offset:#x}에서 헤더를 읽을 수 없습니다")
             
-        header_data = data[offset:offset + self.HEADER_SIZE]
-        
-        # Unpack binary header fields.
-        sig_len = len(self.MSI_SIGNATURE)
-        signature = header_data[0:sig_len]
-        sector = header_data[sig_len]
-        layer = header_data[sig_len + 1]
-        image_number = header_data[sig_len + 2]
-        reserved = header_data[sig_len + 3]
-        image_size = struct.unpack('<I', header_data[sig_len + 4:sig_len + 8])[0]  # Little-endian
+        # Unpack all header fields straight from the buffer, without slicing copies.
+        header = MSIHeader._make(_MSI_HEADER.unpack_from(data, offset))
+        if header.signature != self.MSI_SIGNATURE:
+            raise ValueError(f"오프셋 {offset:#x}에 MSI 시그니처가 없습니다")
         
-        return MSIHeader(signature, sector, layer, image_number, reserved, image_size)
+        return header
     
     def _detect_image_type(self, image_data: bytes) -> str:
         """Detect the image type."""
         if not image_data:
             return "Empty"
         
-        # Detect the image type from magic bytes.
-        for magic, desc in self.magic_patterns.items():
+        # Detect the image type from magic bytes sharing the first byte.
+        for magic, desc in self._type_by_first.get(image_data[0], ()):
             if image_data.startswith(magic):
                 return desc
         
@@ -263,20 +394,16 @@ class MSIFileAnalyzer:
         """Build the analysis summary."""
         entries = results['msi_entries']
         
-        # Collect per-image-type statistics.
-        type_stats = {}
-        total_image_size = 0
-        
-        for entry in entries:
-            img_type = entry['image_type']
-            size = entry['image_data_size']
-            
-            if img_type not in type_stats:
-                type_stats[img_type] = {'count': 0, 'total_size': 0}
-            
-            type_stats[img_type]['count'] += 1
-            type_stats[img_type]['total_size'] += size
-            total_image_size += size
+        # Collect per-image-type statistics; Counter tallies in C and keeps first-seen order.
+        types = [entry['image_type'] for entry in entries]
+        sizes = [entry['image_data_size'] for entry in entries]
+        type_counts = Counter(types)
+        type_sizes = dict.fromkeys(type_counts, 0)
+        for img_type, size in zip(types, sizes):
+            type_sizes[img_type] += size
+        total_image_size = sum(sizes)
+        type_stats = {img_type: {'count': count, 'total_size': type_sizes[img_type]}
+                      for img_type, count in type_counts.items()}
         
         # Summary data.
         summary = {
@@ -308,11 +435,15 @@ class MSIFileAnalyzer:
     
     def _bytes_to_ascii(self, data: bytes) -> str:
         """Convert bytes to printable ASCII."""
-        return ''.join(chr(b) if 32 <= b <= 126 else '.' for b in data)
+        return bytes(data).translate(_ASCII_TABLE).decode('ascii')
 
-    def _find_embedded_images(self, data: bytes) -> List[Dict[str, Any]]:
+    def _find_embedded_images(self, data: bytes,
+                              pattern_offsets: Optional[Dict[bytes, List[int]]] = None) -> List[Dict[str, Any]]:
         """Search embedded images as a non-MSI fallback."""
+        if pattern_offsets is None:
+            pattern_offsets = self._find_pattern_offsets(data)
         images = []
+        log = []
         image_patterns = {
             b'\xFF\xD8\xFF': 'JPEG',
             b'\x89\x50\x4E\x47': 'PNG', 
@@ -321,11 +452,11 @@ class MSIFileAnalyzer:
         }
         
         for pattern, img_type in image_patterns.items():
+            # Reuse the magic-byte scan; matches inside the previous hit are skipped.
             offset = 0
-            while True:
-                pos = data.find(pattern, offset)
-                if pos == -1:
-                    break
+            for pos in pattern_offsets[pattern]:
+                if pos < offset:
+                    continue
                     
                 # Estimate image size with a simple heuristic.
                 estimated_size = min(1024 * 1024, len(data) - pos)  # 최대 1MB
@@ -337,10 +468,11 @@ class MSIFileAnalyzer:
                     'data_preview': data[pos:pos+32].hex().upper()
                 }
                 images.append(image_info)
-                print(f"  - {img_type} 이미지: 오프셋 0x{pos:08X}")
+                log.append(f"  - {img_type} 이미지: 오프셋 0x{pos:08X}")
                 
                 offset = pos + len(pattern)
                 
+        self._write_log(log)
         return images
 
     def _guess_file_format(self, data: bytes) -> str:
@@ -373,43 +505,47 @@ class MSIFileAnalyzer:
                 print("[ERROR] 분석 결과가 없습니다. 먼저 analyze_file()을 실행하세요.")
                 return False
             
+            # Build the whole report in memory and write it with a single call.
+            results = self.analysis_results
+            parts = ["=== MSI BIOS 파일 분석 리포트 ===\n"]
+            parts.append(f"생성 시간: {results['timestamp']}\n")
+            parts.append(f"분석 파일: {results['file_path']}\n")
+            parts.append(f"파일 크기: {results['file_size']:,} bytes\n\n")
+            
+            # Magic-byte section.
+            parts.append("=== 매직 바이트 패턴 ===\n")
+            for magic in results['magic_bytes']:
+                parts.append(f"오프셋 0x{magic['offset']:08X}: {magic['pattern']} ({magic['description']})\n")
+            parts.append("\n")
+            
+            # MSI entry section.
+            parts.append("=== MSI Packer 엔트리 ===\n")
+            for entry in results['msi_entries']:
+                parts.append(f"Entry #{entry['index']}:\n")
+                parts.append(f"  오프셋: 0x{entry['offset']:08X}\n")
+                parts.append(f"  이미지 크기: {entry['image_data_size']:,} bytes\n")
+                parts.append(f"  이미지 타입: {entry['image_type']}\n")
+                parts.append(f"  이미지 번호: {entry['header']['image_number']}\n")
+                parts.append(f"  섹터: 0x{entry['header']['sector']:02X}\n")
+                parts.append(f"  레이어: 0x{entry['header']['layer']:02X}\n")
+                parts.append(f"  프리뷰: {entry['image_preview']}\n\n")
+            
+            # Summary data.
+            summary = results['summary']
+            parts.append("=== 분석 요약 ===\n")
+            parts.append(f"총 MSI 엔트리: {summary['total_entries']}개\n")
+            parts.append(f"총 이미지 크기: {summary['total_image_size']:,} bytes\n")
+            parts.append(f"파일 커버리지: {summary['file_coverage']:.1f}%\n\n")
+            
+            parts.append("=== 이미지 타입별 통계 ===\n")
+            for img_type, stats in summary['image_type_stats'].items():
+                count = stats['count']
+                size = stats['total_size']
+                percentage = (size / summary['total_image_size'] * 100) if summary['total_image_size'] > 0 else 0
+                parts.append(f"{img_type}: {count}개, {size:,} bytes ({percentage:.1f}%)\n")
+            
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("=== MSI BIOS 파일 분석 리포트 ===\n")
-                f.write(f"생성 시간: {self.analysis_results['timestamp']}\n")
-                f.write(f"분석 파일: {self.analysis_results['file_path']}\n")
-                f.write(f"파일 크기: {self.analysis_results['file_size']:,} bytes\n\n")
-                
-                # Magic-byte section.
-                f.write("=== 매직 바이트 패턴 ===\n")
-                for magic in self.analysis_results['magic_bytes']:
-                    f.write(f"오프셋 0x{magic['offset']:08X}: {magic['pattern']} ({magic['description']})\n")
-                f.write("\n")
-                
-                # MSI entry section.
-                f.write("=== MSI Packer 엔트리 ===\n")
-                for entry in self.analysis_results['msi_entries']:
-                    f.write(f"Entry #{entry['index']}:\n")
-                    f.write(f"  오프셋: 0x{entry['offset']:08X}\n")
-                    f.write(f"  이미지 크기: {entry['image_data_size']:,} bytes\n")
-                    f.write(f"  이미지 타입: {entry['image_type']}\n")
-                    f.write(f"  이미지 번호: {entry['header']['image_number']}\n")
-                    f.write(f"  섹터: 0x{entry['header']['sector']:02X}\n")
-                    f.write(f"  레이어: 0x{entry['header']['layer']:02X}\n")
-                    f.write(f"  프리뷰: {entry['image_preview']}\n\n")
-                
-                # Summary data.
-                summary = self.analysis_results['summary']
-                f.write("=== 분석 요약 ===\n")
-                f.write(f"총 MSI 엔트리: {summary['total_entries']}개\n")
-                f.write(f"총 이미지 크기: {summary['total_image_size']:,} bytes\n")
-                f.write(f"파일 커버리지: {summary['file_coverage']:.1f}%\n\n")
-                
-                f.write("=== 이미지 타입별 통계 ===\n")
-                for img_type, stats in summary['image_type_stats'].items():
-                    count = stats['count']
-                    size = stats['total_size']
-                    percentage = (size / summary['total_image_size'] * 100) if summary['total_image_size'] > 0 else 0
-                    f.write(f"{img_type}: {count}개, {size:,} bytes ({percentage:.1f}%)\n")
+                f.write(''.join(parts))
             
             print(f"[SUCCESS] 분석 리포트가 저장되었습니다: {output_path}")
             return True
@@ -7,10 +7,15 @@ This repacker does not implement extraction.
 """
 
 import os
+import re
 import sys
+import mmap
 import struct
-import glob
+import fnmatch
+import shutil
 from typing import Callable, List, Dict, Any, Optional, Tuple
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from uefi_binary_tool.i18n import detect_language
@@ -26,6 +31,62 @@ if os.name == 'nt':  # Windows
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.detach())
 
 
+# b'$MsI$' signature, sector, layer, image number, reserved, little-endian image size.
+_MSI_HEADER = struct.Struct('<5sBBBBI')
+
+# Signature-less entry header: little-endian image number and image size.
+_MSI_ENTRY_HEADER = struct.Struct('<HI')
+
+# Signature plus the padding/metadata bytes that open the original layout.
+_FILE_PREAMBLE = b'$MsI$' + b'\x8E\x00'
+
+# Extracted image names: image_nr{number}_off0x{offset}.{ext}; offsets may vary in length.
+_IMAGE_NR_FILENAME_RE = re.compile(r'^image_nr(\d+)_off0x([0-9A-Fa-f]+)\.[a-zA-Z0-9]+$')
+_IMAGE_NR_RE = re.compile(r'image_nr(\d+)_')
+_IMAGE_NR_OFFSET_RE = re.compile(r'image_nr(\d+)_off0x([0-9A-Fa-f]+)')
+_OFFSET_RE = re.compile(r'_off0x([0-9A-Fa-f]+)')
+_OFFSET_EXT_RE = re.compile(r'_off0x([0-9A-Fa-f]+)\.')
+_DIGITS_RE = re.compile(r'\d+')
+
+# Chunk and output buffer size used when streaming image payloads.
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Bytes compared at each end of a large extracted image before the full chunked compare.
+_PROBE_SIZE = 64
+
+# Metadata field name -> value converter used by _parse_metadata_file.
+_METADATA_FIELDS = {
+    'offset': lambda v: int(v, 16),
+    'image_size': int,
+    'image_type': str,
+    'sector': lambda v: int(v, 16),
+    'layer': lambda v: int(v, 16),
+    'image_number': int,
+    'reserved': lambda v: int(v, 16),
+    'filename': str,
+}
+
+# Precompiled (pattern, replacement) pairs for _translate_log; the first pattern that matches wins.
+_LOG_REGEX_REPLACEMENTS = [(re.compile(pattern), replacement) for pattern, replacement in [
+    (r"원본 분석 결과 사용: (\d+)개 엔트리", r"Using original analysis results: \1 entries"),
+    (r"메타데이터에서 (\d+)개 엔트리 정보 로드됨", r"Loaded \1 metadata entries"),
+    (r"발견된 이미지 파일: (\d+)개", r"Image files found: \1"),
+    (r"원본 엔트리 수: (\d+)개", r"Original entry count: \1"),
+    (r"검증된 MSI 엔트리: (\d+)개", r"Verified MSI entries: \1"),
+    (r"  📋 총 이미지: (\d+)개", r"  📋 Total images: \1"),
+    (r"  ✅ 변경없음: (\d+)개", r"  ✅ Unchanged: \1"),
+    (r"  🔄 수정됨: (\d+)개", r"  🔄 Modified: \1"),
+    (r"  ✅ 변경없음: 이미지 #(\d+) \(([\d,]+) bytes\)", r"  ✅ Unchanged: image #\1 (\2 bytes)"),
+    (r"  🔄 수정됨: 이미지 #(\d+) \(([\d,]+) → ([\d,]+) bytes, ([+-][\d,]+) bytes\)", r"  🔄 Modified: image #\1 (\2 → \3 bytes, \4 bytes)"),
+    (r"  ✅ 변경없음: (.+) \(([\d,]+) bytes\)", r"  ✅ Unchanged: \1 (\2 bytes)"),
+    (r"  🔄 수정됨: (.+) \(([\d,]+) → ([\d,]+) bytes, ([+-][\d,]+) bytes\)", r"  🔄 Modified: \1 (\2 → \3 bytes, \4 bytes)"),
+    (r"  🆕 새 이미지: (.+) \(([\d,]+) bytes\)", r"  🆕 New image: \1 (\2 bytes)"),
+    (r"  \[WARNING\] 오프셋 범위 초과로 건너뛰기: 이미지 #(\d+)", r"  [WARNING] Skipping image #\1 because the offset range is out of bounds"),
+    (r"  \[WARNING\] 원본에서 오프셋 0x([0-9A-Fa-f]+)에 해당하는 이미지를 찾을 수 없습니다: (.+)", r"  [WARNING] Could not find an image at offset 0x\1 in the original file: \2"),
+    (r"MSI Entry #(\d+): 오프셋 0x([0-9A-Fa-f]+), 크기 ([\d,]+) bytes", r"MSI Entry #\1: offset 0x\2, size \3 bytes"),
+]]
+
+
 def localize_msi_validation_detail(detail: str, lang: Optional[str] = None) -> str:
     """Localize MSI validation details returned by the shared binary validator."""
     language = (lang or detect_language()).lower()
@@ -69,14 +130,12 @@ def localize_msi_validation_error(message: str, lang: Optional[str] = None) -> s
 
 
 def re_fullmatch_safe(pattern: str, text: str):
-    """Small local wrapper to keep regex imports scoped."""
-    import re
+    """Thin wrapper around re.fullmatch for the localization helpers."""
     return re.fullmatch(pattern, text)
 
 
 def re_sub_safe(pattern: str, replacement: str, text: str) -> str:
-    """Small local wrapper to keep regex imports scoped."""
-    import re
+    """Thin wrapper around re.sub for the localization helpers."""
     return re.sub(pattern, replacement, text)
 
 
@@ -87,53 +146,67 @@ class MSIImageRepacker:
         self,
         log: Optional[Callable[[str], None]] = None,
         lang: Optional[str] = None,
+        verbose: bool = True,
     ):
-        """Initialize instance state."""
+        """Initialize instance state; verbose=False drops the per-entry progress lines."""
         self.MSI_SIGNATURE = b'$MsI$'
         self.HEADER_SIZE = len(self.MSI_SIGNATURE) + 8
         self.log = log
         self.lang = (lang or detect_language()).lower()
+        self.verbose = verbose
+        self._log_buffer = None
         
         # Supported image file extensions.
         self.supported_extensions = ['.bin', '.jpg', '.jpeg', '.png', '.bmp', '.ico']
         
         # Store repack results.
         self.repack_results = {}
+        
+        # (name, path, size) of the .bin files per images directory, see _index_dir.
+        self._dir_index_cache = {}
+        
+        # (path, start, size) -> (mtime_ns, original stamp) of files already found unchanged.
+        self._unchanged_stats = {}
+        self._original_stamp = None
 
     def _log(self, message: str = "") -> None:
-        """Send repacker output to the configured UI logger or stdout."""
-        text = self._translate_log(str(message))
+        """Send repacker output to the configured UI logger or stdout, deferring it while batching."""
+        text = self._translate_log(str(message)) + "\n"
+        if self._log_buffer is not None:
+            self._log_buffer.append(text)
+        else:
+            self._emit_log(text)
+    
+    def _emit_log(self, text: str) -> None:
+        """Write already newline-terminated log text to the UI logger or stdout."""
         if self.log:
-            self.log(text + "\n")
+            self.log(text)
         else:
-            print(text)
+            sys.stdout.write(text)
+    
+    @contextmanager
+    def _batched_log(self):
+        """Collect log lines of a per-entry loop and emit them with a single write at the end."""
+        if self._log_buffer is not None:
+            # Already batching in an enclosing stage.
+            yield
+            return
+        self._log_buffer = []
+        try:
+            yield
+        finally:
+            text = "".join(self._log_buffer)
+            self._log_buffer = None
+            if text:
+                self._emit_log(text)
 
     def _translate_log(self, text: str) -> str:
         """Translate known MSI repacker log text for non-Korean UI sessions."""
         if self.lang.startswith("ko"):
             return text
 
-        import re
-        regex_replacements = [
-            (r"원본 분석 결과 사용: (\d+)개 엔트리", r"Using original analysis results: \1 entries"),
-            (r"메타데이터에서 (\d+)개 엔트리 정보 로드됨", r"Loaded \1 metadata entries"),
-            (r"발견된 이미지 파일: (\d+)개", r"Image files found: \1"),
-            (r"원본 엔트리 수: (\d+)개", r"Original entry count: \1"),
-            (r"검증된 MSI 엔트리: (\d+)개", r"Verified MSI entries: \1"),
-            (r"  📋 총 이미지: (\d+)개", r"  📋 Total images: \1"),
-            (r"  ✅ 변경없음: (\d+)개", r"  ✅ Unchanged: \1"),
-            (r"  🔄 수정됨: (\d+)개", r"  🔄 Modified: \1"),
-            (r"  ✅ 변경없음: 이미지 #(\d+) \(([\d,]+) bytes\)", r"  ✅ Unchanged: image #\1 (\2 bytes)"),
-            (r"  🔄 수정됨: 이미지 #(\d+) \(([\d,]+) → ([\d,]+) bytes, ([+-][\d,]+) bytes\)", r"  🔄 Modified: image #\1 (\2 → \3 bytes, \4 bytes)"),
-            (r"  ✅ 변경없음: (.+) \(([\d,]+) bytes\)", r"  ✅ Unchanged: \1 (\2 bytes)"),
-            (r"  🔄 수정됨: (.+) \(([\d,]+) → ([\d,]+) bytes, ([+-][\d,]+) bytes\)", r"  🔄 Modified: \1 (\2 → \3 bytes, \4 bytes)"),
-            (r"  🆕 새 이미지: (.+) \(([\d,]+) bytes\)", r"  🆕 New image: \1 (\2 bytes)"),
-            (r"  \[WARNING\] 오프셋 범위 초과로 건너뛰기: 이미지 #(\d+)", r"  [WARNING] Skipping image #\1 because the offset range is out of bounds"),
-            (r"  \[WARNING\] 원본에서 오프셋 0x([0-9A-Fa-f]+)에 해당하는 이미지를 찾을 수 없습니다: (.+)", r"  [WARNING] Could not find an image at offset 0x\1 in the original file: \2"),
-            (r"MSI Entry #(\d+): 오프셋 0x([0-9A-Fa-f]+), 크기 ([\d,]+) bytes", r"MSI Entry #\1: offset 0x\2, size \3 bytes"),
-        ]
-        for pattern, replacement in regex_replacements:
-            translated, count = re.subn(pattern, replacement, text)
+        for pattern, replacement in _LOG_REGEX_REPLACEMENTS:
+            translated, count = pattern.subn(replacement, text)
             if count:
                 return translated
 
@@ -245,12 +318,11 @@ class MSIImageRepacker:
                 return False
             
             # Find MSI_Pack folders for structure-preservation mode.
-            msi_pack_dirs = [d for d in os.listdir(input_dir) 
-                           if os.path.isdir(os.path.join(input_dir, d)) and d.startswith('MSI_pack')]
+            msi_pack_dirs = self._find_msi_pack_dirs(input_dir)
             
             if msi_pack_dirs:
                 # Repack in structure-preservation mode.
-                msi_pack_dir = os.path.join(input_dir, msi_pack_dirs[0])
+                msi_pack_dir = msi_pack_dirs[0]
                 self._log(f"구조 보존 모드: {msi_pack_dir} 사용")
                 
                 # Detect modified images.
@@ -315,18 +387,21 @@ class MSIImageRepacker:
                     structure_info = self._parse_metadata_file(metadata_file)
                     self._log(f"메타데이터 파일 발견: 원본 구조 정보 로드됨")
             
-            # Collect files matching the image_nr naming pattern.
+            # Collect files matching the image_nr naming pattern, with sizes from the scandir stat.
             image_files = []
-            for filename in os.listdir(msi_pack_dir):
-                if filename.startswith('image_nr') and not filename.endswith('.txt'):
+            image_sizes = {}
+            with os.scandir(msi_pack_dir) as dir_entries:
+                for dir_entry in dir_entries:
+                    filename = dir_entry.name
+                    if not filename.startswith('image_nr') or filename.endswith('.txt'):
+                        continue
                     # Validate the image_nr{number}_off0x{offset}.{ext} pattern.
                     # Allow variable-length offsets for ASUS compatibility.
-                    import re
-                    pattern = r'^image_nr(\d+)_off0x([0-9A-Fa-f]+)\.[a-zA-Z0-9]+$'
-                    if re.match(pattern, filename):
-                        file_path = os.path.join(msi_pack_dir, filename)
-                        if os.path.isfile(file_path):
-                            image_files.append((filename, file_path))
+                    if _IMAGE_NR_FILENAME_RE.match(filename):
+                        # scandir already knows the entry type, so no extra stat per file.
+                        if dir_entry.is_file():
+                            image_files.append((filename, dir_entry.path))
+                            image_sizes[dir_entry.path] = dir_entry.stat().st_size
                     else:
                         self._log(f"  [WARNING] 파일명 패턴이 올바르지 않음 (image_nr{{숫자}}_off0x{{16진수}}.{{확장자}} 형식이어야 함): {filename}")
             
@@ -340,7 +415,9 @@ class MSIImageRepacker:
                 return False
             
             # Create the MSI binary.
-            success = self._create_msi_binary_with_structure(image_files, structure_info, output_file)
+            success = self._create_msi_binary_with_structure(
+                image_files, structure_info, output_file,
+                image_sizes=[image_sizes[file_path] for _, file_path in image_files])
             
             if success:
                 self._verify_repacked_file(output_file)
@@ -395,13 +472,15 @@ class MSIImageRepacker:
             entries = analysis_results['msi_entries']
             self._log(f"원본 엔트리 수: {len(entries)}개")
             
+            # Directory contents may have changed since a previous repack.
+            self._dir_index_cache = {}
+            
             # Find MSI_Pack folders.
-            msi_pack_dirs = [d for d in os.listdir(images_dir) 
-                           if os.path.isdir(os.path.join(images_dir, d)) and d.startswith('MSI_pack')]
+            msi_pack_dirs = self._find_msi_pack_dirs(images_dir)
             
             if msi_pack_dirs:
                 # Use structure-preservation mode when MSI_Pack exists.
-                msi_pack_dir = os.path.join(images_dir, msi_pack_dirs[0])
+                msi_pack_dir = msi_pack_dirs[0]
                 self._log(f"MSI_Pack 폴더 발견: {msi_pack_dir}")
                 return self._repack_with_structure_preservation(msi_pack_dir, output_file, analysis_results)
             
@@ -448,13 +527,8 @@ class MSIImageRepacker:
     
     def _collect_image_files(self, input_dir: str, preserve_order: bool) -> List[str]:
         """Collect image files."""
-        image_files = []
-        
         # Search files with supported extensions.
-        for ext in self.supported_extensions:
-            pattern = os.path.join(input_dir, f"*{ext}")
-            files = glob.glob(pattern)
-            image_files.extend(files)
+        image_files = self._scan_image_files(input_dir)
         
         if preserve_order:
             # Sort by numeric order in file names such as msi_image_00_xxx.bin.
@@ -464,6 +538,24 @@ class MSIImageRepacker:
         
         return image_files
     
+    def _scan_image_files(self, input_dir: str) -> List[str]:
+        """List supported image files in input_dir with one scandir pass instead of one glob per extension."""
+        extensions = [os.path.normcase(ext) for ext in self.supported_extensions]
+        by_extension = [[] for _ in extensions]
+        with os.scandir(input_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                # Match glob's rules: hidden names skipped, case-insensitive on Windows only.
+                name = os.path.normcase(dir_entry.name)
+                if name.startswith('.'):
+                    continue
+                for group, ext in zip(by_extension, extensions):
+                    if name.endswith(ext):
+                        if dir_entry.is_file():
+                            group.append(dir_entry.path)
+                        break
+        # Group by extension in directory order, as the per-extension globs returned them.
+        return [path for group in by_extension for path in group]
+    
     def _extract_order_number(self, filename: str) -> int:
         """Extract an order number from a file name."""
         try:
@@ -475,10 +567,9 @@ class MSIImageRepacker:
                     return int(parts[2])
             
             # Handle other numeric patterns.
-            import re
-            numbers = re.findall(r'\d+', basename)
-            if numbers:
-                return int(numbers[0])
+            match = _DIGITS_RE.search(basename)
+            if match:
+                return int(match.group())
             
         except (ValueError, IndexError):
             pass
@@ -491,8 +582,7 @@ class MSIImageRepacker:
             # Extract number from image_nr{number}_off0x{offset}.{ext}.
             if filename.startswith('image_nr'):
                 # Extract digits after image_nr.
-                import re
-                match = re.match(r'image_nr(\d+)_', filename)
+                match = _IMAGE_NR_RE.match(filename)
                 if match:
                     return int(match.group(1))
             
@@ -504,8 +594,7 @@ class MSIImageRepacker:
         """Extract offset from file name for ASUS compatibility."""
         try:
             # Extract offset from image_nr{number}_off0x{offset}.{ext}.
-            import re
-            match = re.search(r'_off0x([0-9A-Fa-f]+)\.', filename)
+            match = _OFFSET_EXT_RE.search(filename)
             if match:
                 return int(match.group(1), 16)  # 16진수를 10진수로 변환
             
@@ -513,6 +602,14 @@ class MSIImageRepacker:
         except (ValueError, AttributeError):
             return 0
     
+    @staticmethod
+    def _find_msi_pack_dirs(root: str) -> List[str]:
+        """Return the paths of MSI_pack* folders directly under root, in directory order."""
+        with os.scandir(root) as dir_entries:
+            # is_dir() uses the type scandir already read, so no stat per entry.
+            return [dir_entry.path for dir_entry in dir_entries
+                    if dir_entry.name.startswith('MSI_pack') and dir_entry.is_dir()]
+    
     def _parse_metadata_file(self, metadata_file: str) -> Dict[str, Any]:
         """Parse the metadata file."""
         try:
@@ -536,22 +633,9 @@ class MSIImageRepacker:
                     key = key.strip().lower().replace(' ', '_')
                     value = value.strip()
                     
-                    if key == 'offset':
-                        current_entry['offset'] = int(value, 16)
-                    elif key == 'image_size':
-                        current_entry['image_size'] = int(value)
-                    elif key == 'image_type':
-                        current_entry['image_type'] = value
-                    elif key == 'sector':
-                        current_entry['sector'] = int(value, 16)
-                    elif key == 'layer':
-                        current_entry['layer'] = int(value, 16)
-                    elif key == 'image_number':
-                        current_entry['image_number'] = int(value)
-                    elif key == 'reserved':
-                        current_entry['reserved'] = int(value, 16)
-                    elif key == 'filename':
-                        current_entry['filename'] = value
+                    converter = _METADATA_FIELDS.get(key)
+                    if converter:
+                        current_entry[key] = converter(value)
             
             if current_entry:
                 structure_info['entries'].append(current_entry)
@@ -565,28 +649,26 @@ class MSIImageRepacker:
     
     def _create_msi_binary_with_structure(self, image_files: List[Tuple[str, str]], 
                                         structure_info: Optional[Dict[str, Any]], 
-                                        output_file: str) -> bool:
+                                        output_file: str,
+                                        image_sizes: Optional[List[int]] = None) -> bool:
         """Create an MSI binary using structure information."""
         try:
-            with open(output_file, 'wb') as out_f:
+            # Only the sizes are needed up front; payloads are streamed below.
+            if image_sizes is None:
+                image_sizes = [os.path.getsize(path) for path in (file_path for _, file_path in image_files)]
+            with self._batched_log(), open(output_file, 'wb', buffering=_COPY_CHUNK_SIZE) as out_f:
+                self._preallocate_output(out_f, image_sizes)
                 total_size = 0
                 
-                # Write the MSI signature once at the start.
-                msi_signature = self.MSI_SIGNATURE  # b'$MsI$'
-                out_f.write(msi_signature)
-                total_size += len(msi_signature)
-                
-                # Write padding/metadata to match the original layout.
-                padding = b'\x8E\x00'
-                out_f.write(padding)
-                total_size += len(padding)
+                # Write the MSI signature once at the start, followed by padding/metadata.
+                out_f.write(_FILE_PREAMBLE)
+                total_size += len(_FILE_PREAMBLE)
                 
                 for i, (filename, file_path) in enumerate(image_files):
-                    self._log(f"처리 중: {filename}")
+                    if self.verbose:
+                        self._log(f"처리 중: {filename}")
                     
-                    # Read image data.
-                    with open(file_path, 'rb') as img_f:
-                        image_data = img_f.read()
+                    image_size = image_sizes[i]
                     
                     # Find matching entry metadata.
                     header_info = None
@@ -596,19 +678,24 @@ class MSIImageRepacker:
                     # Create an MSI entry header without the signature.
                     if header_info:
                         # Use original structure information.
-                        entry_header = self._create_msi_entry_header(header_info.get('image_number', i + 1), len(image_data))
-                        self._log(f"  원본 구조 정보 사용: image_number={header_info.get('image_number', i + 1)}")
+                        image_number = header_info.get('image_number', i + 1)
+                        if self.verbose:
+                            self._log(f"  원본 구조 정보 사용: image_number={image_number}")
                     else:
                         # Create a default header.
-                        entry_header = self._create_msi_entry_header(i + 1, len(image_data))
-                        self._log(f"  기본 헤더 사용: image_number={i + 1}")
+                        image_number = i + 1
+                        if self.verbose:
+                            self._log(f"  기본 헤더 사용: image_number={image_number}")
+                    entry_header = self._create_msi_entry_header(image_number, image_size)
                     
                     # Write entry header and image data.
                     out_f.write(entry_header)
-                    out_f.write(image_data)
+                    self._copy_image_data(file_path, out_f)
                     
-                    total_size += len(entry_header) + len(image_data)
+                    total_size += len(entry_header) + image_size
                 
+                # Trim any preallocated tail the payloads did not fill.
+                out_f.truncate()
                 self._log(f"총 바이너리 크기: {total_size:,} bytes")
                 
                 # Store result metadata.
@@ -626,28 +713,65 @@ class MSIImageRepacker:
             self._log(f"[ERROR] 구조 보존 MSI 바이너리 생성 실패: {e}")
             return False
     
+    def _preallocate_output(self, out_f, image_sizes: List[int]) -> None:
+        """Reserve the whole output file up front so the filesystem can allocate it contiguously."""
+        if not hasattr(os, 'posix_fallocate'):
+            return
+        total_size = len(_FILE_PREAMBLE) + sum(image_sizes) + _MSI_ENTRY_HEADER.size * len(image_sizes)
+        try:
+            os.posix_fallocate(out_f.fileno(), 0, total_size)
+        except OSError:
+            # Some filesystems do not support preallocation; it is only a hint.
+            pass
+    
+    def _copy_image_data(self, image_file: str, out_f) -> None:
+        """Copy an image file into the open output; large files go kernel-side via os.sendfile."""
+        with open(image_file, 'rb') as img_f:
+            image_size = os.fstat(img_f.fileno()).st_size
+            if image_size < _COPY_CHUNK_SIZE:
+                # Small payloads join their header in the output buffer: no flush, no per-entry syscall.
+                out_f.write(img_f.read())
+                return
+            
+            offset = 0
+            if hasattr(os, 'sendfile'):
+                # Flush the buffered entry header so the kernel copy lands after it.
+                out_f.flush()
+                remaining = image_size
+                try:
+                    while remaining > 0:
+                        sent = os.sendfile(out_f.fileno(), img_f.fileno(), offset, remaining)
+                        if sent == 0:
+                            break
+                        offset += sent
+                        remaining -= sent
+                except OSError:
+                    # Platforms such as macOS only sendfile to sockets; stream the rest instead.
+                    pass
+            
+            img_f.seek(offset)
+            shutil.copyfileobj(img_f, out_f, _COPY_CHUNK_SIZE)
+    
     def _create_msi_header_from_structure(self, structure_info: Dict[str, Any], 
                                         image_size: int) -> bytes:
         """Create an MSI header from structure metadata."""
-        header = bytearray(self.HEADER_SIZE)
-        
-        sig_len = len(self.MSI_SIGNATURE)
-        header[0:sig_len] = self.MSI_SIGNATURE
-        
-        # Use metadata from structure information.
-        header[sig_len] = structure_info.get('sector', 0) & 0xFF
-        header[sig_len + 1] = structure_info.get('layer', 0) & 0xFF
-        header[sig_len + 2] = structure_info.get('image_number', 0) & 0xFF
-        header[sig_len + 3] = structure_info.get('reserved', 0) & 0xFF
-        
-        # Use the actual image size.
-        struct.pack_into('<I', header, sig_len + 4, image_size)
-        
-        return bytes(header)
+        # Use metadata from structure information and the actual image size.
+        return _MSI_HEADER.pack(
+            self.MSI_SIGNATURE,
+            structure_info.get('sector', 0) & 0xFF,
+            structure_info.get('layer', 0) & 0xFF,
+            structure_info.get('image_number', 0) & 0xFF,
+            structure_info.get('reserved', 0) & 0xFF,
+            image_size,
+        )
     
     def _find_corresponding_image(self, images_dir: str, img_index: int, 
                                 img_size: int, img_type: str) -> Optional[str]:
         """Find the image file corresponding to an analysis entry."""
+        # Only files of the expected size can match, so filter the directory index by size first.
+        candidates = [(name, path) for name, path, size in self._index_dir(images_dir)
+                      if size == img_size]
+        
         # Search using multiple file-name patterns.
         patterns = [
             f"msi_image_{img_index:02d}_*.bin",
@@ -657,53 +781,61 @@ class MSIImageRepacker:
         ]
         
         for pattern in patterns:
-            full_pattern = os.path.join(images_dir, pattern)
-            files = glob.glob(full_pattern)
-            
-            for file_path in files:
-                # Validate additionally by file size.
-                if os.path.getsize(file_path) == img_size:
-                    return file_path
+            for name, path in candidates:
+                if fnmatch.fnmatch(name, pattern):
+                    return path
         
         # Fallback to matching by size only.
-        for file_path in glob.glob(os.path.join(images_dir, "*.bin")):
-            if os.path.getsize(file_path) == img_size:
-                return file_path
+        if candidates:
+            return candidates[0][1]
         
         return None
     
+    def _index_dir(self, images_dir: str) -> List[Tuple[str, str, int]]:
+        """List (name, path, size) of the .bin files in images_dir with one scandir pass, memoized."""
+        index = self._dir_index_cache.get(images_dir)
+        if index is None:
+            index = []
+            with os.scandir(images_dir) as dir_entries:
+                for dir_entry in dir_entries:
+                    # Match glob('*.bin'), which skips hidden files.
+                    if (dir_entry.name.startswith('.') or not fnmatch.fnmatch(dir_entry.name, '*.bin')
+                            or not dir_entry.is_file()):
+                        continue
+                    index.append((dir_entry.name, dir_entry.path, dir_entry.stat().st_size))
+            self._dir_index_cache[images_dir] = index
+        return index
+    
     def _create_msi_binary(self, image_files: List[str], output_file: str) -> bool:
         """Create an MSI binary from image files."""
         try:
-            with open(output_file, 'wb') as out_f:
+            # Only the sizes are needed up front; payloads are streamed below.
+            image_sizes = [os.path.getsize(path) for path in image_files]
+            with self._batched_log(), open(output_file, 'wb', buffering=_COPY_CHUNK_SIZE) as out_f:
+                self._preallocate_output(out_f, image_sizes)
                 total_size = 0
                 
-                # Write the MSI signature once at the start.
-                msi_signature = self.MSI_SIGNATURE  # b'$MsI$'
-                out_f.write(msi_signature)
-                total_size += len(msi_signature)
-                
-                # Write padding/metadata to match the original layout.
-                padding = b'\x8E\x00'
-                out_f.write(padding)
-                total_size += len(padding)
+                # Write the MSI signature once at the start, followed by padding/metadata.
+                out_f.write(_FILE_PREAMBLE)
+                total_size += len(_FILE_PREAMBLE)
                 
                 for i, image_file in enumerate(image_files):
-                    self._log(f"처리 중: {os.path.basename(image_file)}")
+                    if self.verbose:
+                        self._log(f"처리 중: {os.path.basename(image_file)}")
                     
-                    # Read image data.
-                    with open(image_file, 'rb') as img_f:
-                        image_data = img_f.read()
+                    image_size = image_sizes[i]
                     
                     # Create image entry header without the MSI signature.
-                    entry_header = self._create_msi_entry_header(i + 1, len(image_data))
+                    entry_header = self._create_msi_entry_header(i + 1, image_size)
                     
                     # Write entry header and image data.
                     out_f.write(entry_header)
-                    out_f.write(image_data)
+                    self._copy_image_data(image_file, out_f)
                     
-                    total_size += len(entry_header) + len(image_data)
+                    total_size += len(entry_header) + image_size
                 
+                # Trim any preallocated tail the payloads did not fill.
+                out_f.truncate()
                 self._log(f"총 바이너리 크기: {total_size:,} bytes")
                 return True
                 
@@ -715,40 +847,36 @@ class MSIImageRepacker:
                                        output_file: str) -> bool:
         """Create an MSI binary from mapping information."""
         try:
-            with open(output_file, 'wb') as out_f:
+            # Only the sizes are needed up front; payloads are streamed below.
+            image_sizes = [os.path.getsize(path) for path in (mapping['image_file'] for mapping in mappings)]
+            with self._batched_log(), open(output_file, 'wb', buffering=_COPY_CHUNK_SIZE) as out_f:
+                self._preallocate_output(out_f, image_sizes)
                 total_size = 0
                 
-                # Write the MSI signature once at the start.
-                msi_signature = self.MSI_SIGNATURE  # b'$MsI$'
-                out_f.write(msi_signature)
-                total_size += len(msi_signature)
-                
-                # Write padding/metadata to match the original layout.
-                padding = b'\x8E\x00'
-                out_f.write(padding)
-                total_size += len(padding)
+                # Write the MSI signature once at the start, followed by padding/metadata.
+                out_f.write(_FILE_PREAMBLE)
+                total_size += len(_FILE_PREAMBLE)
                 
-                for mapping in mappings:
+                for mapping, image_size in zip(mappings, image_sizes):
                     original_entry = mapping['original_entry']
                     image_file = mapping['image_file']
                     
-                    self._log(f"처리 중: Entry #{original_entry['index']} -> {os.path.basename(image_file)}")
-                    
-                    # Read image data.
-                    with open(image_file, 'rb') as img_f:
-                        image_data = img_f.read()
+                    if self.verbose:
+                        self._log(f"처리 중: Entry #{original_entry['index']} -> {os.path.basename(image_file)}")
                     
                     # Create an MSI entry header without the signature.
                     entry_header = self._create_msi_entry_header(
-                        original_entry['index'], len(image_data)
+                        original_entry['index'], image_size
                     )
                     
                     # Write entry header and image data.
                     out_f.write(entry_header)
-                    out_f.write(image_data)
+                    self._copy_image_data(image_file, out_f)
                     
-                    total_size += len(entry_header) + len(image_data)
+                    total_size += len(entry_header) + image_size
                 
+                # Trim any preallocated tail the payloads did not fill.
+                out_f.truncate()
                 self._log(f"총 바이너리 크기: {total_size:,} bytes")
                 
                 # Store result metadata.
@@ -767,55 +895,28 @@ class MSIImageRepacker:
     
     def _create_msi_header(self, image_number: int, image_size: int) -> bytes:
         """Create an MSI header for full-entry layout; currently unused."""
-        header = bytearray(self.HEADER_SIZE)
-        
-        sig_len = len(self.MSI_SIGNATURE)
-        header[0:sig_len] = self.MSI_SIGNATURE
-        
-        # Metadata fields.
-        header[sig_len] = 0x00  # Sector/Layer
-        header[sig_len + 1] = 0x00  # Position
-        header[sig_len + 2] = image_number & 0xFF  # Image number
-        header[sig_len + 3] = 0x00  # Reserved
-        
-        # Image size in little-endian format.
-        struct.pack_into('<I', header, sig_len + 4, image_size)
-        
-        return bytes(header)
+        # Sector/Layer, Position and Reserved stay zero.
+        return _MSI_HEADER.pack(self.MSI_SIGNATURE, 0x00, 0x00, image_number & 0xFF, 0x00, image_size)
     
     def _create_msi_entry_header(self, image_number: int, image_size: int) -> bytes:
         """Create an MSI entry header without the signature."""
         # Layout expected by imageext.py:
         # - Image number, 2 bytes, little-endian.
         # - Image size, 4 bytes, little-endian.
-        entry_header = bytearray(6)
-        
-        # Image number, 2 bytes, little-endian.
-        struct.pack_into('<H', entry_header, 0, image_number)
-        
-        # Image size, 4 bytes, little-endian.  
-        struct.pack_into('<I', entry_header, 2, image_size)
-        
-        return bytes(entry_header)
+        return _MSI_ENTRY_HEADER.pack(image_number, image_size)
     
     def _create_msi_header_from_original(self, original_header: Dict[str, Any], 
                                        new_size: int) -> bytes:
         """Create an MSI header from original header metadata."""
-        header = bytearray(self.HEADER_SIZE)
-        
-        sig_len = len(self.MSI_SIGNATURE)
-        header[0:sig_len] = self.MSI_SIGNATURE
-        
-        # Preserve original metadata.
-        header[sig_len] = original_header.get('sector', 0)
-        header[sig_len + 1] = original_header.get('layer', 0)
-        header[sig_len + 2] = original_header.get('image_number', 0)
-        header[sig_len + 3] = original_header.get('reserved', 0)
-        
-        # Use the new image size.
-        struct.pack_into('<I', header, sig_len + 4, new_size)
-        
-        return bytes(header)
+        # Preserve original metadata and use the new image size.
+        return _MSI_HEADER.pack(
+            self.MSI_SIGNATURE,
+            original_header.get('sector', 0),
+            original_header.get('layer', 0),
+            original_header.get('image_number', 0),
+            original_header.get('reserved', 0),
+            new_size,
+        )
     
     def _verify_repacked_file(self, output_file: str) -> None:
         """Verify the repacked file."""
@@ -832,30 +933,65 @@ class MSIImageRepacker:
             msi_count = 0
             offset = 0
             
-            while offset < len(data) - self.HEADER_SIZE:
-                if data[offset:offset+len(self.MSI_SIGNATURE)] == self.MSI_SIGNATURE:
-                    # Parse the header.
-                    size_offset = offset + len(self.MSI_SIGNATURE) + 4
-                    image_size = struct.unpack('<I', data[size_offset:size_offset+4])[0]
-                    self._log(f"MSI Entry #{msi_count}: 오프셋 0x{offset:08X}, 크기 {image_size:,} bytes")
+            # Bind per-iteration lookups to locals once, outside the loop.
+            header_size = self.HEADER_SIZE
+            signature = self.MSI_SIGNATURE
+            scan_limit = file_size - header_size
+            data_startswith = data.startswith
+            data_find = data.find
+            unpack_header = _MSI_HEADER.unpack_from
+            log = self._log
+            verbose = self.verbose
+            
+            while offset < scan_limit:
+                if data_startswith(signature, offset):
+                    # Parse the header in one call, without slicing copies.
+                    image_size = unpack_header(data, offset)[5]
+                    if verbose:
+                        log(f"MSI Entry #{msi_count}: 오프셋 0x{offset:08X}, 크기 {image_size:,} bytes")
                     
                     msi_count += 1
-                    offset += self.HEADER_SIZE + image_size
+                    offset += header_size + image_size
                 else:
-                    offset += 1
+                    # Resync on the next signature with the C-level find() instead of stepping bytewise.
+                    offset = data_find(signature, offset + 1)
+                    if offset < 0:
+                        break
             
             self._log(f"검증된 MSI 엔트리: {msi_count}개")
             
         except Exception as e:
             self._log(f"[WARNING] 검증 중 오류 발생: {e}")
     
+    def _copy_file(self, src_path: str, dst_path: str) -> None:
+        """Copy a whole file without a user-space buffer, via copy_file_range where available."""
+        # Opening dst for writing would truncate src when both are the same file; fail like shutil does.
+        if os.path.exists(dst_path) and os.path.samefile(src_path, dst_path):
+            raise shutil.SameFileError(f"{src_path!r} and {dst_path!r} are the same file")
+        if hasattr(os, 'copy_file_range'):
+            with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                try:
+                    # copy_file_range lets btrfs/XFS share extents (reflink) instead of copying data.
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    if remaining == 0:
+                        return
+                except OSError:
+                    # Cross-device or unsupported filesystem; fall back to shutil below.
+                    pass
+        # shutil.copyfile uses sendfile/fcopyfile where the platform provides them.
+        shutil.copyfile(src_path, dst_path)
+    
     def create_backup(self, original_file: str, backup_suffix: str = "_backup") -> str:
         """Create a backup of the original file."""
         try:
             backup_file = f"{original_file}{backup_suffix}"
             
-            with open(original_file, 'rb') as src, open(backup_file, 'wb') as dst:
-                dst.write(src.read())
+            self._copy_file(original_file, backup_file)
             
             self._log(f"[SUCCESS] 백업 생성됨: {backup_file}")
             return backup_file
@@ -897,69 +1033,58 @@ class MSIImageRepacker:
             self._log("[WARNING] 원본 분석 결과가 없어 변경 감지를 수행할 수 없습니다.")
             return {}
         
-        # Load the original file.
+        # Map the original file read-only; entries are sliced out one at a time.
         try:
-            with open(original_file, 'rb') as f:
-                original_data = f.read()
+            original_data = self._map_original_file(original_file)
         except Exception as e:
             self._log(f"[ERROR] 원본 파일을 읽을 수 없습니다: {e}")
             return {}
         
-        for entry in original_analysis['msi_entries']:
-            entry_index = entry['index']
-            abs_offset = entry['offset']
-            original_size = entry['image_data_size']
-            
-            # Extract the original image data.
-            start_offset = abs_offset
-            end_offset = start_offset + original_size
-            if end_offset > len(original_data):
-                self._log(f"  [WARNING] 오프셋 범위 초과로 건너뛰기: 이미지 #{entry_index}")
-                continue
-                
-            original_image_data = original_data[start_offset:end_offset]
-            
-            # Find the extracted file.
-            filename = f"image_nr{entry_index}_off0x{abs_offset:X}"
-            image_type = entry.get('image_type', 'bin')
-            filepath = os.path.join(msi_pack_dir, f"{filename}.{image_type}")
-            
-            # Try alternate extensions.
-            if not os.path.exists(filepath):
-                for ext in self.supported_extensions:
-                    test_path = os.path.join(msi_pack_dir, f"{filename}{ext}")
-                    if os.path.exists(test_path):
-                        filepath = test_path
-                        break
-            
-            if os.path.exists(filepath):
-                try:
-                    with open(filepath, 'rb') as f:
-                        extracted_data = f.read()
-                    
-                    # Compare original and extracted data.
-                    if extracted_data == original_image_data:
-                        unchanged_count += 1
-                        self._log(f"  ✅ 변경없음: 이미지 #{entry_index} ({len(extracted_data)} bytes)")
-                    else:
-                        modified_count += 1
-                        modified_images[entry_index] = {
-                            'original_entry': entry,
-                            'new_data': extracted_data,
-                            'new_size': len(extracted_data),
-                            'size_diff': len(extracted_data) - original_size,
-                            'filepath': filepath
-                        }
-                        self._log(f"  🔄 수정됨: 이미지 #{entry_index} "
-                              f"({original_size} → {len(extracted_data)} bytes, "
-                              f"{len(extracted_data) - original_size:+} bytes)")
-                              
-                except Exception as e:
-                    self._log(f"  [ERROR] 파일 읽기 실패: {filepath} - {e}")
+        entries = original_analysis['msi_entries']
+        try:
+            # Entries are independent and I/O-bound; compare them in threads sharing the mapping.
+            workers = min(32, (os.cpu_count() or 1) * 4, max(len(entries), 1))
+            # Submit in original-offset order so reads of the mapping run front to back.
+            order = sorted(range(len(entries)), key=lambda i: entries[i]['offset'])
+            outcomes = [None] * len(entries)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    lambda i: self._compare_extracted_entry(msi_pack_dir, entries[i], original_data), order)
+                for i, outcome in zip(order, results):
+                    outcomes[i] = outcome
+        finally:
+            self._close_original_data(original_data)
+        
+        with self._batched_log():
+            # Log and tally in entry order, as the sequential scan did.
+            for entry, (status, filepath, detail) in zip(entries, outcomes):
+                entry_index = entry['index']
+                original_size = entry['image_data_size']
+                if status == 'out_of_range':
+                    self._log(f"  [WARNING] 오프셋 범위 초과로 건너뛰기: 이미지 #{entry_index}")
+                elif status == 'unchanged':
+                    unchanged_count += 1
+                    if self.verbose:
+                        self._log(f"  ✅ 변경없음: 이미지 #{entry_index} ({original_size} bytes)")
+                elif status == 'modified':
+                    # detail is the extracted file size.
+                    modified_count += 1
+                    modified_images[entry_index] = {
+                        'original_entry': entry,
+                        'new_size': detail,
+                        'size_diff': detail - original_size,
+                        'filepath': filepath
+                    }
+                    self._log(f"  🔄 수정됨: 이미지 #{entry_index} "
+                          f"({original_size} → {detail} bytes, "
+                          f"{detail - original_size:+} bytes)")
+                elif status == 'error':
+                    # detail carries the exception for failed reads.
+                    self._log(f"  [ERROR] 파일 읽기 실패: {filepath} - {detail}")
+                    unchanged_count += 1
+                else:
+                    self._log(f"  [WARNING] 추출된 파일을 찾을 수 없습니다: {filepath}")
                     unchanged_count += 1
-            else:
-                self._log(f"  [WARNING] 추출된 파일을 찾을 수 없습니다: {filename}")
-                unchanged_count += 1
         
         self._log(f"\n변경 요약:")
         self._log(f"  📋 총 이미지: {unchanged_count + modified_count}개")
@@ -968,6 +1093,46 @@ class MSIImageRepacker:
         
         return modified_images
     
+    def _compare_extracted_entry(self, msi_pack_dir: str, entry: Dict[str, Any],
+                                 original_data: bytes) -> Tuple[str, str, Any]:
+        """Classify one entry's extracted file against the original; safe to run in worker threads.
+
+        Returns (status, filepath, detail) where status is 'out_of_range', 'missing'
+        (filepath is the expected base name), 'unchanged', 'modified' (detail is the
+        extracted file size) or 'error' (detail is the exception).
+        """
+        entry_index = entry['index']
+        start_offset = entry['offset']
+        original_size = entry['image_data_size']
+        
+        # Check the original image range.
+        if start_offset + original_size > len(original_data):
+            return 'out_of_range', '', None
+        
+        # Find the extracted file.
+        filename = f"image_nr{entry_index}_off0x{start_offset:X}"
+        image_type = entry.get('image_type', 'bin')
+        filepath = os.path.join(msi_pack_dir, f"{filename}.{image_type}")
+        
+        # Try alternate extensions.
+        if not os.path.exists(filepath):
+            for ext in self.supported_extensions:
+                test_path = os.path.join(msi_pack_dir, f"{filename}{ext}")
+                if os.path.exists(test_path):
+                    filepath = test_path
+                    break
+        
+        if not os.path.exists(filepath):
+            return 'missing', filename, None
+        
+        try:
+            # Compare in chunks; repacking reads images from disk, so modified files are only sized.
+            if self._file_matches_original(filepath, original_data, start_offset, original_size):
+                return 'unchanged', filepath, None
+            return 'modified', filepath, os.path.getsize(filepath)
+        except Exception as e:
+            return 'error', filepath, e
+    
     def _detect_modified_images_simple(self, input_dir: str, original_file: str, 
                                      original_analysis: Dict[str, Any] = None) -> Dict[str, Any]:
         """Detect modified images in simple mode by comparing with the original."""
@@ -976,94 +1141,103 @@ class MSIImageRepacker:
         unchanged_count = 0
         modified_count = 0
         
-        # Load the original file.
+        # Map the original file read-only; entries are sliced out one at a time.
         try:
-            with open(original_file, 'rb') as f:
-                original_data = f.read()
+            original_data = self._map_original_file(original_file)
         except Exception as e:
             self._log(f"[ERROR] 원본 파일을 읽을 수 없습니다: {e}")
             return {}
         
-        # Collect extracted image files.
-        image_files = []
-        for ext in self.supported_extensions:
-            pattern = os.path.join(input_dir, f"*{ext}")
-            image_files.extend(glob.glob(pattern))
+        try:
+            # Collect extracted image files.
+            image_files = self._scan_image_files(input_dir)
         
-        if not image_files:
-            self._log("[WARNING] 추출된 이미지 파일을 찾을 수 없습니다.")
-            return {}
+            if not image_files:
+                self._log("[WARNING] 추출된 이미지 파일을 찾을 수 없습니다.")
+                return {}
         
-        # Compare by extracting offset information from file names.
-        for filepath in sorted(image_files):
-            filename = os.path.basename(filepath)
-            
-            # Extract offset from file name, for example image_nr81_off0x647A.png -> 0x647A.
-            import re
-            match = re.search(r'_off0x([0-9A-Fa-f]+)', filename)
-            if not match:
-                self._log(f"  [WARNING] 오프셋 정보를 찾을 수 없는 파일명: {filename}")
-                continue
+            # Parse offset and image number from each file name once; unparsable names become warnings.
+            candidates = []
+            warnings = []
+            for filepath in image_files:
+                filename = os.path.basename(filepath)
                 
-            offset_str = match.group(1)
-            try:
-                offset = int(offset_str, 16)
-            except ValueError:
-                self._log(f"  [WARNING] 잘못된 오프셋 형식: {offset_str}")
-                continue
+                # Extractor-style names yield both fields from one search: image_nr81_off0x647A.png -> (81, 0x647A).
+                combined = _IMAGE_NR_OFFSET_RE.search(filename)
+                if combined:
+                    candidates.append((int(combined.group(2), 16), int(combined.group(1)), filepath, filename))
+                    continue
             
-            # Extract image number, for example image_nr81_off0x647A.png -> 81.
-            nr_match = re.search(r'image_nr(\d+)_', filename)
-            if not nr_match:
-                self._log(f"  [WARNING] 이미지 번호를 찾을 수 없는 파일명: {filename}")
-                continue
+                # Extract offset from file name, for example image_nr81_off0x647A.png -> 0x647A.
+                match = _OFFSET_RE.search(filename)
+                if not match:
+                    warnings.append((filename, f"  [WARNING] 오프셋 정보를 찾을 수 없는 파일명: {filename}"))
+                    continue
                 
-            image_nr = int(nr_match.group(1))
+                offset_str = match.group(1)
+                try:
+                    offset = int(offset_str, 16)
+                except ValueError:
+                    warnings.append((filename, f"  [WARNING] 잘못된 오프셋 형식: {offset_str}"))
+                    continue
             
-            try:
-                # Read the extracted file.
-                with open(filepath, 'rb') as f:
-                    extracted_data = f.read()
-                
-                # Find data at the matching offset in the original.
-                original_image_data = self._find_original_image_at_offset(original_data, offset, len(extracted_data))
+                # Extract image number, for example image_nr81_off0x647A.png -> 81.
+                nr_match = _IMAGE_NR_RE.search(filename)
+                if not nr_match:
+                    warnings.append((filename, f"  [WARNING] 이미지 번호를 찾을 수 없는 파일명: {filename}"))
+                    continue
                 
-                if original_image_data is None:
+                candidates.append((offset, int(nr_match.group(1)), filepath, filename))
+            
+            # Order by the parsed offset (integer compares) so the mapping is read front to back.
+            candidates.sort()
+            warnings.sort()
+            
+            # Files are independent and I/O-bound; compare them in threads sharing the mapping.
+            workers = min(32, (os.cpu_count() or 1) * 4, max(len(candidates), 1))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(
+                    lambda item: self._compare_extracted_file(item[2], item[0], original_data), candidates))
+        finally:
+            self._close_original_data(original_data)
+        
+        with self._batched_log():
+            # Name warnings first, then results in offset order.
+            for _, message in warnings:
+                self._log(message)
+            for (offset, image_nr, filepath, filename), (status, original_size, detail) in zip(candidates, outcomes):
+                if status == 'new':
                     self._log(f"  [WARNING] 원본에서 오프셋 0x{offset:X}에 해당하는 이미지를 찾을 수 없습니다: {filename}")
-                    # Treat as a new image.
+                    # Treat as a new image; detail is the extracted file size.
                     modified_count += 1
                     modified_images[image_nr] = {
                         'filepath': filepath,
-                        'new_data': extracted_data,
-                        'new_size': len(extracted_data),
+                        'new_size': detail,
                         'offset': offset,
                         'is_new': True
                     }
-                    self._log(f"  🆕 새 이미지: {filename} ({len(extracted_data)} bytes)")
-                    continue
-                
-                # Compare with the original data.
-                if extracted_data == original_image_data:
+                    self._log(f"  🆕 새 이미지: {filename} ({detail} bytes)")
+                elif status == 'unchanged':
                     unchanged_count += 1
-                    self._log(f"  ✅ 변경없음: {filename} ({len(extracted_data)} bytes)")
-                else:
+                    if self.verbose:
+                        self._log(f"  ✅ 변경없음: {filename} ({original_size} bytes)")
+                elif status == 'modified':
                     modified_count += 1
                     modified_images[image_nr] = {
                         'filepath': filepath,
-                        'new_data': extracted_data,
-                        'new_size': len(extracted_data),
-                        'original_size': len(original_image_data),
-                        'size_diff': len(extracted_data) - len(original_image_data),
+                        'new_size': detail,
+                        'original_size': original_size,
+                        'size_diff': detail - original_size,
                         'offset': offset,
                         'is_new': False
                     }
                     self._log(f"  🔄 수정됨: {filename} "
-                          f"({len(original_image_data)} → {len(extracted_data)} bytes, "
-                          f"{len(extracted_data) - len(original_image_data):+} bytes)")
-                          
-            except Exception as e:
-                self._log(f"  [ERROR] 파일 처리 중 오류: {filename} - {e}")
-                unchanged_count += 1
+                          f"({original_size} → {detail} bytes, "
+                          f"{detail - original_size:+} bytes)")
+                else:
+                    # detail carries the exception for failed reads.
+                    self._log(f"  [ERROR] 파일 처리 중 오류: {filename} - {detail}")
+                    unchanged_count += 1
         
         self._log(f"\n변경 요약:")
         self._log(f"  📋 총 이미지: {unchanged_count + modified_count}개")
@@ -1072,31 +1246,95 @@ class MSIImageRepacker:
         
         return modified_images
     
-    def _find_original_image_at_offset(self, original_data: bytes, offset: int, expected_size: int) -> bytes:
-        """Find image data at the given offset in the original data."""
-        if offset >= len(original_data):
-            return None
+    def _compare_extracted_file(self, filepath: str, offset: int,
+                                original_data: bytes) -> Tuple[str, int, Any]:
+        """Classify one simple-mode extracted file against the original; safe to run in worker threads.
+
+        Returns (status, original_size, detail) where status is 'new' (offset lies
+        past the original), 'unchanged', 'modified' or 'error' (detail is the
+        exception); for 'new' and 'modified' detail is the extracted file size.
+        """
+        try:
+            extracted_size = os.path.getsize(filepath)
+            if offset >= len(original_data):
+                return 'new', 0, extracted_size
+            
+            # The original span is the extracted size, cut short at the end of the original.
+            original_size = min(extracted_size, len(original_data) - offset)
             
-        # Try extracting the exact expected size.
-        if offset + expected_size <= len(original_data):
-            return original_data[offset:offset + expected_size]
+            # Compare in chunks; repacking reads images from disk, so modified files are only sized.
+            if self._file_matches_original(filepath, original_data, offset, original_size):
+                return 'unchanged', original_size, None
+            return 'modified', original_size, extracted_size
+        except Exception as e:
+            return 'error', 0, e
+    
+    def _map_original_file(self, original_file: str):
+        """Memory-map the original file read-only; empty files cannot be mapped."""
+        with open(original_file, 'rb') as f:
+            st = os.fstat(f.fileno())
+            # Identifies this version of the original for _file_matches_original's stat shortcut.
+            self._original_stamp = (os.path.realpath(original_file), st.st_size, st.st_mtime_ns)
+            if st.st_size == 0:
+                return b''
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def _close_original_data(self, original_data) -> None:
+        """Release a mapping returned by _map_original_file."""
+        self._original_stamp = None
+        if isinstance(original_data, mmap.mmap):
+            original_data.close()
+    
+    def _file_matches_original(self, filepath: str, original_data: bytes, start: int, size: int) -> bool:
+        """Check a file against original_data[start:start + size], stopping at the first differing chunk."""
+        st = os.stat(filepath)
+        if st.st_size != size:
+            return False
+        
+        # A file already matched against this same original and not touched since is still unchanged.
+        cache_key = (filepath, start, size)
+        stamp = (st.st_mtime_ns, self._original_stamp)
+        if self._original_stamp is not None and self._unchanged_stats.get(cache_key) == stamp:
+            return True
         
-        # Return data through the end of file.
-        return original_data[offset:]
+        # Read into one reusable buffer; bytearray/bytes equality is a C-level memcmp.
+        buffer = bytearray(min(size, _COPY_CHUNK_SIZE))
+        position = start
+        with open(filepath, 'rb') as f:
+            if size > _COPY_CHUNK_SIZE:
+                # Edited images usually differ in the header or the trailing chunks; probe both ends
+                # before streaming megabytes through the full compare.
+                if f.read(_PROBE_SIZE) != original_data[start:start + _PROBE_SIZE]:
+                    return False
+                f.seek(size - _PROBE_SIZE)
+                if f.read(_PROBE_SIZE) != original_data[start + size - _PROBE_SIZE:start + size]:
+                    return False
+                f.seek(0)
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                chunk = buffer if read == len(buffer) else buffer[:read]
+                if chunk != original_data[position:position + read]:
+                    return False
+                position += read
+        if position != start + size:
+            return False
+        if self._original_stamp is not None:
+            self._unchanged_stats[cache_key] = stamp
+        return True
     
     def _copy_original_file(self, original_file: str, output_file: str) -> bool:
         """Copy the original file to the output path."""
         try:
-            import shutil
-            shutil.copy2(original_file, output_file)
+            self._copy_file(original_file, output_file)
+            # Keep the timestamps and mode that shutil.copy2 used to carry over.
+            shutil.copystat(original_file, output_file)
             self._log(f"✅ 원본 파일 복사 완료: {output_file}")
             return True
         except Exception as e:
             self._log(f"[ERROR] 원본 파일 복사 실패: {e}")
             return False
-        except Exception as e:
-            self._log(f"[ERROR] 리포트 저장 실패: {e}")
-            return False
 
 
 if __name__ == "__main__":
@@ -9,11 +9,10 @@ repackages images. Extraction is intentionally out of scope.
 
 import os
 import sys
-import argparse
 from typing import Optional
 
-# Enable UTF-8 console output on Windows.
-if os.name == 'nt':  # Windows
+# Enable UTF-8 console output on Windows, unless the console already uses it (UTF-8 mode, Windows Terminal).
+if os.name == 'nt' and (getattr(sys.stdout, 'encoding', '') or '').lower().replace('-', '') != 'utf8':
     import locale
     try:
         # Configure Windows console encoding.
@@ -32,18 +31,18 @@ try:
 except ImportError:
     print("[WARNING] 공통 모듈을 찾을 수 없습니다. 기본 기능만 사용합니다.")
 
-# Import MSI modules.
-from msi.analyzer.msi_analyzer import MSIFileAnalyzer
-from msi.repacker.msi_repacker import MSIImageRepacker
-
 
 class MSIMainController:
     """Main controller for MSI tool workflows."""
     
-    def __init__(self):
-        """Initialize instance state."""
+    def __init__(self, verbose: bool = True):
+        """Initialize instance state; verbose=False drops the repacker's per-entry progress lines."""
+        # Import MSI modules here so --help and --version do not load the analyzer/repacker stack.
+        from msi.analyzer.msi_analyzer import MSIFileAnalyzer
+        from msi.repacker.msi_repacker import MSIImageRepacker
+        
         self.analyzer = MSIFileAnalyzer()
-        self.repacker = MSIImageRepacker()
+        self.repacker = MSIImageRepacker(verbose=verbose)
         
     def run_interactive(self):
         """Run interactive mode."""
@@ -157,9 +156,14 @@ class MSIMainController:
     
     def run_full_process(self, file_path: str):
         """Integrated drag-and-drop workflow: analyze and repack."""
+        # Split the path once; the pieces are reused for every output name below.
+        file_name = os.path.basename(file_path)
+        base_name = os.path.splitext(file_name)[0]
+        current_dir = os.path.dirname(file_path) or os.getcwd()
+        
         print(f"[FULL PROCESS] MSI BIOS 파일 통합 처리")
         print("=" * 60)
-        print(f"처리할 파일: {os.path.basename(file_path)}")
+        print(f"처리할 파일: {file_name}")
         print("주의: 추출된 이미지 폴더(msi_extracted)가 미리 존재해야 합니다.")
         print()
         
@@ -178,13 +182,14 @@ class MSIMainController:
             
             # Step 2: locate an existing extracted folder.
             print("\n� 2단계: 추출된 이미지 폴더 확인 중...")
-            current_dir = os.path.dirname(file_path) if os.path.dirname(file_path) else os.getcwd()
             default_extract_dir = os.path.join(current_dir, "msi_extracted")
             
             # Check whether the default path contains an MSI_Pack folder.
             if os.path.exists(default_extract_dir):
-                msi_pack_folders = [d for d in os.listdir(default_extract_dir) 
-                                  if os.path.isdir(os.path.join(default_extract_dir, d)) and d.startswith("MSI_pack_")]
+                with os.scandir(default_extract_dir) as dir_entries:
+                    # is_dir() uses the type scandir already read, so no stat per entry.
+                    msi_pack_folders = [e.name for e in dir_entries
+                                        if e.name.startswith("MSI_pack_") and e.is_dir()]
                 if msi_pack_folders:
                     extract_dir = default_extract_dir
                     print(f"기존 추출 폴더를 발견했습니다: {extract_dir}")
@@ -201,7 +206,6 @@ class MSIMainController:
             print("\n📦 3단계: 원본 구조 유지 리패킹 중...")
             
             # Build the repacked output file name.
-            base_name = os.path.splitext(os.path.basename(file_path))[0]
             repacked_file = os.path.join(current_dir, f"{base_name}_msi_repacked.bin")
             
             # Run structure-preserving repack using original analysis data.
@@ -276,11 +280,12 @@ class MSIMainController:
             print(f"[ERROR] 경로를 찾을 수 없습니다: {input_path}")
             return
         
-        # Resolve the output file name.
+        # Resolve the output file name; the stem is reused for the report path.
         if os.path.isdir(input_path):
-            output_file = f"{input_path}_msi_repacked.bin"
+            output_stem = f"{input_path}_msi_repacked"
         else:
-            output_file = f"{os.path.splitext(input_path)[0]}_msi_repacked.bin"
+            output_stem = f"{os.path.splitext(input_path)[0]}_msi_repacked"
+        output_file = f"{output_stem}.bin"
         
         # Repack from a directory.
         # Find the original file for change detection.
@@ -306,7 +311,7 @@ class MSIMainController:
             print(f"\n[SUCCESS] 리패킹 완료: {output_file}")
             
             # Save the report.
-            report_path = f"{os.path.splitext(output_file)[0]}_repack_report.txt"
+            report_path = f"{output_stem}_repack_report.txt"
             self.repacker.export_repack_report(report_path)
     
     def _find_original_file(self, input_path: str) -> str:
@@ -321,29 +326,56 @@ class MSIMainController:
             
         if os.path.basename(input_path) == 'msi_extracted':
             if os.path.exists(parent_dir):
-                for file in os.listdir(parent_dir):
-                    if file.endswith('.bin') and not file.endswith('_repacked.bin'):
-                        original_file = os.path.join(parent_dir, file)
-                        if os.path.isfile(original_file):
-                            return original_file
+                original_file = self._find_original_bin(parent_dir)
+                if original_file:
+                    return original_file
         
         # If MSI_pack folders exist, look for the original in the parent directory.
         try:
-            if any(d.startswith('MSI_pack') for d in os.listdir(input_path) if os.path.isdir(os.path.join(input_path, d))):
+            with os.scandir(input_path) as dir_entries:
+                has_msi_pack = any(e.name.startswith('MSI_pack') and e.is_dir() for e in dir_entries)
+            if has_msi_pack:
                 if os.path.exists(parent_dir):
-                    for file in os.listdir(parent_dir):
-                        if file.endswith('.bin') and not file.endswith('_repacked.bin'):
-                            original_file = os.path.join(parent_dir, file)
-                            if os.path.isfile(original_file):
-                                return original_file
+                    return self._find_original_bin(parent_dir)
         except:
             pass
         
         return None
+    
+    def _find_original_bin(self, directory: str) -> Optional[str]:
+        """Return the first non-repacked .bin file in directory, using scandir's cached entry type."""
+        with os.scandir(directory) as dir_entries:
+            for e in dir_entries:
+                if e.name.endswith('.bin') and not e.name.endswith('_repacked.bin') and e.is_file():
+                    return e.path
+        return None
 
 
 def main():
     """Program entry point."""
+    # Support drag-and-drop invocation.
+    if len(sys.argv) == 2 and os.path.exists(sys.argv[1]):
+        # A file was passed by drag and drop.
+        file_path = sys.argv[1]
+        print(f"드래그된 파일 감지: {file_path}")
+        
+        # Drag-and-drop runs only need the outcome; skip the per-entry repack progress lines.
+        controller = MSIMainController(verbose=False)
+        
+        # Choose mode automatically from file extension.
+        if file_path.lower().endswith('.bin'):
+            print("MSI BIOS 파일로 판단하여 통합 처리를 시작합니다...")
+            controller.run_full_process(file_path)
+        else:
+            print("알 수 없는 파일 형식입니다. 분석 모드로 시작합니다.")
+            controller.run_analyze(file_path)
+        
+        input("\n계속하려면 Enter 키를 누르세요...")
+        return
+    
+    # argparse is only needed past the drag-and-drop path.
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="MSI BIOS Section Binary 분석/리패킹 도구",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -374,25 +406,6 @@ Usage examples:
         version='MSI BIOS 도구 v1.0.0'
     )
     
-    # Support drag-and-drop invocation.
-    if len(sys.argv) == 2 and os.path.exists(sys.argv[1]):
-        # A file was passed by drag and drop.
-        file_path = sys.argv[1]
-        print(f"드래그된 파일 감지: {file_path}")
-        
-        controller = MSIMainController()
-        
-        # Choose mode automatically from file extension.
-        if file_path.lower().endswith('.bin'):
-            print("MSI BIOS 파일로 판단하여 통합 처리를 시작합니다...")
-            controller.run_full_process(file_path)
-        else:
-            print("알 수 없는 파일 형식입니다. 분석 모드로 시작합니다.")
-            controller.run_analyze(file_path)
-        
-        input("\n계속하려면 Enter 키를 누르세요...")
-        return
-    
     args = parser.parse_args()
     controller = MSIMainController()
     
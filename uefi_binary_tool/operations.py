@@ -119,18 +119,20 @@ def analyze_asus(file_path: str) -> OperationResult:
         print(f"[VALID] {detail}")
 
     analyzer = AsusFileAnalyzer(file_path)
-    analyzer.run_full_analysis()
+    data: Dict[str, Any] = {}
+    try:
+        analyzer.run_full_analysis()
+        try:
+            data = analyzer.collect_analysis_data()
+        except Exception as exc:
+            print(t("gui_summary_failed", error=exc))
+    finally:
+        analyzer.close()
 
     base = os.path.splitext(file_path)[0]
     outputs = [f"{base}_analysis.txt", f"{base}_analysis.md"]
     outputs = [path for path in outputs if os.path.exists(path)]
 
-    data: Dict[str, Any] = {}
-    try:
-        data = analyzer.collect_analysis_data()
-    except Exception as exc:
-        print(t("gui_summary_failed", error=exc))
-
     return OperationResult(
         success=True,
         message=t("asus_analyze_done"),